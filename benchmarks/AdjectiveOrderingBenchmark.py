@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+import gc
+import os
+import sys
+import time
+from   copy import deepcopy
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+ADJECTIVES = ['red', 'big', 'old', 'blue', 'small', 'round', 'green', 'heavy']
+
+
+# The deepcopy and bubble sort used before sortNPPreModifiers worked out the
+# positions of each modifier once
+def sortNPPreModifiersOld(originalModifiers):
+    if originalModifiers is None or len(originalModifiers)<=1:
+        return originalModifiers
+    orderedModifiers = deepcopy(originalModifiers)
+    changesMade = True
+    while changesMade:
+        changesMade = False
+        for i in range(len(orderedModifiers)-1):
+            if NounPhraseHelper.getMinPos(orderedModifiers[i]) > NounPhraseHelper.getMaxPos(orderedModifiers[i+1]):
+                orderedModifiers[i], orderedModifiers[i+1] = orderedModifiers[i+1], orderedModifiers[i]
+                changesMade = True
+    return orderedModifiers
+
+
+# A noun phrase with count adjectives and a noun modifier at the start
+def buildPhrase(factory, count):
+    np = factory.createNounPhrase('the', 'table')
+    np.addPreModifier(factory.createNounPhrase('garden'))
+    for i in range(count):
+        np.addPreModifier(factory.createWord(ADJECTIVES[i % len(ADJECTIVES)], LexicalCategory.ADJECTIVE))
+    return np
+
+
+def timeIt(label, func, count, repeat):
+    gc.collect()
+    st = time.time()
+    for i in range(repeat):
+        func()
+    dur = time.time() - st
+    print('  %-40s %6d x %5d in %6.3fs = %8.1f us/phrase' % (label, repeat, count, dur, 1e6*dur/repeat))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/AdjectiveOrderingBenchmark.py [phrases]`
+#
+if __name__ == '__main__':
+    repeat   = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    print('Sorting the premodifiers of noun phrases')
+    for count in [2, 5, 20, 100]:
+        modifiers = buildPhrase(factory, count).getPreModifiers()
+        # deepcopy follows the factory of each modifier to the lexicon, so
+        # the old sort is only run a few times
+        timeIt('deepcopy and bubble sort, %d' % count, lambda: sortNPPreModifiersOld(modifiers), count, \
+            max(repeat // 100, 1))
+        timeIt('positions once, %d' % count, lambda: NounPhraseHelper.sortNPPreModifiers(modifiers), count, repeat)
+    np = buildPhrase(factory, 5)
+    timeIt('realise noun phrase, 5', lambda: realiser.realise(np), 5, repeat)
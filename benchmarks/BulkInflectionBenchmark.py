@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+import os
+import random
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# Inflect each word by realising its own InflectedWordElement
+def inflectEach(realiser, words, category, features):
+    forms = []
+    for word in words:
+        element = InflectedWordElement(word, category)
+        for feature, value in features.items():
+            element.setFeature(feature, value)
+        forms.append(realiser.realise(element).getRealisation())
+    return forms
+
+
+def timeIt(label, func, count):
+    st = time.time()
+    result = func()
+    dur = time.time() - st
+    print('  %-40s %8d in %6.3fs = %10.0f words/sec' % (label, count, dur, count/dur))
+    return result
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/BulkInflectionBenchmark.py [count]`
+#
+if __name__ == '__main__':
+    count    = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    lexicon  = Lexicon.getDefaultLexicon()
+    realiser = Realiser(lexicon)
+    rng      = random.Random(0)
+    nouns    = sorted(w.getBaseForm() for w in lexicon.words if w.getCategory() == LexicalCategory.NOUN)
+    verbs    = sorted(w.getBaseForm() for w in lexicon.words if w.getCategory() == LexicalCategory.VERB)
+    plural   = {Feature.NUMBER: NumberAgreement.PLURAL}
+    past     = {Feature.TENSE: Tense.PAST}
+
+    print('Distinct nouns, pluralised')
+    a = timeIt('per element', lambda: inflectEach(realiser, nouns, LexicalCategory.NOUN, plural), len(nouns))
+    b = timeIt('inflectMany', lambda: realiser.inflectMany(nouns, LexicalCategory.NOUN, plural), len(nouns))
+    assert a == b
+
+    column = [rng.choice(nouns[:500]) for i in range(count)]
+    print('Column of %d nouns drawn from 500, pluralised' % count)
+    a = timeIt('per element', lambda: inflectEach(realiser, column, LexicalCategory.NOUN, plural), count)
+    b = timeIt('inflectMany', lambda: realiser.inflectMany(column, LexicalCategory.NOUN, plural), count)
+    assert a == b
+
+    column = [rng.choice(verbs) for i in range(count)]
+    print('Column of %d verbs, past tense' % count)
+    a = timeIt('per element', lambda: inflectEach(realiser, column, LexicalCategory.VERB, past), count)
+    b = timeIt('inflectMany', lambda: realiser.inflectMany(column, LexicalCategory.VERB, past), count)
+    assert a == b
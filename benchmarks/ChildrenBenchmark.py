@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+import gc
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# A clause with a front modifier, a modified subject, an object and a postmodifier
+def buildClause(factory):
+    subject = factory.createNounPhrase('the', 'dog')
+    subject.addPreModifier('big')
+    subject.addPostModifier('in the garden')
+    clause = factory.createClause(subject, 'chase', factory.createNounPhrase('a', 'cat'))
+    clause.addFrontModifier('yesterday')
+    clause.addPostModifier('quickly')
+    return clause
+
+
+# Visits every element below element, as the tree walks of the processors do
+def visitAll(element):
+    count = 0
+    stack = [element]
+    while stack:
+        current = stack.pop()
+        count += 1
+        children = current.getChildren()
+        if children:
+            stack.extend(children)
+    return count
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.2f us/call' % (label, count, dur, 1e6*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/ChildrenBenchmark.py [count]`
+#
+if __name__ == '__main__':
+    count    = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    clause = buildClause(factory)
+    subject = clause.getSubject()
+    items = ListElement([StringElement('word%d' % i) for i in range(20)])
+    coordinated = factory.createCoordinatedPhrase()
+    for i in range(20):
+        coordinated.addCoordinate(factory.createNounPhrase('the', 'dog %d' % i))
+
+    print('Getting the children of an element %d times' % count)
+    timeIt('noun phrase', lambda: [subject.getChildren() for i in range(count)], count)
+    timeIt('clause', lambda: [clause.getChildren() for i in range(count)], count)
+    timeIt('list of 20 components', lambda: [items.getChildren() for i in range(count)], count)
+    timeIt('coordination of 20 coordinates', lambda: [coordinated.getChildren() for i in range(count)], count)
+    timeIt('last coordinate of 20', lambda: [coordinated.getLastCoordinate() for i in range(count)], count)
+    timeIt('walk of a clause', lambda: [visitAll(clause) for i in range(count//10)], count//10)
+
+    print('Realising clauses')
+    timeIt('realise', lambda: [realiser.realise(buildClause(factory)) for i in range(count//100)], count//100)
@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# Time how many clauses per second can be created
+def timeIt(label, func, count):
+    st = time.time()
+    for i in range(count):
+        func()
+    dur = time.time() - st
+    print('  %-40s %8d in %6.3fs = %10.0f clauses/sec' % (label, count, dur, count/dur))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/ClauseConstructionBenchmark.py [count]`
+#
+if __name__ == '__main__':
+    count   = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    lexicon = Lexicon.getDefaultLexicon()
+    factory = NLGFactory(lexicon)
+    vp      = factory.createVerbPhrase('leave')
+
+    print('Clause construction rate')
+    timeIt('createClause()',                lambda: factory.createClause(),                    count)
+    timeIt('createClause() + tense',        lambda: factory.createClause().setFeature( \
+                                                    Feature.TENSE, Tense.PAST),                count)
+    timeIt('createClause(verb=vp)',         lambda: factory.createClause(None, vp),            count)
+    timeIt('createClause() + getVerbPhrase',lambda: factory.createClause().getVerbPhrase(),    count)
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+import copy
+import gc
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# A clause with a coordinated subject, modifiers and a subordinate clause
+def buildClause(factory):
+    subject = factory.createCoordinatedPhrase(factory.createNounPhrase('the', 'dog'), \
+                                              factory.createNounPhrase('a', 'cat'))
+    clause = factory.createClause(subject, 'chase', factory.createNounPhrase('the', 'mouse'))
+    clause.getObject().addModifier('small')
+    clause.addModifier('quickly')
+    clause.addModifier('in the garden')
+    clause.setFeature(Feature.TENSE, Tense.PAST)
+    clause.addComplement(factory.createClause('John', 'watch'))
+    return clause
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    for i in range(count):
+        func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.2f us/call' % (label, count, dur, 1e6*dur/count))
+
+
+# Note
+# Plain deepcopy also copies the factory and, through it, the whole lexicon,
+# so it is run far fewer times. "deepcopy, sharing the factory" is a deepcopy
+# that is told to leave the factory and lexicon alone.
+# Run from the top level directory as: `./benchmarks/CloneBenchmark.py [count]`
+#
+if __name__ == '__main__':
+    count    = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+    clause   = buildClause(factory)
+    memo     = lambda: {id(factory): factory, id(lexicon): lexicon}
+    print(realiser.realiseSentence(clause.clone()))
+
+    print('Copying a clause')
+    timeIt('deepcopy', lambda: copy.deepcopy(clause), max(1, count // 1000))
+    timeIt('deepcopy, sharing the factory', lambda: copy.deepcopy(clause, memo()), count)
+    timeIt('clone', lambda: clause.clone(), count)
+    print('Copying and realising a clause')
+    timeIt('deepcopy, sharing the factory', lambda: realiser.realiseSentence(copy.deepcopy(clause, memo())), count)
+    timeIt('clone', lambda: realiser.realiseSentence(clause.clone()), count)
+    print('Looking up words in the lexicon')
+    timeIt('lookupWord', lambda: lexicon.lookupWord('chase', LexicalCategory.VERB), count)
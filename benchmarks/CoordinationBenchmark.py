@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+import gc
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# A sentence listing count products ("we sell the product 0, the product 1, ... and the product n")
+def buildSentence(factory, count):
+    coord = factory.createCoordinatedPhrase()
+    for i in range(count):
+        coord.addCoordinate(factory.createNounPhrase('the', 'product %d' % i))
+    return factory.createSentence(factory.createClause('we', 'sell', coord))
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    result = func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.1f us/coordinate' % (label, count, dur, 1e6*dur/count))
+    return result
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/CoordinationBenchmark.py [coordinates]`
+#
+if __name__ == '__main__':
+    maxCount = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    # the time per coordinate should stay the same as the coordinations get wider
+    print('Building and realising wide coordinations')
+    count = 10
+    while count <= maxCount:
+        sentence = timeIt('build %d' % count, lambda: buildSentence(factory, count), count)
+        timeIt('realise %d' % count, lambda: realiser.realise(sentence), count)
+        count *= 10
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+NOUNS = ['apple', 'dog', 'hour', 'university', 'egg', 'cat', 'umbrella', 'house']
+
+
+# A coordinated phrase of count indefinite noun phrases ("an apple, a dog, ... and an hour")
+def buildCoordination(factory, count):
+    coord = factory.createCoordinatedPhrase()
+    for i in range(count):
+        coord.addCoordinate(factory.createNounPhrase('a', NOUNS[i % len(NOUNS)]))
+    return coord
+
+
+# A list of count noun phrases, each with a determiner and a modifier
+def buildList(factory, count):
+    nplist = ListElement()
+    for i in range(count):
+        np = factory.createNounPhrase('a', NOUNS[i % len(NOUNS)])
+        np.addPreModifier('old' if i % 2 else 'big')
+        nplist.addComponent(np)
+    return nplist
+
+
+# The agreement pass that MorphologyProcessor used before it was a single pass
+def combineRealisedListOld(elements, realisedList):
+    realisedElements = []
+    determiner = None
+    prevElement = None
+    for eachElement, currentElement in zip(elements, realisedList):
+        if currentElement is not None:
+            currentElement.setFeature(Feature.APPOSITIVE, eachElement.getFeature(Feature.APPOSITIVE))
+            function = eachElement.getFeature(InternalFeature.DISCOURSE_FUNCTION)
+            if function is not None:
+                currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, function)
+            if prevElement is not None and isinstance(prevElement, StringElement) and \
+                    isinstance(eachElement, InflectedWordElement) and \
+                    eachElement.getCategory() == LexicalCategory.NOUN:
+                tokens = prevElement.getRealisation().split(" ")
+                if tokens[-1].lower() == "a" and DeterminerAgrHelper.requiresAn(currentElement.getRealisation()):
+                    prevElement.setRealisation(' '.join(tokens[:-1] + ["an"]))
+            realisedElements.append(currentElement)
+            if determiner is None and DiscourseFunction.SPECIFIER == \
+                    currentElement.getFeature(InternalFeature.DISCOURSE_FUNCTION):
+                determiner = currentElement
+                determiner.setFeature(Feature.NUMBER, eachElement.getFeature(Feature.NUMBER))
+            elif determiner is not None:
+                if isinstance(currentElement, ListElement):
+                    children = currentElement.getChildren()
+                    firstChild = None if not children else children[0]
+                    if firstChild is not None:
+                        if isinstance(firstChild, CoordinatedPhraseElement):
+                            MorphologyRules.doDeterminerMorphology(determiner, \
+                                firstChild.getChildren()[0].getRealisation())
+                        else:
+                            MorphologyRules.doDeterminerMorphology(determiner, firstChild.getRealisation())
+                else:
+                    MorphologyRules.doDeterminerMorphology(determiner, currentElement.getRealisation())
+                determiner = None
+        prevElement = eachElement
+    return realisedElements
+
+
+def timeIt(label, func, count, units):
+    st = time.time()
+    func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.0f ns/%s' % (label, count, dur, 1e9*dur/count, units))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/DeterminerAgreementBenchmark.py [phrases]`
+#
+if __name__ == '__main__':
+    maxCount = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    canText  = ' '.join(['word'] * 50) + ' a'
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    print('Morphology of long coordinated noun phrases and noun phrase lists')
+    count = 10
+    while count <= maxCount:
+        coord = realiser.syntax.realise(buildCoordination(factory, count))
+        timeIt('coordination of %d' % count, lambda: realiser.morphology.realise(coord), count, 'NP')
+        nplist = realiser.syntax.realise(buildList(factory, count))
+        timeIt('list of %d' % count, lambda: realiser.morphology.realise(nplist), count, 'NP')
+        count *= 10
+
+    # Agreement over the words of many noun phrases, before and after
+    count = 10 * maxCount
+    print('Agreement pass over %d noun phrases' % count)
+    words = []
+    for i in range(count):
+        np = realiser.syntax.realise(factory.createNounPhrase('a', NOUNS[i % len(NOUNS)]))
+        words.extend(np.getChildren())
+    canned = []
+    for i in range(count):
+        canned.append(StringElement(canText))
+        canned.append(InflectedWordElement(NOUNS[i % len(NOUNS)], LexicalCategory.NOUN))
+    morphology = realiser.morphology
+    for label, combine in [('old', combineRealisedListOld), ('single pass', morphology.combineRealisedList)]:
+        for elements, kind in [(words, 'specifiers'), (canned, 'canned text')]:
+            realised = [morphology.realise(element) for element in elements]
+            timeIt('%s, %s' % (label, kind), lambda: combine(elements, realised), count, 'NP')
+            for element in elements:    # undo the agreement for the next run
+                if isinstance(element, StringElement):
+                    element.setRealisation(canText)
@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# Build a document of sentences with a mix of phrase types
+def buildDocument(factory, count):
+    document  = factory.createDocument('Benchmark')
+    paragraph = factory.createParagraph()
+    for i in range(count):
+        subject = factory.createNounPhrase('the', 'dog')
+        subject.addModifier('big')
+        obj = factory.createCoordinatedPhrase(factory.createNounPhrase('a', 'cat'), \
+                                              factory.createNounPhrase('the', 'mouse'))
+        clause = factory.createClause(subject, 'chase', obj)
+        clause.addModifier('quickly')
+        clause.addPostModifier(factory.createPrepositionPhrase('in', factory.createNounPhrase('the', 'park')))
+        clause.setFeature(Feature.TENSE, Tense.PAST)
+        paragraph.addComponent(factory.createSentence(clause))
+    document.addComponent(paragraph)
+    return document
+
+
+# Collect every element in a tree
+def collectElements(element, elements):
+    stack = [element]
+    while stack:
+        element = stack.pop()
+        elements.append(element)
+        children = element.getChildren() if not isinstance(element, InflectedWordElement) else None
+        if children:
+            stack.extend(children)
+        if isinstance(element, PhraseElement):
+            head = element.getHead()
+            if head is not None:
+                stack.append(head)
+    return elements
+
+
+# The isinstance chain that SyntaxProcessor used before the registry
+def syntaxChain(element):
+    if isinstance(element, DocumentElement):    return 'document'
+    elif isinstance(element, PhraseElement):    return 'phrase'
+    elif isinstance(element, ListElement):      return 'list'
+    elif isinstance(element, InflectedWordElement): return 'inflected'
+    elif isinstance(element, WordElement):      return 'word'
+    elif isinstance(element, CoordinatedPhraseElement): return 'coordinated'
+    return None
+
+
+# The category chain that MorphologyProcessor.doMorphology used before the registry
+def morphologyChain(category):
+    if isinstance(category, LexicalCategory):
+        if category == LexicalCategory.PRONOUN:     return 'pronoun'
+        elif category == LexicalCategory.NOUN:      return 'noun'
+        elif category == LexicalCategory.VERB:      return 'verb'
+        elif category == LexicalCategory.ADJECTIVE: return 'adjective'
+        elif category == LexicalCategory.ADVERB:    return 'adverb'
+        return 'other'
+    return None
+
+
+def timeIt(label, func, items, repeat):
+    st = time.time()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    dur = time.time() - st
+    count = len(items) * repeat
+    print('  %-40s %9d in %6.3fs = %6.0f ns/dispatch' % (label, count, dur, 1e9*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/DispatchBenchmark.py [sentences]`
+#
+if __name__ == '__main__':
+    count    = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat   = 20
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    elements = collectElements(buildDocument(factory, count), [])
+    print('Syntax dispatch over %d elements' % len(elements))
+    timeIt('isinstance chain', syntaxChain, elements, repeat)
+    syntax = realiser.syntax
+    timeIt('registry', lambda element: syntax.getElementHandler(type(element)), elements, repeat)
+
+    postSyntax = realiser.syntax.realise(buildDocument(factory, count))
+    words = [e for e in collectElements(postSyntax, []) if isinstance(e, InflectedWordElement)]
+    categories = [word.getCategory() for word in words]
+    print('Morphology dispatch over %d words' % len(words))
+    timeIt('category chain', morphologyChain, categories, repeat)
+    handlers = realiser.morphology.categoryHandlers
+    timeIt('registry', handlers.get, categories, repeat)
+
+    print('Realisation')
+    document = buildDocument(factory, count)
+    st = time.time()
+    realiser.realise(document)
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.0f sentences/sec' % ('realise', count, dur, count/dur))
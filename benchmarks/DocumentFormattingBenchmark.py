@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+import gc
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# A bulleted list of count items, each a short sentence
+def buildList(factory, count):
+    items = factory.createList()
+    for i in range(count):
+        items.addComponent(factory.createListItem(factory.createClause('the dog', 'chase', 'cat %d' % i)))
+    return factory.createDocument('List', items)
+
+
+# A paragraph of count sentences
+def buildParagraph(factory, count):
+    paragraph = factory.createParagraph()
+    for i in range(count):
+        clause = factory.createClause('the dog', 'chase', factory.createNounPhrase('a', 'cat'))
+        clause.addPostModifier('%d times' % i)
+        paragraph.addComponent(factory.createSentence(clause))
+    return factory.createDocument('Paragraph', paragraph)
+
+
+# A list with a single item made of count pieces of canned text
+def buildListItem(factory, count):
+    item = factory.createListItem()
+    for i in range(count):
+        item.addComponent(StringElement('word%d' % i))
+    return factory.createList(item)
+
+
+# Times the orthography and formatting of the output of the earlier stages
+def timeIt(label, realiser, document, count):
+    postMorphology = realiser.morphology.realise(realiser.syntax.realise(document))
+    gc.collect()    # don't time the clean up of the earlier documents
+    st = time.time()
+    realiser.formatter.realise(realiser.orthography.realise(postMorphology))
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.0f ns/item' % (label, count, dur, 1e9*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/DocumentFormattingBenchmark.py [items]`
+#
+if __name__ == '__main__':
+    maxCount = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+    realiser.initialise()
+
+    # the time per item should stay the same as the documents get longer
+    print('Orthography and formatting')
+    for scale in [8, 4, 2, 1]:
+        count = maxCount // scale
+        timeIt('list of %d items' % count, realiser, buildList(factory, count), count)
+    for scale in [8, 4, 2, 1]:
+        count = maxCount // scale // 2
+        timeIt('paragraph of %d sentences' % count, realiser, buildParagraph(factory, count), count)
+    for scale in [8, 4, 2, 1]:
+        count = maxCount // scale
+        timeIt('list item of %d strings' % count, realiser, buildListItem(factory, count), count)
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+import gc
+import html
+import os
+import re
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# A document of count sections, each with a paragraph, a bulleted list and a numbered list
+def buildDocument(factory, count):
+    document = factory.createDocument('Report')
+    for i in range(count):
+        section = factory.createSection('Section %d' % i)
+        section.addComponent(factory.createParagraph([factory.createSentence('the dog', 'chase', 'the cat'), \
+                                                      factory.createSentence('the cat', 'run', 'away')]))
+        bullets = factory.createList()
+        numbers = factory.createEnumeratedList()
+        for j in range(3):
+            bullets.addComponent(factory.createListItem(factory.createSentence('point %d' % j)))
+            numbers.addComponent(factory.createListItem(factory.createSentence('step %d' % j)))
+        section.addComponent(factory.createParagraph(bullets))
+        section.addComponent(numbers)
+        document.addComponent(section)
+    return document
+
+
+# Turns the plain text output into HTML with regular expressions, as was
+# done before there was an HTMLFormatter
+def textToHTML(text):
+    blocks = []
+    for block in re.split(r'\n\n+', text):
+        items = re.findall(r'^(?: \* |\d+(?:\.\d+)* - )(.*)$', block, re.M)
+        if items:
+            blocks.append('<ul>' + ''.join('<li>' + html.escape(item) + '</li>' for item in items) + '</ul>')
+        elif block:
+            blocks.append('<p>' + html.escape(block) + '</p>')
+    return ''.join(blocks)
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.0f us/section' % (label, count, dur, 1e6*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/FormatterBenchmark.py [sections]`
+#
+if __name__ == '__main__':
+    count    = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+    postOrthography = realiser.realiseUnformatted(buildDocument(factory, count))
+
+    print('Formatting a document of %d sections' % count)
+    text = TextFormatter()
+    timeIt('text', lambda: text.realise(postOrthography), count)
+    timeIt('text, then regex to HTML', lambda: textToHTML(text.realise(postOrthography).getRealisation()), count)
+    timeIt('HTMLFormatter', lambda: HTMLFormatter().realise(postOrthography), count)
+    timeIt('MarkdownFormatter', lambda: MarkdownFormatter().realise(postOrthography), count)
+    with tempfile.TemporaryFile('w+') as f:
+        timeIt('HTMLFormatter, written to a file', lambda: HTMLFormatter().write(postOrthography, f), count)
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+import os
+import re
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# The regular expression plural rule that MorphologyRules used before the suffix tables
+def regexPluralNoun(baseForm):
+    if re.fullmatch(r".*[^aeiou]y\b", baseForm):
+        return re.sub(r"y\b", "ies", baseForm)
+    elif re.fullmatch(r".*([szx]|[cs]h)\b", baseForm):
+        return baseForm + "es"
+    return baseForm + "s"
+
+
+# The regular expression present participle rule
+def regexPresPartVerb(baseForm):
+    if baseForm.endswith("ie"):
+        return re.sub(r"ie\b", "ying", baseForm)
+    elif re.fullmatch(r".*[^iyeo]e\b", baseForm):
+        return re.sub(r"e\b", "ing", baseForm)
+    return baseForm + "ing"
+
+
+# Time how many inflections per second can be built
+def timeIt(label, func, words, repeat):
+    st = time.time()
+    for _ in range(repeat):
+        for word in words:
+            func(word)
+    dur = time.time() - st
+    count = len(words) * repeat
+    print('  %-40s %8d in %6.3fs = %10.0f inflections/sec' % (label, count, dur, count/dur))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/InflectionBenchmark.py [repeat]`
+#
+if __name__ == '__main__':
+    repeat  = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    lexicon = Lexicon.getDefaultLexicon()
+    nouns   = [w.getBaseForm() for w in lexicon.words if w.getCategory() == LexicalCategory.NOUN]
+    verbs   = [w.getBaseForm() for w in lexicon.words if w.getCategory() == LexicalCategory.VERB]
+
+    print('Regular inflection over %d nouns and %d verbs' % (len(nouns), len(verbs)))
+    timeIt('plural (regex)',                    regexPluralNoun,                            nouns, repeat)
+    timeIt('plural (suffix rules)',             MorphologyRules.buildRegularPluralNoun,     nouns, repeat)
+    timeIt('present participle (regex)',        regexPresPartVerb,                          verbs, repeat)
+    timeIt('present participle (suffix rules)', MorphologyRules.buildRegularPresPartVerb,   verbs, repeat)
+    timeIt('present 3s (suffix rules)',         MorphologyRules.buildPresent3SVerb,         verbs, repeat)
+    timeIt('past (suffix rules)',               lambda w: MorphologyRules.buildRegularPastVerb( \
+                                                          w, None, None),                   verbs, repeat)
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+import gc
+import itertools
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# count questions, cycling through the interrogative types, tenses and voices
+def buildQuestions(factory, count):
+    combinations = list(itertools.product(list(InterrogativeType), [Tense.PAST, Tense.PRESENT, Tense.FUTURE], \
+        [False, True]))
+    questions = []
+    for i in range(count):
+        itype, tense, passive = combinations[i % len(combinations)]
+        clause = factory.createClause('the customer', 'return', 'the product %d' % i)
+        clause.setFeature(Feature.INTERROGATIVE_TYPE, itype)
+        clause.setFeature(Feature.TENSE, tense)
+        clause.setFeature(Feature.PASSIVE, passive)
+        questions.append(clause)
+    return questions
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.1f us/question' % (label, count, dur, 1e6*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/InterrogativeBenchmark.py [questions]`
+#
+if __name__ == '__main__':
+    count    = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    print('Realising %d questions' % count)
+    questions = buildQuestions(factory, count)
+    timeIt('syntax', lambda: [realiser.syntax.realise(question) for question in questions], count)
+    questions = buildQuestions(factory, count)
+    timeIt('realiseSentence', lambda: [realiser.realiseSentence(question) for question in questions], count)
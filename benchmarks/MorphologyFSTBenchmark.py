@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+def timeIt(label, func, items, repeat):
+    st = time.time()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    dur = time.time() - st
+    count = len(items) * repeat
+    print('  %-40s %8d in %6.3fs = %10.0f words/sec' % (label, count, dur, count/dur))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/MorphologyFSTBenchmark.py [repeat]`
+#
+if __name__ == '__main__':
+    repeat  = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    lexicon = Lexicon.getDefaultLexicon()
+
+    st  = time.time()
+    fst = MorphologyFST.fromLexicon(lexicon)
+    print('Compiled in %.3fs: %d generator states, %d analyser states' % \
+          (time.time() - st, fst.generator.getNumStates(), fst.analyser.getNumStates()))
+    fd, filename = tempfile.mkstemp(suffix='.gz')
+    os.close(fd)
+    fst.save(filename)
+    st  = time.time()
+    MorphologyFST.load(filename)
+    print('Saved to %d bytes, loaded in %.3fs' % (os.path.getsize(filename), time.time() - st))
+    os.remove(filename)
+
+    forms  = sorted(set(form for word in lexicon.words for tag, form in MorphologyFST.getWordForms(word)))
+    lemmas = sorted(set(word.getBaseForm() for word in lexicon.words if word.getBaseForm()))
+    print('Lemma lookup from %d inflected forms' % len(forms))
+    timeIt('lexicon.lookupWord', lexicon.lookupWord, forms, repeat)
+    timeIt('fst.analyse',        fst.analyse,        forms, repeat)
+    print('Generation of all forms of %d lemmas' % len(lemmas))
+    timeIt('fst.getForms',       fst.getForms,       lemmas, repeat)
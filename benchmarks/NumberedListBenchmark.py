@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+import gc
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# The dotted string NumberedPrefix used before the counter stack
+class StringPrefix(object):
+    def __init__(self):
+        self.prefix = "0"
+
+    def increment(self):
+        dotPosition = self.prefix.rfind('.')
+        if dotPosition < 0:
+            self.prefix = str(int(self.prefix) + 1)
+        else:
+            self.prefix = self.prefix[:dotPosition] + "." + str(int(self.prefix[dotPosition+1:]) + 1)
+
+    def upALevel(self):
+        self.prefix = "1" if self.prefix == "0" else self.prefix + ".1"
+
+    def downALevel(self):
+        dotPosition = self.prefix.rfind('.')
+        self.prefix = "0" if dotPosition < 0 else self.prefix[:dotPosition]
+
+    def getPrefix(self):
+        return self.prefix
+
+
+# Numbers count items in lists nested depth deep, as the formatter does
+def enumerate(prefix, count, depth):
+    for level in range(depth):
+        prefix.upALevel()
+    for i in range(count):
+        if i > 0:
+            prefix.increment()
+        prefix.getPrefix()
+    for level in range(depth):
+        prefix.downALevel()
+
+
+# An enumerated list of count items, split into sub-lists of 100 items
+def buildDocument(factory, count):
+    document = factory.createDocument()
+    enumerated = factory.createEnumeratedList()
+    for start in range(0, count, 100):
+        subList = factory.createEnumeratedList()
+        for i in range(start, min(start+100, count)):
+            subList.addComponent(factory.createListItem(StringElement('Item %d.' % i)))
+        enumerated.addComponent(subList)
+    document.addComponent(enumerated)
+    return document
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.0f ns/item' % (label, count, dur, 1e9*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/NumberedListBenchmark.py [items]`
+#
+if __name__ == '__main__':
+    maxCount = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    print('Numbering %d items' % maxCount)
+    for depth in [1, 5, 20]:
+        timeIt('dotted string, depth %d' % depth, lambda: enumerate(StringPrefix(), maxCount, depth), maxCount)
+        timeIt('counter stack, depth %d' % depth, lambda: enumerate(NumberedPrefix(), maxCount, depth), maxCount)
+    roman = [NumberedPrefix.roman, NumberedPrefix.alpha]
+    timeIt('counter stack, roman, depth 5', lambda: enumerate(NumberedPrefix(roman), maxCount, 5), maxCount)
+
+    # the time per item should stay the same as the list gets longer
+    print('Formatting enumerated lists')
+    for scale in [8, 4, 2, 1]:
+        count = maxCount // scale
+        document = buildDocument(factory, count)
+        timeIt('list of %d items' % count, lambda: realiser.formatter.realise(document), count)
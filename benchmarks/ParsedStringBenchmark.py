@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+import gc
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+VERBS     = ['pick up', 'fall down', 'kick', 'give', 'look up to']
+ADJECTIVES = ['big', 'red', 'old', 'happy', 'beautiful']
+ADVERBS   = ['quickly', 'fortunately', 'slowly', 'however', 'very']
+CANNED    = ['in the park', 'on Monday', 'at home']
+
+
+def setVerbs(factory, count):
+    for i in range(count):
+        factory.createVerbPhrase(VERBS[i % len(VERBS)])
+
+
+def addNounModifiers(factory, count):
+    noun = factory.createNounPhrase('the', 'dog')
+    for i in range(count):
+        noun.setFeature(InternalFeature.PREMODIFIERS, None)
+        noun.addModifier(ADJECTIVES[i % len(ADJECTIVES)])
+
+
+def addClauseModifiers(factory, count):
+    clause = factory.createClause('the dog', 'chase', 'the cat')
+    modifiers = ADVERBS + CANNED
+    for i in range(count):
+        if i % 50 == 0:
+            clause = factory.createClause('the dog', 'chase', 'the cat')
+        clause.addModifier(modifiers[i % len(modifiers)])
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.2f us/call' % (label, count, dur, 1e6*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/ParsedStringBenchmark.py [count]`
+#
+if __name__ == '__main__':
+    count    = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+
+    print('Parsing strings given to phrases')
+    timeIt('createVerbPhrase', lambda: setVerbs(factory, count), count)
+    timeIt('NPPhraseSpec.addModifier', lambda: addNounModifiers(factory, count), count)
+    timeIt('SPhraseSpec.addModifier', lambda: addClauseModifiers(factory, count), count)
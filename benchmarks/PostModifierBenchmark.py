@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+import gc
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# A clause with count prepositional phrase postmodifiers
+def buildClause(factory, count):
+    clause = factory.createClause('the man', 'walk')
+    for i in range(count):
+        clause.addPostModifier(factory.createPrepositionPhrase('in', factory.createNounPhrase('the', 'park %d' % i)))
+    return clause
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.1f us/modifier' % (label, count, dur, 1e6*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/PostModifierBenchmark.py [modifiers]`
+#
+if __name__ == '__main__':
+    maxCount = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    # the time per modifier should stay the same as the clauses get longer
+    print('Copying clause postmodifiers into the verb phrase')
+    for scale in [8, 4, 2, 1]:
+        count = maxCount // scale
+        clause = buildClause(factory, count)
+        realiser.syntax.realise(clause)
+        verbPhrase = clause.getVerbPhrase()
+        timeIt('copy again, %d modifiers' % count, \
+            lambda: ClauseHelper.copyFrontModifiers(clause, verbPhrase), count)
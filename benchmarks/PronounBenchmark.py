@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+import gc
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from   simplenlg import *
+
+
+# count pronominal noun phrases, cycling through persons, genders and numbers
+def buildPhrases(factory, count):
+    phrases = []
+    for i in range(count):
+        np = factory.createNounPhrase('the', 'person')
+        np.setFeature(Feature.PRONOMINAL, True)
+        np.setFeature(Feature.PERSON, [Person.FIRST, Person.SECOND, Person.THIRD][i % 3])
+        np.setFeature(LexicalFeature.GENDER, [Gender.FEMININE, Gender.MASCULINE, Gender.NEUTER][i % 3])
+        np.setFeature(Feature.NUMBER, [NumberAgreement.SINGULAR, NumberAgreement.PLURAL][i % 2])
+        np.setFeature(Feature.POSSESSIVE, i % 4 == 0)
+        phrases.append(np)
+    return phrases
+
+
+def timeIt(label, func, count):
+    gc.collect()
+    st = time.time()
+    func()
+    dur = time.time() - st
+    print('  %-40s %9d in %6.3fs = %6.1f us/pronoun' % (label, count, dur, 1e6*dur/count))
+
+
+# Note
+# Run from the top level directory as: `./benchmarks/PronounBenchmark.py [phrases]`
+#
+if __name__ == '__main__':
+    count    = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    lexicon  = Lexicon.getDefaultLexicon()
+    factory  = NLGFactory(lexicon)
+    realiser = Realiser(lexicon)
+
+    print('Pronominalisation of %d noun phrases' % count)
+    phrases = buildPhrases(factory, count)
+    syntax = realiser.syntax
+    timeIt('createPronoun', lambda: [NounPhraseHelper.createPronoun(syntax, np) for np in phrases], count)
+    phrases = buildPhrases(factory, count)
+    timeIt('realise', lambda: [realiser.realise(np) for np in phrases], count)
@@ -19,7 +19,7 @@ setuptools.setup(
     long_description_content_type='text/markdown',
     url='https://github.com/bjascob/pySimpleNLG',
     include_package_data=True,
-    package_data={'':['default-lexicon.xml']},
+    package_data={'':['default-lexicon.xml', 'indefinite-article-exceptions.txt']},
     packages=setuptools.find_packages(),
     classifiers=[
         'Programming Language :: Python :: 3',
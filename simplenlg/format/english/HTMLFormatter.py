@@ -0,0 +1,61 @@
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+import html
+from ...framework.DocumentCategory           import *
+from .StreamingFormatter                     import *
+
+# This processing module formats the SimpleNLG output as HTML. Documents and
+# sections have <h1> and <h2> titles, paragraphs are <p> elements, lists are
+# <ul> or <ol> elements of <li> items, and the text is escaped.
+class HTMLFormatter(StreamingFormatter):
+    # {category: (start tag, end tag)}
+    TAGS = { DocumentCategory.PARAGRAPH:       ("<p>",  "</p>"),
+             DocumentCategory.LIST:            ("<ul>", "</ul>"),
+             DocumentCategory.ENUMERATED_LIST: ("<ol>", "</ol>"),
+             DocumentCategory.LIST_ITEM:       ("<li>", "</li>") }
+
+    # @Override
+    def startElement(self, element, category):
+        title = self.getTitle(element)
+        if category == DocumentCategory.DOCUMENT:
+            self.appendTitle(title, "h1")
+        elif category == DocumentCategory.SECTION:
+            self.appendTitle(title, "h2")
+        elif category in self.TAGS:
+            self.emit(self.TAGS[category][0])
+
+    # @Override
+    def writeSeparator(self, element, category, previousEndsWithNewline):
+        if category == DocumentCategory.PARAGRAPH or category == DocumentCategory.LIST_ITEM or \
+                not isinstance(category, DocumentCategory):
+            self.emit(' ')
+
+    # @Override
+    def endElement(self, element, category, components):
+        if category in self.TAGS:
+            self.emit(self.TAGS[category][1])
+
+    # @Override
+    def writeText(self, text):
+        self.emit(html.escape(text, False))
+
+    # appendTitle -- Writes the document or section title as a heading.
+    def appendTitle(self, title, tag):
+        if title:
+            self.emit("<" + tag + ">" + html.escape(title, False) + "</" + tag + ">")
@@ -0,0 +1,100 @@
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+import re
+from ...framework.DocumentCategory           import *
+from .StreamingFormatter                     import *
+
+# This processing module formats the SimpleNLG output as Markdown. Documents
+# and sections have "#" and "##" headings, paragraphs are separated by blank
+# lines, and list items start with "*" or their number ("1."), indented by
+# four spaces for each level of nesting. The text is escaped.
+class MarkdownFormatter(StreamingFormatter):
+    INDENT = '    '
+    METACHARACTERS     = re.compile(r'([\\`*_\[\]#])')
+    LINE_START_MARKERS = re.compile(r'^( *\d*)((?<=\d)[.)]|(?<!\d)[-+])(?=\s|$)', re.M)
+
+    # @Override
+    def resetState(self, sink):
+        super().resetState(sink)
+        self.listDepth = 0  # the number of lists the current element is in
+
+    # @Override
+    def startElement(self, element, category):
+        title = self.getTitle(element)
+        if category == DocumentCategory.DOCUMENT:
+            self.appendTitle(title, "# ")
+        elif category == DocumentCategory.SECTION:
+            self.appendTitle(title, "## ")
+        elif category == DocumentCategory.LIST or category == DocumentCategory.ENUMERATED_LIST:
+            if self.listDepth == 0:
+                self.endBlock()     # a list starts a new block
+                self.appendTitle(title, "")
+            self.listDepth += 1
+        elif category == DocumentCategory.LIST_ITEM:
+            if self.written > 0 and not self.lastChars.endswith('\n'):
+                self.pendingSpaces = 0  # no space after "2." when the item starts with a nested list
+                self.emit('\n')
+            self.emit(self.getListItemPrefix(element))
+
+    # Escapes the characters that Markdown would read as markup
+    # @Override
+    def writeText(self, text):
+        self.emit(self.escape(text))
+
+    # @Override
+    def writeSeparator(self, element, category, previousEndsWithNewline):
+        if category == DocumentCategory.PARAGRAPH or category == DocumentCategory.LIST_ITEM or \
+                not isinstance(category, DocumentCategory):
+            self.emit(' ')
+
+    # @Override
+    def endElement(self, element, category, components):
+        if category == DocumentCategory.PARAGRAPH:
+            self.endBlock()
+        elif category == DocumentCategory.LIST or category == DocumentCategory.ENUMERATED_LIST:
+            self.listDepth -= 1
+            if self.listDepth == 0:
+                self.endBlock()
+
+    # Ends the output so far with a blank line, unless it already does
+    def endBlock(self):
+        if self.written > 0 and self.lastChars != '\n\n':
+            self.emit('\n' if self.lastChars.endswith('\n') else '\n\n')
+
+    # getListItemPrefix -- The indented bullet or number that starts a list item.
+    def getListItemPrefix(self, element):
+        parent = element.getParent()
+        indent = self.INDENT * max(self.listDepth - 1, 0)
+        if parent is not None and parent.getCategory() == DocumentCategory.ENUMERATED_LIST:
+            return indent + str(self.numberedPrefix.getCounters()[-1]) + ". "
+        return indent + "* "
+
+    # appendTitle -- Writes a title as a block, starting with the heading marker.
+    def appendTitle(self, title, marker):
+        if title:
+            self.emit(marker + self.escape(title))
+            self.endBlock()
+
+    # escape -- Puts a backslash before the Markdown metacharacters in text,
+    # and before the "." of "1." or the "-" or "+" that would make the start
+    # of a line a list item.
+    @classmethod
+    def escape(cls, text):
+        text = cls.METACHARACTERS.sub(r'\\\1', text)
+        return cls.LINE_START_MARKERS.sub(r'\1\\\2', text)
@@ -17,40 +17,93 @@
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
 
-# This class keeps track of the prefix for numbered lists.
+# This class keeps track of the prefix for numbered lists. The prefix is a
+# stack of counters, one for each level of nesting, with the label of each
+# counter. Changing a counter only relabels its own level, and the prefix
+# string (eg, "2.1.3") is only joined up when it is needed. Each level can be
+# numbered with its own scheme, a function from the counter to its label,
+# such as NumberedPrefix.arabic, NumberedPrefix.alpha or NumberedPrefix.roman.
+# The last scheme is used for all the deeper levels.
 class NumberedPrefix(object):
-    def __init__(self):
-        self.prefix = "0"
+    SEPARATOR = '.'
+
+    def __init__(self, schemes=None):
+        self.schemes      = list(schemes) if schemes else [NumberedPrefix.arabic]
+        self.counters     = [0]
+        self.labels       = ["0"]
+        self.levelSchemes = [self.schemes[0]]   # the scheme of each level
+        self.prefix       = "0"                 # the joined labels, or None if they have changed
+
+    # Returns the numbering scheme of a level of nesting (0 is the outermost)
+    def getScheme(self, level):
+        return self.schemes[min(level, len(self.schemes)-1)]
 
     def increment(self):
-        dotPosition = self.prefix.rfind('.')
-        if dotPosition < 0:
-            counter = int(self.prefix)
-            counter += 1
-            self.prefix = str(counter)
-        else:
-            subCounterStr = self.prefix[dotPosition+1:]
-            subCounter = int(subCounterStr)
-            subCounter += 1
-            self.prefix = self.prefix[:dotPosition] + "." + str(subCounter)
+        counter = self.counters[-1] + 1
+        self.counters[-1] = counter
+        self.labels[-1] = self.levelSchemes[-1](counter) if counter > 0 else str(counter)
+        self.prefix = None
 
     # This method starts a new level to the prefix
     def upALevel(self):
-        if self.prefix == "0":
-            self.prefix = "1"
+        if self.counters == [0]:
+            self.counters[0] = 1
+            self.labels[0] = self.levelSchemes[0](1)
         else:
-            self.prefix += ".1"
+            scheme = self.getScheme(len(self.counters))
+            self.counters.append(1)
+            self.labels.append(scheme(1))
+            self.levelSchemes.append(scheme)
+        self.prefix = None
 
     # This method removes a level from the prefix .
     def downALevel(self):
-        dotPosition = self.prefix.rfind('.')
-        if dotPosition < 0:
-            self.prefix = "0"
+        if len(self.counters) > 1:
+            self.counters.pop()
+            self.labels.pop()
+            self.levelSchemes.pop()
         else:
-            self.prefix = self.prefix[:dotPosition]
+            self.counters[0] = 0
+            self.labels[0] = "0"
+        self.prefix = None
 
     def getPrefix(self):
+        if self.prefix is None:
+            self.prefix = self.SEPARATOR.join(self.labels)
         return self.prefix
 
+    # Sets the prefix from a string of numbers separated by dots, eg "3.4.3"
     def setPrefix(self, prefix):
-        self.prefix = prefix
+        self.counters     = [int(counter) for counter in prefix.split(self.SEPARATOR)]
+        self.levelSchemes = [self.getScheme(level) for level in range(len(self.counters))]
+        self.labels       = [scheme(counter) if counter > 0 else str(counter) \
+                             for scheme, counter in zip(self.levelSchemes, self.counters)]
+        self.prefix       = None
+
+    # Returns the counters of the levels, outermost first
+    def getCounters(self):
+        return list(self.counters)
+
+    # Numbering scheme 1, 2, 3, ...
+    @staticmethod
+    def arabic(counter):
+        return str(counter)
+
+    # Numbering scheme a, b, ..., z, aa, ab, ...
+    @staticmethod
+    def alpha(counter):
+        label = ''
+        while counter > 0:
+            counter, remainder = divmod(counter - 1, 26)
+            label = chr(ord('a') + remainder) + label
+        return label
+
+    # Numbering scheme i, ii, iii, iv, ...
+    @staticmethod
+    def roman(counter):
+        label = ''
+        for value, numeral in ((1000, 'm'), (900, 'cm'), (500, 'd'), (400, 'cd'), (100, 'c'), (90, 'xc'),
+                               (50, 'l'), (40, 'xl'), (10, 'x'), (9, 'ix'), (5, 'v'), (4, 'iv'), (1, 'i')):
+            count, counter = divmod(counter, value)
+            label += numeral * count
+        return label
@@ -0,0 +1,192 @@
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+import copy
+import io
+from ...framework.CoordinatedPhraseElement   import *
+from ...framework.DocumentCategory           import *
+from ...framework.DocumentElement            import *
+from ...framework.ListElement                import *
+from ...framework.NLGElement                 import *
+from ...framework.NLGModule                  import *
+from ...framework.StringElement              import *
+from ...framework.TreeWalker                 import *
+from .NumberedPrefix                         import *
+
+
+# The base class of the formatters, which writes the formatted document
+# straight to a sink (any object with a write(str) method, such as an open
+# file or an io.StringIO) in one pass over the orthography output.
+# Subclasses write the markup for each element in these methods:
+#   startElement(element, category)
+#       before the components of a document element, list or coordinate
+#   writeSeparator(element, category, previousEndsWithNewline)
+#       between two of its components
+#   endElement(element, category, components)
+#       after its components
+#   writeText(text)
+#       for the text of a sentence or of canned text
+# using emit(text) to write to the sink. The numbering of enumerated list
+# items is kept in self.numberedPrefix.
+# As with the realisation of an element (see NLGElement.getRealisation), the
+# output of each element has no leading or trailing spaces: spaces at the
+# start of an element are dropped, and spaces are only written once some
+# more of the element follows them.
+class StreamingFormatter(NLGModule):
+    def __init__(self):
+        super().__init__()
+        self.numberingSchemes = None    # see NumberedPrefix
+        self.resetState(None)
+
+    # @Override
+    def initialise(self):
+        pass # Do nothing
+
+    # Sets the numbering schemes of enumerated lists, one for each level of
+    # nesting, eg [NumberedPrefix.arabic, NumberedPrefix.alpha]
+    def setNumberingSchemes(self, schemes):
+        self.numberingSchemes = schemes
+
+    # Sets up the state of a new realisation, which writes to sink
+    def resetState(self, sink):
+        self.sink           = sink
+        self.numberedPrefix = NumberedPrefix(self.numberingSchemes)
+        self.componentStart = []        # the output length at the start of the current component of each element
+        self.hasContent     = [False]   # whether each element (and the whole output) has written more than spaces
+        self.pendingSpaces  = 0         # the number of spaces that are written if more text follows
+        self.written        = 0         # the number of characters written
+        self.lastChars      = ''        # the last two characters written
+
+    # @Override
+    def realise(self, element):
+        if isinstance(element, NLGElement):
+            return StringElement(self.write(element, io.StringIO()).getvalue())
+        elif isinstance(element, list):
+            return [self.realise(eachElement) for eachElement in element]
+        else:
+            raise ValueError('Invalid element type: ' + str(type(element)))
+
+    # Formats the element and writes it to the sink. Returns the sink.
+    def write(self, element, sink):
+        # the state is kept by a copy of the formatter, so the state of one
+        # realisation doesn't leak into another one running at the same time
+        formatter = copy.copy(self)
+        formatter.resetState(sink)
+        TreeWalker.walk(formatter, element)
+        return sink
+
+    # Writes text to the sink
+    def emit(self, text):
+        if not text:
+            return
+        body = text.rstrip(' ')
+        hasContent = self.hasContent
+        if not hasContent[-1]:
+            body = body.lstrip(' ')
+        if not body:
+            if hasContent[-1]:
+                self.pendingSpaces += len(text)
+            return
+        if self.pendingSpaces:
+            body = ' ' * self.pendingSpaces + body
+        self.sink.write(body)
+        self.written += len(body)
+        self.lastChars = (self.lastChars + body[-2:])[-2:]
+        self.pendingSpaces = len(text) - len(text.rstrip(' '))
+        level = len(hasContent) - 1
+        while level >= 0 and not hasContent[level]:
+            hasContent[level] = True
+            level -= 1
+
+    # Returns the components of an element that are formatted, or None if the
+    # element is written as text.
+    def getComponents(self, element):
+        if isinstance(element, StringElement):
+            return None
+        category = element.getCategory()
+        if isinstance(category, DocumentCategory):
+            if category == DocumentCategory.SENTENCE:
+                return None
+            return element.getChildren()
+        # also need to check if element is a ListElement (items can
+        # have embedded lists post-orthography) or a coordinate
+        elif isinstance(element, ListElement) or isinstance(element, CoordinatedPhraseElement):
+            return element.getChildren()
+        return None
+
+    # Returns the title of a document element, or None
+    def getTitle(self, element):
+        if isinstance(element, DocumentElement):
+            return element.getTitle()
+        return None
+
+    # TreeWalker visitor method. Returns the components that must be formatted
+    # before this element, or None if it is formatted on its own.
+    def enterElement(self, element):
+        components = self.getComponents(element)
+        if components is not None:
+            category = element.getCategory()
+            if category == DocumentCategory.ENUMERATED_LIST:
+                self.numberedPrefix.upALevel()
+            self.hasContent.append(False)
+            self.startElement(element, category)
+            self.componentStart.append(self.written)
+        return components
+
+    # TreeWalker visitor method, called before each component is formatted.
+    def beforeChild(self, element, component, index):
+        category = element.getCategory()
+        if index > 0:
+            previousEndsWithNewline = self.written > self.componentStart[-1] and self.lastChars.endswith('\n')
+            self.writeSeparator(element, category, previousEndsWithNewline)
+            if category == DocumentCategory.ENUMERATED_LIST and \
+                    component.getParent().getCategory() == DocumentCategory.ENUMERATED_LIST:
+                self.numberedPrefix.increment()
+        self.componentStart[-1] = self.written
+
+    # TreeWalker visitor method. Writes the text of a leaf or the end of an
+    # element. Nothing is returned, as the output goes to the sink.
+    def leaveElement(self, element, components, realisedComponents):
+        if components is None:
+            if isinstance(element, StringElement) or element.getCategory() == DocumentCategory.SENTENCE:
+                self.writeText(element.getRealisation())
+        else:
+            self.componentStart.pop()
+            category = element.getCategory()
+            self.endElement(element, category, components)
+            if self.hasContent.pop():
+                self.pendingSpaces = 0  # the trailing spaces of the element
+            if category == DocumentCategory.ENUMERATED_LIST:
+                self.numberedPrefix.downALevel()
+        return None
+
+    # Writes the start of a document element, list or coordinate
+    def startElement(self, element, category):
+        pass
+
+    # Writes the separator between two components of an element
+    def writeSeparator(self, element, category, previousEndsWithNewline):
+        pass
+
+    # Writes the end of a document element, list or coordinate
+    def endElement(self, element, category, components):
+        pass
+
+    # Writes the text of a sentence or canned text
+    def writeText(self, text):
+        self.emit(text)
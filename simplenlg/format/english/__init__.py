@@ -1,2 +1,5 @@
-from .NumberedPrefix    import *
-from .TextFormatter     import *
+from .NumberedPrefix        import *
+from .StreamingFormatter    import *
+from .TextFormatter         import *
+from .HTMLFormatter         import *
+from .MarkdownFormatter     import *
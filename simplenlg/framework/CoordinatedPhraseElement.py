@@ -27,6 +27,7 @@ from .StringElement                 import *
 # This class defines coordination between two or more phrases.
 class CoordinatedPhraseElement(NLGElement):
     PLURAL_COORDINATORS = ["and"]
+    childFeatures = frozenset([InternalFeature.COORDINATES])
 
     # Creates a blank coordinated phrase ready for new coordinates to be added.
     def __init__(self, coordinate1=None, coordinate2=None):
@@ -38,12 +39,12 @@ class CoordinatedPhraseElement(NLGElement):
             self.addCoordinate(coordinate2)
             self.setFeature(Feature.CONJUNCTION, "and")
 
-    # Adds a new coordinate to this coordination.
+    # Adds a new coordinate to this coordination. The list of coordinates is
+    # added to in place, so adding n coordinates takes O(n) time.
     def addCoordinate(self, newCoordinate):
-        coordinates = self.getFeatureAsElementList(InternalFeature.COORDINATES)
-        if not coordinates:
-            coordinates = []
-            self.setFeature(InternalFeature.COORDINATES, coordinates)
+        coordinates = self.getFeature(InternalFeature.COORDINATES)
+        if not isinstance(coordinates, list) or self.sharedFeatures:
+            coordinates = self.getFeatureAsElementList(InternalFeature.COORDINATES)
         if isinstance(newCoordinate, NLGElement):
             if newCoordinate.isA(PhraseCategory.CLAUSE) and len(coordinates)>0:
                 newCoordinate.setFeature(Feature.SUPRESSED_COMPLEMENTISER, True)
@@ -54,9 +55,13 @@ class CoordinatedPhraseElement(NLGElement):
             coordinates.append(coordElement)
         self.setFeature(InternalFeature.COORDINATES, coordinates)
 
+    # The list of coordinates is cached until the coordinates are changed, so
+    # it must not be changed by the caller.
     # @Override
     def getChildren(self):
-        return self.getFeatureAsElementList(InternalFeature.COORDINATES)
+        if self.children is None:
+            self.children = self.getFeatureAsElementList(InternalFeature.COORDINATES)
+        return self.children
 
     # Clears the existing coordinates in this coordination. It performs exactly
     # the same as removeFeature(Feature.COORDINATES).
@@ -16,6 +16,7 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
+import copy
 from .NLGElement                import *
 from ..features.InternalFeature import *
 from ..features.LexicalFeature  import *
@@ -40,6 +41,14 @@ class InflectedWordElement(NLGElement):
         else:
             raise ValueError('Invalid param types: ' + str(type(word)) + ', ' + str(type(category)))
 
+    # Returns a copy of this word that shares its features with this word.
+    # Whichever of the two is changed first takes its own copy, so sharing is
+    # invisible to callers (copy-on-write).
+    def copyOnWrite(self):
+        inflected = copy.copy(self)
+        inflected.sharedFeatures = self.sharedFeatures = True
+        return inflected
+
     # This method returns null as the inflected word has no child components.
     # @Override
     def getChildren(self):
@@ -23,6 +23,8 @@ from ..features.InternalFeature import *
 # ListElement is used to define elements that can be grouped
 # together and treated in a similar manner.
 class ListElement(NLGElement):
+    childFeatures = frozenset([InternalFeature.COMPONENTS])
+
     def __init__(self, component=None):
         super().__init__()
         if component is None:
@@ -34,25 +36,25 @@ class ListElement(NLGElement):
         else:
             raise ValueError('Invalid component type: ' + str(type(component)))
 
+    # The list of components is cached until the components are changed, so
+    # it must not be changed by the caller.
     # @Override
     def getChildren(self):
-        return self.getFeatureAsElementList(InternalFeature.COMPONENTS)
+        if self.children is None:
+            self.children = self.getFeatureAsElementList(InternalFeature.COMPONENTS)
+        return self.children
 
     # Adds the given component to the list element.
     def addComponent(self, newComponent):
         components = self.getFeatureAsElementList(InternalFeature.COMPONENTS)
-        if components is None:
-            components = []
-        self.setFeature(InternalFeature.COMPONENTS, components)
         components.append(newComponent)
+        self.setFeature(InternalFeature.COMPONENTS, components)
 
     # Adds the given components to the list element.
     def addComponents(self, newComponents):
         components = self.getFeatureAsElementList(InternalFeature.COMPONENTS)
-        if components is None:
-            components = []
-        self.setFeature(InternalFeature.COMPONENTS, components)
         components.extend(newComponents)
+        self.setFeature(InternalFeature.COMPONENTS, components)
 
     # Replaces the current components in the list element with the given list.
     def setComponents(self, newComponents):
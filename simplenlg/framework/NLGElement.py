@@ -24,12 +24,18 @@ from ..features.Tense               import *
 
 # NLGElement is the base class that all elements extend from.
 class NLGElement(ABC):
+    # The features that hold the children of the element. Setting or removing
+    # one of them clears the cached list of children (see getChildren).
+    childFeatures = frozenset()
+
     def __init__(self):
         self.category    = None    # ElementCategory
         self.features    = {}      # {string, object}
         self.parent      = None    # NLGElement
         self.realisation = None    # string
         self.factory     = None    # NLGFactory
+        self.sharedFeatures = False  # features are shared with another element (copy-on-write)
+        self.children    = None    # cached list of NLGElement, for elements that cache their children
 
     # Sets the category of this element.
     def setCategory(self, new_category):
@@ -43,6 +49,10 @@ class NLGElement(ABC):
     def setFeature(self, featureName, featureValue):
         if not featureName:
             return
+        if self.sharedFeatures:
+            self.unshareFeatures()
+        if featureName in self.childFeatures:
+            self.children = None
         if featureValue is None:
             if featureName in self.features:
                 del self.features[featureName]
@@ -154,11 +164,62 @@ class NLGElement(ABC):
     # Deletes the named feature from the map.
     def removeFeature(self, featureName):
         if featureName in self.features:
+            if self.sharedFeatures:
+                self.unshareFeatures()
+            if featureName in self.childFeatures:
+                self.children = None
             del self.features[featureName]
 
     # Deletes all the features in the map.
     def clearAllFeatures(self):
         self.features = {}
+        self.sharedFeatures = False
+        self.children = None
+
+    # Gives this element its own copy of a feature map that it shares with
+    # other elements. Called before the map is changed.
+    def unshareFeatures(self):
+        self.features = dict(self.features)
+        self.sharedFeatures = False
+
+    # Returns a copy of this element and of the elements below it, so either
+    # tree can be changed or realised without changing the other. Unlike
+    # deepcopy, the copy shares whatever is never changed in place: feature
+    # values that aren't elements (enums, strings, numbers), the factory and,
+    # copy-on-write, the features of words.
+    def clone(self):
+        clones = {}
+        cloned = self.cloneElement(clones)
+        # parents inside the tree become their clones, others are kept
+        for element in clones.values():
+            if element.parent is not None:
+                element.parent = clones.get(id(element.parent), element.parent)
+        return cloned
+
+    # Clones this element for clone(). clones maps the id of each element
+    # cloned so far to its clone, so an element that is in the tree more than
+    # once is only cloned once.
+    def cloneElement(self, clones):
+        cloned = object.__new__(type(self))
+        cloned.__dict__.update(self.__dict__)
+        clones[id(self)] = cloned
+        cloned.features = {featureName: self.cloneValue(value, clones) \
+                           for featureName, value in self.features.items()}
+        cloned.sharedFeatures = False
+        cloned.children = None
+        return cloned
+
+    # Clones a feature value for cloneElement
+    @staticmethod
+    def cloneValue(value, clones):
+        if isinstance(value, NLGElement):
+            cloned = clones.get(id(value))
+            if cloned is None:
+                cloned = value.cloneElement(clones)
+            return cloned
+        elif isinstance(value, list):
+            return [NLGElement.cloneValue(item, clones) for item in value]
+        return value
 
     # Sets the parent element of this element.
     def setParent(self, new_parent):
@@ -226,6 +287,14 @@ class NLGElement(ABC):
     def getChildren(self):
         assert False, 'Not implemented in base.'
 
+    # Iterates over the children of this element, in the same order as
+    # getChildren, without building a new list.
+    def iterChildren(self):
+        children = self.getChildren()
+        if children is None:
+            return iter(())
+        return iter(children)
+
     # Retrieves the set of features currently contained in the feature map.
     def getAllFeatureNames(self):
         return self.features.keys()
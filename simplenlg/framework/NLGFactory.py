@@ -56,6 +56,11 @@ class NLGFactory(object):
     EITHER_NUMBER_PRONOUNS = ["there"]
     EXPLETIVE_PRONOUNS = ["there"]
     WORD_REGEX = r"\w*" # regex for determining if a string is a single word or not
+    WORD_PATTERN = re.compile(WORD_REGEX)
+    # closed-class categories whose words are cached and shared (see createClosedClassWord)
+    CLOSED_CLASS_CATEGORIES = frozenset([LexicalCategory.DETERMINER, LexicalCategory.PREPOSITION, \
+                                         LexicalCategory.CONJUNCTION, LexicalCategory.MODAL, \
+                                         LexicalCategory.COMPLEMENTISER])
 
     # Creates a new phrase factory with the associated lexicon.
     def __init__(self, newLexicon=None):
@@ -65,6 +70,12 @@ class NLGFactory(object):
     # null will remove any existing lexicon from the factory.
     def setLexicon(self, newLexicon):
         self.lexicon = newLexicon
+        self.closedClassWords = {}  # {(str, LexicalCategory): WordElement} looked up in lexicon
+        self.closedClassWordsVersion = None     # the lexicon version the words were looked up in
+        self.inflectedPronouns = {} # {str: InflectedWordElement} made by createInflectedPronoun
+        self.inflectedPronounsVersion = None    # the lexicon version the pronouns were made with
+        self.parsedStrings = {}     # {(str, LexicalCategory): (WordElement, str)} see getParsedString
+        self.parsedStringsVersion = None        # the lexicon version the strings were parsed with
 
     # Creates a new element representing a word. If the word passed is already
     # an NLGElement then that is returned unchanged.
@@ -72,12 +83,98 @@ class NLGFactory(object):
         wordElement = None
         if isinstance(word, NLGElement):
             wordElement = word
+        elif isinstance(word, str) and category in self.CLOSED_CLASS_CATEGORIES and \
+                self.lexicon is not None and self.stringIsWord(word, category):
+            wordElement = self.createClosedClassWord(word, category)
         elif isinstance(word, str) and self.lexicon is not None:
             wordElement = self.lexicon.lookupWord(word, category)
             if word in self.PRONOUNS:
                 self.setPronounFeatures(wordElement, word)
         return wordElement
 
+    # Determiners, prepositions, etc.. are created over and over again. The
+    # lexicon entry for each one is looked up once per factory (and again if words
+    # are added to the lexicon) and callers get a copy-on-write copy of it, so
+    # setting features on one doesn't change the others.
+    # The string must be a word (see stringIsWord).
+    def createClosedClassWord(self, word, category):
+        wordElement = self.getClosedClassWord(word, category)
+        if wordElement is None:
+            wordElement = self.lexicon.lookupWord(word, category)
+            if word in self.PRONOUNS:
+                self.setPronounFeatures(wordElement, word)
+            self.closedClassWords[(word, category)] = wordElement
+        return wordElement.copyOnWrite()
+
+    # Returns the cached lexicon entry of a closed-class word, or None if it
+    # hasn't been looked up
+    def getClosedClassWord(self, word, category):
+        if self.lexicon is not None and self.lexicon.getVersion() != self.closedClassWordsVersion:
+            self.closedClassWords = {}
+            self.closedClassWordsVersion = self.lexicon.getVersion()
+        return self.closedClassWords.get((word, category))
+
+    # Pronominal noun phrases are realised as the same few pronouns over and
+    # over again. The inflected word for each pronoun, with the gender and
+    # person of its lexicon entry, is made once per factory (and again if words
+    # are added to the lexicon) and callers get a copy-on-write copy of it.
+    def createInflectedPronoun(self, pronoun):
+        if self.lexicon is not None and self.lexicon.getVersion() != self.inflectedPronounsVersion:
+            self.inflectedPronouns = {}
+            self.inflectedPronounsVersion = self.lexicon.getVersion()
+        inflected = self.inflectedPronouns.get(pronoun)
+        if inflected is None:
+            proElement = self.createWord(pronoun, LexicalCategory.PRONOUN)
+            if not isinstance(proElement, WordElement):
+                return proElement
+            inflected = InflectedWordElement(proElement)
+            inflected.setFeature(LexicalFeature.GENDER, proElement.getFeature(LexicalFeature.GENDER))
+            inflected.setFeature(Feature.PERSON, proElement.getFeature(Feature.PERSON))
+            self.inflectedPronouns[pronoun] = inflected
+        return inflected.copyOnWrite()
+
+    # The strings given to VPPhraseSpec.setVerb and to the addModifier methods of
+    # phrases are the same few over and over again. Each one is parsed once per
+    # factory (and again if words are added to the lexicon) and callers get a
+    # copy-on-write copy of the word it was parsed into.
+    # Returns the verb word of a verb such as "pick up", and its particle, or
+    # None if the verb has no particle.
+    def createVerbAndParticle(self, verb):
+        parsed = self.getParsedString(verb, LexicalCategory.VERB)
+        if parsed is None:
+            space = verb.find(' ')
+            if space < 0: # no space, so no particle
+                parsed = (self.createWord(verb, LexicalCategory.VERB), None)
+            else: # space, so break up into verb and particle
+                parsed = (self.createWord(verb[:space], LexicalCategory.VERB), verb[space+1:])
+            self.parsedStrings[(verb, LexicalCategory.VERB)] = parsed
+        verbElement, particle = parsed
+        if isinstance(verbElement, WordElement):
+            verbElement = verbElement.copyOnWrite()
+        return verbElement, particle
+
+    # Returns the word for a modifier string that is one lexicographic word,
+    # or None if the string is canned text.
+    def createModifierWord(self, modifier):
+        parsed = self.getParsedString(modifier, LexicalCategory.ANY)
+        if parsed is None:
+            modifierWord = None
+            if len(modifier) > 0 and " " not in modifier:
+                modifierWord = self.createWord(modifier, LexicalCategory.ANY)
+            parsed = (modifierWord, None)
+            self.parsedStrings[(modifier, LexicalCategory.ANY)] = parsed
+        modifierWord = parsed[0]
+        if isinstance(modifierWord, WordElement):
+            modifierWord = modifierWord.copyOnWrite()
+        return modifierWord
+
+    # Returns the cached parse of a string, or None if it hasn't been parsed
+    def getParsedString(self, string, category):
+        if self.lexicon is not None and self.lexicon.getVersion() != self.parsedStringsVersion:
+            self.parsedStrings = {}
+            self.parsedStringsVersion = self.lexicon.getVersion()
+        return self.parsedStrings.get((string, category))
+
     # Create an inflected word element.
     def createInflectedWord(self, word, category):
         inflElement = None
@@ -155,8 +252,9 @@ class NLGFactory(object):
             return element.getBaseWord()
         # StringElement - look up in lexicon if it is a word otherwise return element
         elif isinstance(element, StringElement):
-            if self.stringIsWord(element.getRealisation(), category):
-                return self.createWord(element.getRealisation(), category)
+            wordElement = self.createWordIfWord(element.getRealisation(), category)
+            if wordElement is not None:
+                return wordElement
             else:
                 return element
         # other NLGElement - return element
@@ -164,8 +262,9 @@ class NLGFactory(object):
             return element
         # String - look up in lexicon if a word, otherwise return StringElement
         elif isinstance(element, str):
-            if self.stringIsWord(element, category):
-                return self.createWord(element, category)
+            wordElement = self.createWordIfWord(element, category)
+            if wordElement is not None:
+                return wordElement
             else:
                 return StringElement(element)
         else:
@@ -175,7 +274,26 @@ class NLGFactory(object):
     def stringIsWord(self, string, category):
         return self.lexicon is not None and \
                (self.lexicon.hasWord(string, category) or string in self.PRONOUNS or \
-                re.fullmatch(self.WORD_REGEX, string))
+                self.WORD_PATTERN.fullmatch(string) is not None)
+
+    # Combines stringIsWord and createWord.  Returns the word element for the
+    # string if it is a word, otherwise None.  The lexicon is only queried once
+    # for the base form and the entry found is used for the word.
+    def createWordIfWord(self, string, category):
+        if self.lexicon is None:
+            return None
+        if category in self.CLOSED_CLASS_CATEGORIES:
+            if self.getClosedClassWord(string, category) is not None or self.stringIsWord(string, category):
+                return self.createClosedClassWord(string, category)
+            return None
+        wordElement = self.lexicon.findWord(string, category)
+        if wordElement is None:
+            if string not in self.PRONOUNS and self.WORD_PATTERN.fullmatch(string) is None:
+                return None
+            wordElement = self.lexicon.lookupWordNotInBase(string, category)
+        if string in self.PRONOUNS:
+            self.setPronounFeatures(wordElement, string)
+        return wordElement
 
     # Creates a noun phrase with the given specifier and subject.
     def createNounPhrase(self, ina=None, inb=None):
@@ -253,7 +371,9 @@ class NLGFactory(object):
 
     # Creates a new coordinated phrase with two elements (initially)
     def createCoordinatedPhrase(self, coord1=None, coord2=None):
-        return CoordinatedPhraseElement(coord1, coord2)
+        phraseElement = CoordinatedPhraseElement(coord1, coord2)
+        phraseElement.setFactory(self)
+        return phraseElement
 
     #*********************************************************************************
     # Document level stuff
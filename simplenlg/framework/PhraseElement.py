@@ -27,54 +27,78 @@ from .LexicalCategory               import *
 
 # This class defines a phrase.
 class PhraseElement(NLGElement):
+    childFeatures = frozenset([Feature.CUE_PHRASE, InternalFeature.FRONT_MODIFIERS, InternalFeature.PREMODIFIERS, \
+                               InternalFeature.SUBJECTS, InternalFeature.VERB_PHRASE, InternalFeature.COMPLEMENTS, \
+                               InternalFeature.SPECIFIER, InternalFeature.HEAD, InternalFeature.POSTMODIFIERS])
+
     def __init__(self, newCategory):
         super().__init__()
         self.setCategory(newCategory)
         self.setFeature(Feature.ELIDED, False)
 
-    # This method retrieves the child components of this phrase.
+    # @Override
+    def setCategory(self, newCategory):
+        super().setCategory(newCategory)
+        self.children = None    # the order of the children depends on the category
+
+    # This method retrieves the child components of this phrase. The list is
+    # cached until one of the childFeatures is set or removed, so it must not
+    # be changed by the caller.
     # @Override
     def getChildren(self):
-        children = []
+        if self.children is None:
+            children = list(self.iterChildren())
+            self.children = children
+        return self.children
+
+    # Iterates over the child components of this phrase, in order.
+    # @Override
+    def iterChildren(self):
+        if self.children is not None:
+            yield from self.children
+            return
         category = self.getCategory()
-        currentElement = None
         if isinstance(category, PhraseCategory):
             if category == PhraseCategory.CLAUSE:
                 currentElement = self.getFeatureAsElement(Feature.CUE_PHRASE)
                 if currentElement is not None:
-                    children.append(currentElement)
-                children.extend(self.getFeatureAsElementList(InternalFeature.FRONT_MODIFIERS))
-                children.extend(self.getFeatureAsElementList(InternalFeature.PREMODIFIERS))
-                children.extend(self.getFeatureAsElementList(InternalFeature.SUBJECTS))
-                children.extend(self.getFeatureAsElementList(InternalFeature.VERB_PHRASE))
-                children.extend(self.getFeatureAsElementList(InternalFeature.COMPLEMENTS))
+                    yield currentElement
+                yield from self.iterFeatureElements(InternalFeature.FRONT_MODIFIERS)
+                yield from self.iterFeatureElements(InternalFeature.PREMODIFIERS)
+                yield from self.iterFeatureElements(InternalFeature.SUBJECTS)
+                yield from self.iterFeatureElements(InternalFeature.VERB_PHRASE)
+                yield from self.iterFeatureElements(InternalFeature.COMPLEMENTS)
             elif category == PhraseCategory.NOUN_PHRASE:
                 currentElement = self.getFeatureAsElement(InternalFeature.SPECIFIER)
                 if currentElement is not None:
-                    children.append(currentElement)
-                children.extend(self.getFeatureAsElementList(InternalFeature.PREMODIFIERS))
-                currentElement = self.getHead()
-                if currentElement is not None:
-                    children.append(currentElement)
-                children.extend(self.getFeatureAsElementList(InternalFeature.COMPLEMENTS))
-                children.extend(self.getFeatureAsElementList(InternalFeature.POSTMODIFIERS))
-            elif category == PhraseCategory.VERB_PHRASE:
-                children.extend(self.getFeatureAsElementList(InternalFeature.PREMODIFIERS))
+                    yield currentElement
+                yield from self.iterFeatureElements(InternalFeature.PREMODIFIERS)
                 currentElement = self.getHead()
                 if currentElement is not None:
-                    children.append(currentElement)
-                children.extend(self.getFeatureAsElementList(InternalFeature.COMPLEMENTS))
-                children.extend(self.getFeatureAsElementList(InternalFeature.POSTMODIFIERS))
+                    yield currentElement
+                yield from self.iterFeatureElements(InternalFeature.COMPLEMENTS)
+                yield from self.iterFeatureElements(InternalFeature.POSTMODIFIERS)
             elif category == PhraseCategory.CANNED_TEXT:
                 pass # Do nothing
             else:
-                children.extend(self.getFeatureAsElementList(InternalFeature.PREMODIFIERS))
+                # verb phrases and all other phrases
+                yield from self.iterFeatureElements(InternalFeature.PREMODIFIERS)
                 currentElement = self.getHead()
                 if currentElement is not None:
-                    children.append(currentElement)
-                children.extend(self.getFeatureAsElementList(InternalFeature.COMPLEMENTS))
-                children.extend(self.getFeatureAsElementList(InternalFeature.POSTMODIFIERS))
-        return children
+                    yield currentElement
+                yield from self.iterFeatureElements(InternalFeature.COMPLEMENTS)
+                yield from self.iterFeatureElements(InternalFeature.POSTMODIFIERS)
+
+    # Iterates over the elements of a feature, as getFeatureAsElementList
+    # does, without copying the list.
+    def iterFeatureElements(self, featureName):
+        value = self.getFeature(featureName)
+        if isinstance(value, NLGElement):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, NLGElement):
+                    yield item
 
     # Sets the head, or main component, of this current phrase.
     def setHead(self, newHead):
@@ -245,8 +269,10 @@ class PhraseElement(NLGElement):
     # Sets the determiner for the phrase.
     # @Deprecated
     def setDeterminer(self, newDeterminer):
-        from .NLGFactory  import NLGFactory     # prevent circular imports
-        factory = NLGFactory()
+        factory = self.getFactory()
+        if factory is None:
+            from .NLGFactory  import NLGFactory     # prevent circular imports
+            factory = NLGFactory()
         determinerElement = factory.createWord(newDeterminer, LexicalCategory.DETERMINER)
         if determinerElement is not None:
             determinerElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.SPECIFIER)
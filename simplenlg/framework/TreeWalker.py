@@ -0,0 +1,60 @@
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+
+# This class walks an element tree depth first using an explicit stack instead
+# of Python recursion, so the depth of a tree is only limited by memory.
+# The processing is done by a visitor object, which must have the methods
+#   enterElement(element)
+#       called when the walk reaches an element. Returns the list of children
+#       that must be realised before the element, or None if the element can
+#       be realised directly (ie, it is a leaf for this visitor).
+#   beforeChild(element, child, index)
+#       called just before each child in that list is entered.
+#   leaveElement(element, children, realisedChildren)
+#       called once all the children are realised, with the list returned by
+#       enterElement and the realisation of each of them (both are None for
+#       a leaf). Returns the realisation of the element.
+# Calls for a parent and its children are properly nested, so a visitor
+# can keep its own stack of per-element state if it needs one.
+class TreeWalker(object):
+    # Walks the tree below element and returns the visitor's realisation of it.
+    @classmethod
+    def walk(cls, visitor, element):
+        children = visitor.enterElement(element)
+        if children is None:
+            return visitor.leaveElement(element, None, None)
+        stack = [[element, children, 0, []]]  # frames of [element, children, next index, realised]
+        while True:
+            frame = stack[-1]
+            parent, children, index, realised = frame
+            if index < len(children):
+                frame[2] = index + 1
+                child = children[index]
+                visitor.beforeChild(parent, child, index)
+                grandChildren = visitor.enterElement(child)
+                if grandChildren is None:
+                    realised.append(visitor.leaveElement(child, None, None))
+                else:
+                    stack.append([child, grandChildren, 0, []])
+            else:
+                stack.pop()
+                realisedElement = visitor.leaveElement(parent, children, realised)
+                if not stack:
+                    return realisedElement
+                stack[-1][3].append(realisedElement)
@@ -51,6 +51,7 @@ class WordElement(NLGElement):
         self.id          = wid          # str (id in lexicon)
         self.inflVars    = {}           # {Inflection, InflectionSet} the inflectional variants
         self.defaultInfl = None         # Inflection # the default inflectional variant
+        self.sharedInflVars = False     # inflVars are shared with another word (copy-on-write)
 
     # Copy Constructor
     @staticmethod
@@ -61,6 +62,28 @@ class WordElement(NLGElement):
         we.setFeatures(currentWord)
         return we
 
+    # Returns a copy of this word that shares its features and inflectional
+    # variants with this word. Whichever of the two is changed first takes its
+    # own copy, so sharing is invisible to callers (copy-on-write).
+    def copyOnWrite(self):
+        we = WordElement(self.baseForm, self.getCategory(), self.id)
+        we.features = self.features
+        we.inflVars = self.inflVars
+        we.defaultInfl = self.defaultInfl
+        we.sharedFeatures = self.sharedFeatures = True
+        we.sharedInflVars = self.sharedInflVars = True
+        return we
+
+    # Words are cloned copy-on-write, as they are mostly left unchanged
+    # @Override
+    def cloneElement(self, clones):
+        we = self.copyOnWrite()
+        clones[id(self)] = we
+        we.parent      = self.parent
+        we.realisation = self.realisation
+        we.factory     = self.factory
+        return we
+
     #**********************************************************
     # getters and setters
     #**********************************************************
@@ -108,6 +131,13 @@ class WordElement(NLGElement):
 
     # Add an inflectional variant to this word element.
     def addInflectionalVariant(self, infl, lexicalFeature=None, form=None):
+        if self.sharedInflVars:
+            inflVars = {}
+            for key, infl_set in self.inflVars.items():
+                inflVars[key] = InflectionSet(infl_set.infl)
+                inflVars[key].forms = dict(infl_set.forms)
+            self.inflVars = inflVars
+            self.sharedInflVars = False
         if lexicalFeature is None and form is None:
             self.inflVars[infl] = InflectionSet(infl)
         elif infl in self.inflVars:
@@ -10,4 +10,5 @@ from . NLGModule                import *
 from . PhraseElement            import *
 from . PhraseCategory           import *
 from . StringElement            import *
+from . TreeWalker               import *
 from . WordElement              import *
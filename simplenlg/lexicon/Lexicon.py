@@ -23,9 +23,16 @@ from ..framework.WordElement        import *
 
 # This is the generic abstract class for a Lexicon.
 class Lexicon(ABC):
+    version = 0     # incremented whenever words are added to the lexicon
+
     def __init__(self):
         pass
 
+    # Returns the version of the lexicon, which changes whenever words are added,
+    # so that cached lookups can be invalidated.
+    def getVersion(self):
+        return self.version
+
     # Return an instance of the default lexicon
     @staticmethod
     def getDefaultLexicon():
@@ -41,15 +48,40 @@ class Lexicon(ABC):
     def lookupWord(self, baseForm, category=None):
         if not category:
             category = LexicalCategory.ANY
-        if self.hasWord(baseForm, category):
-            return self.getWord(baseForm, category)
-        elif self.hasWordFromVariant(baseForm, category):
-            return self.getWordFromVariant(baseForm, category)
-        elif self.hasWordByID(baseForm):
-            return self.getWordByID(baseForm)
-        else:
-            return self.createWord(baseForm, category)
+        wordElement = self.findWord(baseForm, category)
+        if wordElement is None:
+            wordElement = self.lookupWordNotInBase(baseForm, category)
+        return wordElement
+
+    # The second half of lookupWord, for a base form that is not in the lexicon.
+    # Tries variant, ID (in this order) and creates a new word if neither matches.
+    # Each index is only queried once.
+    def lookupWordNotInBase(self, baseForm, category=None):
+        if not category:
+            category = LexicalCategory.ANY
+        wordElements = self.getWordsFromVariant(baseForm, category)
+        if wordElements:
+            return self.selectMatchingWord(wordElements, baseForm)
+        wordElements = self.getWordsByID(baseForm)
+        if wordElements:
+            return wordElements[0]
+        return self.createWord(baseForm, category)
+
+    # Returns the WordElement which has the specified base form and category,
+    # or None if there is no such word.  This answers hasWord and getWord with
+    # a single query.
+    def findWord(self, baseForm, category=None):
+        wordElements = self.getWords(baseForm, category)
+        if not wordElements:
+            return None
+        return self.selectMatchingWord(wordElements, baseForm)
+
 
+    # Looks up many base forms at once, as lookupWord does, and returns a
+    # dictionary of {baseForm: WordElement}. The words may be the lexicon's
+    # own entries rather than copies, so they must not be modified.
+    def lookupWordEntries(self, baseForms, category=None):
+        return {baseForm: self.lookupWord(baseForm, category) for baseForm in baseForms}
 
     # returns all Words which have the specified base form and category
     def getWords(self, baseForm, category):
@@ -18,7 +18,6 @@
 
 import os
 import logging
-from   copy         import deepcopy
 from   collections  import defaultdict
 import xml.etree.ElementTree as ET
 from   .Lexicon                     import *
@@ -43,6 +42,7 @@ class XMLLexicon(Lexicon):
         self.indexByID      = {}                       # ID's are unique mapping to word
         self.indexByBase    = defaultdict(list)        # list of WordElements by base_form
         self.indexByVariant = defaultdict(list)        # list of WordElements by variants
+        self.morphologyFST  = None                     # compiled morphology for variants, see setMorphologyFST
         self.createLexicon(lexicon_fn)
 
     # Lexicon Note: not all entries have an ID
@@ -106,6 +106,7 @@ class XMLLexicon(Lexicon):
         return word
 
     def IndexWord(self, word):
+        self.version += 1
         base_form = word.getBaseForm()
         if base_form:
             self.indexByBase[base_form].append(word)
@@ -118,9 +119,24 @@ class XMLLexicon(Lexicon):
         for variant in self.getVariants(word):
             self.indexByVariant[variant].append(word)
 
+    # Uses a compiled morphology (see simplenlg.morphology.english.MorphologyFST)
+    # to find the inflected forms of words for the variant index, instead of
+    # the quick-and-dirty rules in getForm, and rebuilds the index.  Passing
+    # None goes back to the quick-and-dirty rules.
+    def setMorphologyFST(self, fst):
+        self.version       += 1
+        self.morphologyFST  = fst
+        self.indexByVariant = defaultdict(list)
+        for words in self.indexByBase.values():
+            for word in words:
+                for variant in self.getVariants(word):
+                    self.indexByVariant[variant].append(word)
+        self.addSpecialCases()
+
     def addSpecialCases(self):
         be = self.getWord("be", LexicalCategory.VERB)
         if be is not None:
+            self.version += 1
             self.indexByVariant['is'  ].append(be)
             self.indexByVariant['am'  ].append(be)
             self.indexByVariant['are' ].append(be)
@@ -133,27 +149,66 @@ class XMLLexicon(Lexicon):
 
     # get matching keys from an index map
     def getWordsFromIndex(self, indexKey, category, indexMap):
-        results = []
+        return [word.clone() for word in self.getEntriesFromIndex(indexKey, category, indexMap)]
+
+    # get the lexicon's own entries (not copies) for a key in an index map
+    def getEntriesFromIndex(self, indexKey, category, indexMap):
         # case 1: unknown, return empty list
         if indexKey not in indexMap:
-            return results
+            return []
         # case 2: category is ANY, return everything
         if category == LexicalCategory.ANY:
-            for word in indexMap[indexKey]:
-                results.append(deepcopy(word))
-            return results
-        else:
-            # case 3: other category, search for match
-            for word in indexMap[indexKey]:
-                if word.getCategory() == category:
-                    results.append(deepcopy(word))
-            return results
+            return list(indexMap[indexKey])
+        # case 3: other category, search for match
+        return [word for word in indexMap[indexKey] if word.getCategory() == category]
+
+    # Override Lexicon see simplenlg.lexicon.Lexicon#lookupWordEntries
+    # Same as lookupWord, but without copying the lexicon's entries.
+    def lookupWordEntries(self, baseForms, category=None):
+        if not category:
+            category = LexicalCategory.ANY
+        entries = {}
+        for baseForm in baseForms:
+            words = self.getEntriesFromIndex(baseForm, category, self.indexByBase)
+            if not words:
+                words = self.getEntriesFromIndex(baseForm, category, self.indexByVariant)
+            if words:
+                entries[baseForm] = self.selectMatchingWord(words, baseForm)
+            elif baseForm in self.indexByID:
+                entries[baseForm] = self.indexByID[baseForm]
+            else:
+                entries[baseForm] = self.createWord(baseForm, category)
+        return entries
+
+    # return true if a key in an index map has a word of the given category.
+    # This checks the index directly, rather than copying the matches.
+    def hasWordInIndex(self, indexKey, category, indexMap):
+        if indexKey not in indexMap:
+            return False
+        if category == LexicalCategory.ANY:
+            return len(indexMap[indexKey]) > 0
+        for word in indexMap[indexKey]:
+            if word.getCategory() == category:
+                return True
+        return False
+
+    # Override Lexicon see simplenlg.lexicon.Lexicon#hasWord
+    def hasWord(self, baseForm, category=None):
+        return self.hasWordInIndex(baseForm, category, self.indexByBase)
+
+    # Override Lexicon see simplenlg.lexicon.Lexicon#hasWordFromVariant
+    def hasWordFromVariant(self, variant, category=None):
+        return self.hasWordInIndex(variant, category, self.indexByVariant)
+
+    # Override Lexicon see simplenlg.lexicon.Lexicon#hasWordByID
+    def hasWordByID(self, wid):
+        return wid in self.indexByID
 
     # Override Lexicon see simplenlg.lexicon.Lexicon#getWordsByID
     def getWordsByID(self, wid):
         results = []
         if wid in self.indexByID:
-            results.append(deepcopy(self.indexByID[wid]))
+            results.append(self.indexByID[wid].clone())
         return results
 
     # Override Lexicon see simplenlg.lexicon.Lexicon#getWordsFromVariant
@@ -165,6 +220,11 @@ class XMLLexicon(Lexicon):
         variants = set()
         variants.add(word.getBaseForm())
         category = word.getCategory()
+        if self.morphologyFST is not None:
+            # the forms come from the word's own entry, as the compiled forms of
+            # a base form are those of all its entries (homographs) in a category
+            variants.update(form for tag, form in self.morphologyFST.getWordForms(word))
+            return variants
         if isinstance(category, LexicalCategory):
             if category == LexicalCategory.NOUN:
                 variants.add(self.getVariant(word, LexicalFeature.PLURAL, "s"))
@@ -16,39 +16,69 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
-import re
+import os
+from simplenlg import resource_directory
 
-# This class is used to parse numbers that are passed as figures, to determine
-# whether they should take "a" or "an" as determiner.
+# This class decides whether a word takes "a" or "an" as determiner. Words
+# starting with a vowel take "an", except for those listed in the exceptions
+# file, and numbers that are pronounced with a vowel sound (eg, "an 18%
+# increase") take "an".
 class DeterminerAgrHelper(object):
-    # An array of strings which are exceptions to the rule that "an" comes
-    # before vowels
-    AN_EXCEPTIONS = [ r"one", r"180", r"110" ]
-    # Start of string involving vowels, for use of "an"
-    AN_AGREEMENT = r"\A(a|e|i|o|u).*"
+    EXCEPTIONS_FILE = os.path.join(resource_directory, 'indefinite-article-exceptions.txt')
+    VOWELS = 'aeiou'
+    exceptions = None   # prefix trie of {char: node}, with the None key set to True if the prefix takes "an"
 
-    # Check whether this string starts with a number that needs "an" (e.g.
-    # "an 18% increase")
+    # Returns the exceptions trie, loading it from EXCEPTIONS_FILE the first time
     @classmethod
-    def requiresAn(cls, string):
-        req = False
-        lowercaseInput = string.lower()
-        if re.fullmatch(cls.AN_AGREEMENT,lowercaseInput) and not cls.isAnException(lowercaseInput):
-            req = True
-        else:
-            numPref = cls.getNumericPrefix(lowercaseInput)
-            if numPref and re.fullmatch(r"^(8|11|18).*$", numPref):
-                num = int(numPref)
-                req = cls.checkNum(num)
-        return req
+    def getExceptions(cls):
+        if cls.exceptions is None:
+            cls.exceptions = {}
+            with open(cls.EXCEPTIONS_FILE, encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    article, prefix = line.split(None, 1)
+                    cls.addException(prefix, article.lower() == 'an')
+        return cls.exceptions
+
+    # Adds a word prefix that always takes "an" (requiresAn is True) or "a"
+    # (requiresAn is False), whatever letter it starts with. For example,
+    # addException("hour", True) or addException("uni", False). A requiresAn
+    # of None removes the exception.
+    @classmethod
+    def addException(cls, prefix, requiresAn):
+        node = cls.getExceptions()
+        for char in prefix.lower():
+            node = node.setdefault(char, {})
+        node[None] = requiresAn
 
-    # check whether a string beginning with a vowel is an exception and doesn't
-    # take "an" (e.g. "a one percent change")
+    # Returns True or False for the longest exception prefix of the (lower
+    # case) string, or None if no exception matches.
     @classmethod
-    def isAnException(cls, string):
-        for ex in cls.AN_EXCEPTIONS:
-            if re.fullmatch(r"^" + ex + r".*", string):
-                return True
+    def findException(cls, string):
+        node = cls.getExceptions()
+        found = None
+        for char in string:
+            node = node.get(char)
+            if node is None:
+                break
+            if node.get(None) is not None:
+                found = node[None]
+        return found
+
+    # Check whether this string needs "an" rather than "a" as determiner
+    @classmethod
+    def requiresAn(cls, string):
+        lowercaseInput = string.lower()
+        exception = cls.findException(lowercaseInput)
+        if exception is not None:
+            return exception
+        if lowercaseInput and lowercaseInput[0] in cls.VOWELS:
+            return True
+        numPref = cls.getNumericPrefix(lowercaseInput)
+        if numPref and numPref.startswith(('8', '11', '18')):
+            return cls.checkNum(int(numPref))
         return False
 
     # Returns true if the number starts with 8, 11 or 18 and is
@@ -64,45 +94,31 @@ class DeterminerAgrHelper(object):
             needsAn = cls.checkNum(num)
         return needsAn
 
-    # Retrieve the numeral prefix of a string.
+    # Retrieve the numeral prefix of a string, ignoring commas within the number.
     @classmethod
     def getNumericPrefix(cls, instr):
-        numeric = ''
-        if instr is not None:
-            instr = instr.strip()
-            if instr:
-                first = instr[0]
-                if first.isdigit():
-                    numeric += first
-                    for next_loc in instr[1:]:
-                        if next_loc.isdigit():
-                            numeric += next_loc
-                        # skip commas within numbers
-                        elif next_loc == ',':
-                            continue
-                        else:
-                            break
+        if instr is None:
+            return None
+        instr = instr.lstrip()
+        end = 0
+        for char in instr:
+            if not (char.isdigit() or (char == ',' and end > 0)):
+                break
+            end += 1
+        numeric = instr[:end].replace(',', '')
         if numeric:
-            return str(numeric)
+            return numeric
         return None
 
-    # Check to see if a string ends with the indefinite article "a" and it agrees with {@code np}.
+    # Check to see if a string ends with the indefinite article "a" and it
+    # agrees with {@code np}. Only the end of the text is examined.
     @classmethod
     def checkEndsWithIndefiniteArticle(cls, text, np):
-        tokens = text.split(" ")
-        lastToken = tokens[-1]
-        if lastToken.lower()=="a" and cls.requiresAn(np):
-            tokens = tokens[:-1]
-            tokens.append("an")
-            return cls.stringArrayToString(tokens)
+        if text[-1:] in ('a', 'A') and (len(text) == 1 or text[-2] == ' ') and cls.requiresAn(np):
+            return text[:-1] + "an"
         return text
 
     # Turns ["a","b","c"] into "a b c"
     @classmethod
     def stringArrayToString(cls, sArray):
-        buf = ''
-        for i, char in enumerate(sArray):
-            buf += char
-            if i != len(sArray)-1:
-                buf += ' '
-        return buf
+        return ' '.join(sArray)
@@ -0,0 +1,257 @@
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+import gzip
+import json
+from ...features.Feature                import *
+from ...features.Form                   import *
+from ...features.LexicalFeature         import *
+from ...features.NumberAgreement        import *
+from ...features.Tense                  import *
+from ...framework.InflectedWordElement  import *
+from ...framework.LexicalCategory       import *
+from .MorphologyRules                   import *
+
+
+# A minimised acyclic transducer from keys (ie, words) to lists of outputs.
+# Each output is a tuple (strip, append, category, tag), which rewrites the
+# key into the target word by removing strip characters from its end and
+# adding append. Since the outputs are relative to the key, words that
+# inflect the same way share their final states, and the automaton is
+# minimised by merging all states with the same outputs and transitions.
+# A lookup follows one transition per character, so takes time linear in the
+# length of the key.
+class Transducer(object):
+    def __init__(self):
+        self.outputs    = []    # [(strip, append, category, tag)] the distinct outputs
+        self.outputSets = []    # [tuple of output indexes] the distinct sets of outputs
+        self.finals     = []    # [outputSet index or -1] for each state
+        self.edges      = []    # [{char: state}] for each state
+        self.start      = 0
+
+    # Builds the transducer from an iterable of (key, target, category, tag)
+    @classmethod
+    def build(cls, entries):
+        transducer = cls()
+        outputIndex = {}
+        trieEdges   = [{}]
+        trieOutputs = [set()]
+        for key, target, category, tag in entries:
+            node = 0
+            for char in key:
+                child = trieEdges[node].get(char)
+                if child is None:
+                    child = len(trieEdges)
+                    trieEdges[node][char] = child
+                    trieEdges.append({})
+                    trieOutputs.append(set())
+                node = child
+            prefix = 0
+            for keyChar, targetChar in zip(key, target):
+                if keyChar != targetChar:
+                    break
+                prefix += 1
+            output = (len(key) - prefix, target[prefix:], category, tag)
+            if output not in outputIndex:
+                outputIndex[output] = len(transducer.outputs)
+                transducer.outputs.append(output)
+            trieOutputs[node].add(outputIndex[output])
+        transducer.start = transducer.minimise(trieEdges, trieOutputs)
+        return transducer
+
+    # Replaces the trie by its minimal automaton, working up from the leaves.
+    # Returns the start state.
+    def minimise(self, trieEdges, trieOutputs):
+        setIndex = {}
+        register = {}   # {(outputSet, transitions): state}
+        states   = [None] * len(trieEdges)
+        stack    = [(0, False)]
+        while stack:
+            node, childrenDone = stack.pop()
+            if not childrenDone:
+                stack.append((node, True))
+                stack.extend((child, False) for child in trieEdges[node].values())
+                continue
+            outputs = tuple(sorted(trieOutputs[node]))
+            if outputs:
+                if outputs not in setIndex:
+                    setIndex[outputs] = len(self.outputSets)
+                    self.outputSets.append(outputs)
+                final = setIndex[outputs]
+            else:
+                final = -1
+            transitions = tuple(sorted((char, states[child]) for char, child in trieEdges[node].items()))
+            signature = (final, transitions)
+            state = register.get(signature)
+            if state is None:
+                state = len(self.edges)
+                register[signature] = state
+                self.finals.append(final)
+                self.edges.append(dict(transitions))
+            states[node] = state
+        return states[0]
+
+    # Returns the list of (target, category, tag) for a key
+    def lookup(self, key):
+        state = self.start
+        edges = self.edges
+        for char in key:
+            state = edges[state].get(char)
+            if state is None:
+                return []
+        final = self.finals[state]
+        if final < 0:
+            return []
+        length = len(key)
+        results = []
+        for index in self.outputSets[final]:
+            strip, append, category, tag = self.outputs[index]
+            results.append((key[:length-strip] + append, category, tag))
+        return results
+
+    # Returns the number of states in the automaton
+    def getNumStates(self):
+        return len(self.edges)
+
+    # Returns the transducer as a dictionary that can be saved as json
+    def toDict(self):
+        states = []
+        for final, edges in zip(self.finals, self.edges):
+            states.append([final, ''.join(edges.keys()), list(edges.values())])
+        return {'outputs': self.outputs, 'outputSets': self.outputSets, 'start': self.start, 'states': states}
+
+    # Creates a transducer from a dictionary made by toDict
+    @classmethod
+    def fromDict(cls, data):
+        transducer = cls()
+        transducer.outputs    = [tuple(output) for output in data['outputs']]
+        transducer.outputSets = [tuple(outputSet) for outputSet in data['outputSets']]
+        transducer.start      = data['start']
+        for final, chars, targets in data['states']:
+            transducer.finals.append(final)
+            transducer.edges.append(dict(zip(chars, targets)))
+        return transducer
+
+
+# A compiled morphology for the words of a lexicon. The inflected forms of
+# every noun, verb, adjective and adverb are made by MorphologyRules (so the
+# lexicon's irregular forms and inflection patterns are used, exactly as
+# when realising the word) and compiled into two transducers: one from
+# lemmas to their inflected forms and one from forms back to their lemmas.
+# The result can be saved to a compressed file and loaded again, which is
+# much faster than rebuilding it.
+class MorphologyFST(object):
+    FORMAT  = 'simplenlg-morphology-fst'
+    VERSION = 1
+    # {category: (handler, [(tag, {feature: value})])} the inflections made for each category
+    INFLECTIONS = {
+        LexicalCategory.NOUN:      (MorphologyRules.doNounMorphology,
+                                    [(LexicalFeature.PLURAL,             {Feature.NUMBER: NumberAgreement.PLURAL})]),
+        LexicalCategory.VERB:      (MorphologyRules.doVerbMorphology,
+                                    [(LexicalFeature.PRESENT3S,          {}),
+                                     (LexicalFeature.PAST,               {Feature.TENSE: Tense.PAST}),
+                                     (LexicalFeature.PAST_PARTICIPLE,    {Feature.FORM: Form.PAST_PARTICIPLE}),
+                                     (LexicalFeature.PRESENT_PARTICIPLE, {Feature.FORM: Form.PRESENT_PARTICIPLE})]),
+        LexicalCategory.ADJECTIVE: (MorphologyRules.doAdjectiveMorphology,
+                                    [(LexicalFeature.COMPARATIVE,        {Feature.IS_COMPARATIVE: True}),
+                                     (LexicalFeature.SUPERLATIVE,        {Feature.IS_SUPERLATIVE: True})]),
+        LexicalCategory.ADVERB:    (MorphologyRules.doAdverbMorphology,
+                                    [(LexicalFeature.COMPARATIVE,        {Feature.IS_COMPARATIVE: True}),
+                                     (LexicalFeature.SUPERLATIVE,        {Feature.IS_SUPERLATIVE: True})]) }
+
+    def __init__(self, generator, analyser):
+        self.generator = generator  # Transducer from lemmas to inflected forms
+        self.analyser  = analyser   # Transducer from forms (including lemmas) to lemmas
+
+    # Compiles the morphology of all the words in a lexicon
+    @classmethod
+    def fromLexicon(cls, lexicon):
+        generated = set()
+        analysed  = set()
+        for word in lexicon.words:
+            lemma    = word.getBaseForm()
+            category = word.getCategory()
+            if not lemma or not isinstance(category, LexicalCategory):
+                continue
+            analysed.add((lemma, lemma, category.name, LexicalFeature.BASE_FORM))
+            for tag, form in cls.getWordForms(word):
+                generated.add((lemma, form, category.name, tag))
+                analysed.add((form, lemma, category.name, tag))
+        return cls(Transducer.build(sorted(generated)), Transducer.build(sorted(analysed)))
+
+    # Returns the list of (tag, form) for the inflections of a WordElement
+    @classmethod
+    def getWordForms(cls, word):
+        entry = cls.INFLECTIONS.get(word.getCategory())
+        if entry is None:
+            return []
+        handler, inflections = entry
+        forms = []
+        for tag, features in inflections:
+            # the inflected word inherits all features from the base word, as in the syntax processor
+            element = InflectedWordElement(word)
+            for feature in word.getAllFeatureNames():
+                element.setFeature(feature, word.getFeature(feature))
+            for feature, value in features.items():
+                element.setFeature(feature, value)
+            form = handler(element, word).getRealisation()
+            if form:
+                forms.append((tag, form))
+        return forms
+
+    # Returns a list of (lemma, category, tag) for every reading of a word form.
+    # The tag is the LexicalFeature of the inflection (eg, LexicalFeature.PAST),
+    # or LexicalFeature.BASE_FORM if the form is the lemma itself.
+    def analyse(self, form):
+        return [(lemma, LexicalCategory[category], tag) for lemma, category, tag in self.analyser.lookup(form)]
+
+    # Returns a list of (category, tag, form) for the inflections of a lemma,
+    # optionally only those of one category.
+    def getForms(self, lemma, category=None):
+        forms = []
+        for form, categoryName, tag in self.generator.lookup(lemma):
+            formCategory = LexicalCategory[categoryName]
+            if category is None or category == formCategory:
+                forms.append((formCategory, tag, form))
+        return forms
+
+    # Returns the form of a lemma for the inflection tag (eg, LexicalFeature.PLURAL),
+    # or None if the lemma isn't in the lexicon.
+    def generate(self, lemma, category, tag):
+        for formCategory, formTag, form in self.getForms(lemma, category):
+            if formTag == tag:
+                return form
+        return None
+
+    # Saves the compiled morphology to a gzipped json file
+    def save(self, filename):
+        data = {'format':    self.FORMAT,
+                'version':   self.VERSION,
+                'generator': self.generator.toDict(),
+                'analyser':  self.analyser.toDict()}
+        with gzip.open(filename, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    # Loads a compiled morphology saved by save()
+    @classmethod
+    def load(cls, filename):
+        with gzip.open(filename, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != cls.FORMAT or data.get('version') != cls.VERSION:
+            raise ValueError('Not a compiled morphology file: ' + str(filename))
+        return cls(Transducer.fromDict(data['generator']), Transducer.fromDict(data['analyser']))
@@ -19,6 +19,7 @@
 from ...features.DiscourseFunction          import *
 from ...features.Feature                    import *
 from ...features.InternalFeature            import *
+from ...features.LexicalFeature             import *
 from ...framework.CoordinatedPhraseElement  import *
 from ...framework.DocumentElement           import *
 from ...framework.InflectedWordElement      import *
@@ -27,14 +28,118 @@ from ...framework.ListElement               import *
 from ...framework.NLGElement                import *
 from ...framework.NLGModule                 import *
 from ...framework.StringElement             import *
+from ...framework.TreeWalker                import *
 from ...framework.WordElement               import *
 from .MorphologyRules                       import *
 
 
 # This is the processor for handling morphology within the SimpleNLG.
 class MorphologyProcessor(NLGModule):
+    DEFAULT_CACHE_SIZE = 4096
+    # The features of the element and of its base word that the inflection
+    # of each category depends on.
+    NOUN_FEATURES      = ([Feature.NUMBER, LexicalFeature.PROPER, LexicalFeature.DEFAULT_INFL, \
+                           LexicalFeature.PLURAL, Feature.POSSESSIVE], \
+                          [LexicalFeature.DEFAULT_INFL, LexicalFeature.PLURAL])
+    VERB_FEATURES      = ([Feature.NUMBER, Feature.PERSON, Feature.TENSE, Feature.FORM, \
+                           LexicalFeature.DEFAULT_INFL, Feature.NEGATED, LexicalFeature.PRESENT_PARTICIPLE, \
+                           LexicalFeature.PAST_PARTICIPLE, LexicalFeature.PAST, LexicalFeature.PRESENT3S], \
+                          [LexicalFeature.PRESENT_PARTICIPLE, LexicalFeature.PAST_PARTICIPLE, \
+                           LexicalFeature.PAST, LexicalFeature.PRESENT3S])
+    ADJECTIVE_FEATURES = ([Feature.IS_COMPARATIVE, Feature.IS_SUPERLATIVE, LexicalFeature.DEFAULT_INFL, \
+                           LexicalFeature.COMPARATIVE, LexicalFeature.SUPERLATIVE], \
+                          [LexicalFeature.COMPARATIVE, LexicalFeature.SUPERLATIVE])
+    ADVERB_FEATURES    = ([Feature.IS_COMPARATIVE, Feature.IS_SUPERLATIVE, \
+                           LexicalFeature.COMPARATIVE, LexicalFeature.SUPERLATIVE], \
+                          [LexicalFeature.COMPARATIVE, LexicalFeature.SUPERLATIVE])
+
     def __init__(self):
         super().__init__()
+        self.elementHandlers  = {}  # {class: (bool, handler)} see registerElementHandler
+        self.resolvedHandlers = {}  # {class: (bool, handler)} handler found for each class of element
+        self.categoryHandlers = {}  # {category: handler} see registerCategoryHandler
+        self.cacheFeatures    = {}  # {category: (element features, base word features)} for cached categories
+        self.cache            = {}  # {key: realisation} oldest first, see doCachedMorphology
+        self.cacheSize        = self.DEFAULT_CACHE_SIZE
+        self.cacheLexiconVersion = None
+        self.cacheHits        = 0
+        self.cacheMisses      = 0
+        self.registerElementHandler(InflectedWordElement, MorphologyProcessor.doMorphology)
+        self.registerElementHandler(StringElement, MorphologyProcessor.realiseStringElement)
+        self.registerElementHandler(WordElement, MorphologyProcessor.realiseWordElement)
+        self.registerElementHandler(DocumentElement, MorphologyProcessor.realiseDocumentElement, True)
+        self.registerElementHandler(ListElement, MorphologyProcessor.realiseListElement, True)
+        self.registerElementHandler(CoordinatedPhraseElement, \
+                MorphologyProcessor.realiseCoordinatedPhraseElement, True)
+        self.registerCategoryHandler(LexicalCategory.PRONOUN, MorphologyProcessor.doPronounMorphology)
+        self.registerCategoryHandler(LexicalCategory.NOUN, MorphologyRules.doNounMorphology, \
+                self.NOUN_FEATURES)
+        self.registerCategoryHandler(LexicalCategory.VERB, MorphologyRules.doVerbMorphology, \
+                self.VERB_FEATURES)
+        self.registerCategoryHandler(LexicalCategory.ADJECTIVE, MorphologyRules.doAdjectiveMorphology, \
+                self.ADJECTIVE_FEATURES)
+        self.registerCategoryHandler(LexicalCategory.ADVERB, MorphologyRules.doAdverbMorphology, \
+                self.ADVERB_FEATURES)
+
+    # Sets the function that realises a class of element (and its subclasses,
+    # unless they have their own). It is called as handler(processor, element)
+    # and returns the realised element. If realiseChildren is True, the
+    # element's children are realised first and passed as a third argument.
+    # Elements of a class with no handler are realised as None.
+    def registerElementHandler(self, elementClass, handler, realiseChildren=False):
+        self.elementHandlers[elementClass] = (realiseChildren, handler)
+        self.resolvedHandlers = {}
+
+    # Sets the function that inflects words of a lexical category. It is
+    # called as handler(element, baseWord) and returns the inflected word.
+    # If cacheFeatures is given, the results are cached. It is a pair of lists
+    # of the element features and of the base word features that the result
+    # depends on, and the handler must return a StringElement with only the
+    # element's discourse function set.
+    def registerCategoryHandler(self, category, handler, cacheFeatures=None):
+        self.categoryHandlers[category] = handler
+        if cacheFeatures is None:
+            self.cacheFeatures.pop(category, None)
+        else:
+            self.cacheFeatures[category] = cacheFeatures
+        self.clearCache()
+
+    # Sets the maximum number of inflected words to cache. 0 disables the cache.
+    def setCacheSize(self, size):
+        self.cacheSize = size
+        self.clearCache()
+
+    # Empties the cache of inflected words
+    def clearCache(self):
+        self.cache = {}
+        self.cacheLexiconVersion = None
+
+    # Returns the cache statistics as a dictionary
+    def getCacheStats(self):
+        lookups = self.cacheHits + self.cacheMisses
+        return {'hits':    self.cacheHits,
+                'misses':  self.cacheMisses,
+                'hitRate': self.cacheHits / lookups if lookups else 0.0,
+                'size':    len(self.cache),
+                'maxSize': self.cacheSize}
+
+    # @Override
+    def setLexicon(self, newLexicon):
+        super().setLexicon(newLexicon)
+        self.clearCache()
+
+    # Returns (realiseChildren, handler) for a class of element, using the
+    # handler of the nearest registered base class.
+    def getElementHandler(self, elementClass):
+        entry = self.resolvedHandlers.get(elementClass)
+        if entry is None:
+            entry = (False, None)
+            for baseClass in elementClass.__mro__:
+                if baseClass in self.elementHandlers:
+                    entry = self.elementHandlers[baseClass]
+                    break
+            self.resolvedHandlers[elementClass] = entry
+        return entry
 
     # @Override
     def initialise(self):
@@ -50,39 +155,67 @@ class MorphologyProcessor(NLGModule):
 
     # @Override
     def _realiseElement(self, element):
+        return TreeWalker.walk(self, element)
+
+    # TreeWalker visitor method. Returns the children that must be realised
+    # before this element, or None if it is realised on its own.
+    def enterElement(self, element):
+        realiseChildren, handler = self.getElementHandler(type(element))
+        if realiseChildren:
+            return element.getChildren()
+        return None
+
+    # TreeWalker visitor method
+    def beforeChild(self, element, child, index):
+        pass
+
+    # TreeWalker visitor method. Realises the element from its realised children.
+    def leaveElement(self, element, children, realisedChildren):
+        realiseChildren, handler = self.getElementHandler(type(element))
+        if handler is None:
+            return None
+        elif realiseChildren:
+            return handler(self, element, realisedChildren)
+        return handler(self, element)
+
+    # Realises a string element, which is already realised.
+    def realiseStringElement(self, element):
+        return element
+
+    # Realises a word element as its spelling.
+    def realiseWordElement(self, element):
+        # AG: now retrieves the default spelling variant, not the baseform
+        # String baseForm = ((WordElement) element).getBaseForm();
+        defaultSpell = element.getDefaultSpellingVariant()
+        if defaultSpell is not None:
+            return StringElement(defaultSpell)
+        return None
+
+    # Realises a document element from its realised components.
+    def realiseDocumentElement(self, element, realisedChildren):
+        element.setComponents(self.combineRealisedList(element.getChildren(), realisedChildren))
+        return element
+
+    # Realises a list element from its realised components.
+    def realiseListElement(self, element, realisedChildren):
+        realisedElement = ListElement()
+        realisedElement.addComponents(self.combineRealisedList(element.getChildren(), realisedChildren))
+        return realisedElement
+
+    # Realises a coordinated phrase from its realised coordinates.
+    def realiseCoordinatedPhraseElement(self, element, realisedChildren):
         realisedElement = None
-        if isinstance(element, InflectedWordElement):
-            realisedElement = self.doMorphology(element)
-        elif isinstance(element, StringElement):
-            realisedElement = element
-        elif isinstance(element, WordElement):
-            # AG: now retrieves the default spelling variant, not the baseform
-            # String baseForm = ((WordElement) element).getBaseForm();
-            defaultSpell = element.getDefaultSpellingVariant()
-            if defaultSpell is not None:
-                realisedElement = StringElement(defaultSpell)
-        elif isinstance(element, DocumentElement):
-            children = element.getChildren()
-            element.setComponents(self.realise(children))
-            realisedElement = element
-        elif isinstance(element, ListElement):
-            realisedElement = ListElement()
-            realisedElement.addComponents(self.realise(element.getChildren()))
-        elif isinstance(element, CoordinatedPhraseElement):
-            children = element.getChildren()
-            element.clearCoordinates()
-            if children:
-                element.addCoordinate(self.realise(children[0]))
-                for i, child in enumerate(children):
-                    if 0==i: continue
-                    element.addCoordinate(self.realise(child))
-                realisedElement = element
-        elif element is None:
+        children = element.getChildren()
+        element.clearCoordinates()
+        if children:
+            for realisedChild in realisedChildren:
+                element.addCoordinate(realisedChild)
             realisedElement = element
         return realisedElement
 
-    # This is the main method for performing the morphology.
-    def doMorphology(self, element):
+    # This is the main method for performing the morphology. If useCache is
+    # False, the cache of inflected words is bypassed.
+    def doMorphology(self, element, useCache=True):
         realisedElement = None
         if element.getFeatureAsBoolean(InternalFeature.NON_MORPH):
             realisedElement = StringElement(element.getBaseForm())
@@ -90,67 +223,146 @@ class MorphologyProcessor(NLGModule):
                     element.getFeature(InternalFeature.DISCOURSE_FUNCTION))
         else:
             baseWord = element.getFeatureAsElement(InternalFeature.BASE_WORD)
-            if baseWord is None and self.lexicon is not None:
-                baseWord = self.lexicon.lookupWord(element.getBaseForm())
             category = element.getCategory()
-            if isinstance(category, LexicalCategory):
-                if category == LexicalCategory.PRONOUN:
-                    realisedElement = MorphologyRules.doPronounMorphology(element)
-                elif category == LexicalCategory.NOUN:
-                    realisedElement = MorphologyRules.doNounMorphology(element, baseWord)
-                elif category == LexicalCategory.VERB:
-                    realisedElement = MorphologyRules.doVerbMorphology(element, baseWord)
-                elif category == LexicalCategory.ADJECTIVE:
-                    realisedElement = MorphologyRules.doAdjectiveMorphology(element, baseWord)
-                elif category == LexicalCategory.ADVERB:
-                    realisedElement = MorphologyRules.doAdverbMorphology(element, baseWord)
-                else:
-                    realisedElement = StringElement(element.getBaseForm())
-                    realisedElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, \
-                        element.getFeature(InternalFeature.DISCOURSE_FUNCTION))
+            handler = self.categoryHandlers.get(category)
+            cacheFeatures = self.cacheFeatures.get(category)
+            if handler is not None and cacheFeatures is not None and useCache and self.cacheSize > 0:
+                realisedElement = self.doCachedMorphology(element, baseWord, handler, cacheFeatures)
+            elif handler is not None:
+                if baseWord is None and self.lexicon is not None:
+                    baseWord = self.lexicon.lookupWord(element.getBaseForm())
+                realisedElement = handler(element, baseWord)
+            elif isinstance(category, LexicalCategory):
+                # only the category handlers use the base word, so don't look it up
+                realisedElement = StringElement(element.getBaseForm())
+                realisedElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, \
+                    element.getFeature(InternalFeature.DISCOURSE_FUNCTION))
+        return realisedElement
+
+    # Runs a category handler through the cache. The key is the element's
+    # category and base form, the values of the features the handler depends
+    # on and, if the element has one, the lexicon ID and features of its base
+    # word (these are usually copies of the lexicon entry, so the ID is used
+    # rather than object identity). If the element has no base word, it is
+    # only looked up in the lexicon on a miss, and the cache is emptied when
+    # the lexicon changes.
+    def doCachedMorphology(self, element, baseWord, handler, cacheFeatures):
+        elementFeatures, wordFeatures = cacheFeatures
+        lexicon = self.lexicon
+        if lexicon is not None and lexicon.getVersion() != self.cacheLexiconVersion:
+            self.clearCache()
+            self.cacheLexiconVersion = lexicon.getVersion()
+        key = [element.getCategory(), element.getBaseForm()]
+        key.extend(map(element.features.get, elementFeatures))
+        if isinstance(baseWord, WordElement):
+            key.append(baseWord.getId())
+            key.extend(map(baseWord.features.get, wordFeatures))
+            key.append(baseWord.getDefaultSpellingVariant())
+        elif baseWord is not None:
+            return handler(element, baseWord)
+        key = tuple(key)
+        try:
+            realisation = self.cache.get(key, self.cache)   # the cache itself marks a miss
+        except TypeError:   # unhashable feature value
+            key, realisation = None, self.cache
+        if realisation is not self.cache:
+            self.cacheHits += 1
+            realisedElement = StringElement(realisation)
+            realisedElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, \
+                    element.getFeature(InternalFeature.DISCOURSE_FUNCTION))
+            return realisedElement
+        if baseWord is None and lexicon is not None:
+            baseWord = lexicon.lookupWord(element.getBaseForm())
+        realisedElement = handler(element, baseWord)
+        if key is not None:
+            self.cacheMisses += 1
+            if len(self.cache) >= self.cacheSize:
+                del self.cache[next(iter(self.cache))]  # drop the oldest entry
+            self.cache[key] = realisedElement.getRealisation()
         return realisedElement
 
+    # Inflects many words of one category with the same features, eg. to
+    # pluralise a column of nouns for a table. words can be any iterable of
+    # strings, such as a list or a numpy array, and features is a dictionary
+    # of feature names and values. Each distinct word is looked up in the
+    # lexicon and inflected only once. Returns the list of inflected forms,
+    # in the same order as words.
+    def inflectMany(self, words, category, features=None):
+        if not isinstance(words, (list, tuple)):
+            words = list(words)
+        forms = dict.fromkeys(words)
+        baseWords = {}
+        if self.lexicon is not None:
+            baseWords = self.lexicon.lookupWordEntries([str(word) for word in forms], category)
+        for word in forms:
+            element = InflectedWordElement(str(word), category)
+            if features:
+                for feature, value in features.items():
+                    element.setFeature(feature, value)
+            baseWord = baseWords.get(element.getBaseForm())
+            if baseWord is not None:
+                element.setBaseWord(baseWord)
+            realised = self.doMorphology(element, False)  # each word is only inflected once anyway
+            if realised is not None:
+                forms[word] = realised.getRealisation()
+        return [forms[word] for word in words]
+
+    # Category handler for pronouns, which don't use the base word.
+    @staticmethod
+    def doPronounMorphology(element, baseWord):
+        return MorphologyRules.doPronounMorphology(element)
+
     # @Override
     def _realiseList(self, elements):
         realisedElements = []
-        currentElement = None
+        if elements is not None:
+            realisedElements = [self._realiseElement(eachElement) for eachElement in elements]
+        return self.combineRealisedList(elements, realisedElements)
+
+    # Combines a list of elements that have each been realised.  This passes
+    # features on to the realised elements and makes determiners agree with
+    # what follows them. It is a single pass over the realised elements: a
+    # specifier waits for the next realised element and agrees with its
+    # first word, and canned text ending in "a" agrees with a following noun.
+    def combineRealisedList(self, elements, realisedList):
+        realisedElements = []
+        if elements is None:
+            return realisedElements
         determiner = None
         prevElement = None
-        if elements is not None:
-            for eachElement in elements:
-                currentElement = self._realiseElement(eachElement)
-                if currentElement is not None:
-                    #pass the discourse function and appositive features -- important for orth processor
-                    currentElement.setFeature(Feature.APPOSITIVE, eachElement.getFeature(Feature.APPOSITIVE))
-                    function = eachElement.getFeature(InternalFeature.DISCOURSE_FUNCTION)
-                    if function is not None:
-                        currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, function)
-                    if prevElement is not None and isinstance(prevElement, StringElement) and \
-                            isinstance(eachElement, InflectedWordElement) and \
-                            eachElement.getCategory() == LexicalCategory.NOUN:
-                        prevString = prevElement.getRealisation()
-                        prevElement.setRealisation(DeterminerAgrHelper.checkEndsWithIndefiniteArticle(\
-                                prevString,currentElement.getRealisation()))
-                    realisedElements.append(currentElement)
-                    if determiner is None and DiscourseFunction.SPECIFIER == \
-                            currentElement.getFeature(InternalFeature.DISCOURSE_FUNCTION):
-                        determiner = currentElement
-                        determiner.setFeature(Feature.NUMBER, eachElement.getFeature(Feature.NUMBER))
-                    elif determiner is not None:
-                        if isinstance(currentElement, ListElement):
-                            # list elements: ensure det matches first element
-                            children = currentElement.getChildren()
-                            firstChild = None if not children else children[0]
-                            if firstChild is not None:
-                                #AG: need to check if child is a coordinate
-                                if isinstance(firstChild, CoordinatedPhraseElement):
-                                    MorphologyRules.doDeterminerMorphology(determiner, \
-                                        firstChild.getChildren()[0].getRealisation())
-                                else:
-                                    MorphologyRules.doDeterminerMorphology(determiner, firstChild.getRealisation())
-                        else:
-                            # everything else: ensure det matches realisation
-                            MorphologyRules.doDeterminerMorphology(determiner, currentElement.getRealisation())
-                        determiner = None
-                prevElement = eachElement
+        for eachElement, currentElement in zip(elements, realisedList):
+            if currentElement is not None:
+                #pass the discourse function and appositive features -- important for orth processor
+                currentElement.setFeature(Feature.APPOSITIVE, eachElement.getFeature(Feature.APPOSITIVE))
+                function = eachElement.getFeature(InternalFeature.DISCOURSE_FUNCTION)
+                if function is not None:
+                    currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, function)
+                if isinstance(prevElement, StringElement) and isinstance(eachElement, InflectedWordElement) \
+                        and eachElement.getCategory() == LexicalCategory.NOUN:
+                    prevElement.setRealisation(DeterminerAgrHelper.checkEndsWithIndefiniteArticle(\
+                            prevElement.getRealisation(), currentElement.getRealisation()))
+                realisedElements.append(currentElement)
+                if determiner is not None:
+                    MorphologyRules.doDeterminerMorphology(determiner, self.getLeadingRealisation(currentElement))
+                    determiner = None
+                elif DiscourseFunction.SPECIFIER == currentElement.getFeature(InternalFeature.DISCOURSE_FUNCTION):
+                    determiner = currentElement
+                    determiner.setFeature(Feature.NUMBER, eachElement.getFeature(Feature.NUMBER))
+            prevElement = eachElement
         return realisedElements
+
+    # Returns the realisation that a determiner before the element agrees
+    # with. For a list this is the first item or, if that is a coordinated
+    # phrase, its first coordinate.
+    @staticmethod
+    def getLeadingRealisation(element):
+        if not isinstance(element, ListElement):
+            return element.getRealisation()
+        children = element.getChildren()
+        if not children:
+            return None
+        firstChild = children[0]
+        #AG: need to check if child is a coordinate
+        if isinstance(firstChild, CoordinatedPhraseElement):
+            return firstChild.getChildren()[0].getRealisation()
+        return firstChild.getRealisation()
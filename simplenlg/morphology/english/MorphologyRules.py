@@ -16,7 +16,6 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
-import re
 from ...features.DiscourseFunction      import *
 from ...features.Feature                import *
 from ...features.Form                   import *
@@ -30,6 +29,7 @@ from ...features.Tense                  import *
 from ...framework.LexicalCategory       import *
 from ...framework.StringElement         import *
 from .DeterminerAgrHelper               import *
+from .SuffixRules                       import *
 
 
 # This contains a number of rules for doing simple inflection.
@@ -48,6 +48,47 @@ class MorphologyRules(object):
                    [ "our", "your", "their", "their", "their" ] ] ]
     WH_PRONOUNS = [ "who", "what", "which", "where", "why", "how", "how many" ]
 
+    # Suffix rules for regular inflection, tested in order. Rules marked
+    # singleLine and rewriteAll reproduce the regular expressions these
+    # builders used originally, ie. re.fullmatch(r".*[^aeiou]y\b") followed
+    # by re.sub(r"y\b", ...).
+    VOWELS = 'aeiou'
+    REGULAR_PLURAL_RULES = SuffixRules([
+        SuffixRule('y', 'ies', notAfter=VOWELS, singleLine=True, rewriteAll=True),
+        SuffixRule(('s', 'z', 'x', 'ch', 'sh'), 'es', singleLine=True),
+        SuffixRule('', 's') ])
+    GRECO_LATIN_PLURAL_RULES = SuffixRules([
+        SuffixRule('us', 'i', rewriteAll=True),
+        SuffixRule('ma', 'ta'),
+        SuffixRule('a', 'e'),
+        SuffixRule(('um', 'on'), 'a', singleLine=True, rewriteAll=True),
+        SuffixRule('sis', 'ses', rewriteAll=True),
+        SuffixRule('is', 'ides', rewriteAll=True),
+        SuffixRule('men', 'mina', rewriteAll=True),
+        SuffixRule('ex', 'ices', rewriteAll=True),
+        SuffixRule('x', 'ces', rewriteAll=True),
+        SuffixRule('', '') ])
+    PRESENT3S_RULES = SuffixRules([
+        SuffixRule(('s', 'z', 'x', 'c', 'h'), 'es', singleLine=True),
+        SuffixRule('y', 'ies', notAfter=VOWELS, singleLine=True, rewriteAll=True),
+        SuffixRule('', 's') ])
+    PAST_RULES = SuffixRules([
+        SuffixRule('e', 'd'),
+        SuffixRule('y', 'ied', notAfter=VOWELS, singleLine=True, rewriteAll=True),
+        SuffixRule('', 'ed') ])
+    PRESENT_PARTICIPLE_RULES = SuffixRules([
+        SuffixRule('ie', 'ying', rewriteAll=True),
+        SuffixRule('e', 'ing', notAfter='iyeo', singleLine=True, rewriteAll=True),
+        SuffixRule('', 'ing') ])
+    COMPARATIVE_RULES = SuffixRules([
+        SuffixRule('y', 'ier', notAfter=VOWELS, singleLine=True, rewriteAll=True),
+        SuffixRule('e', 'r'),
+        SuffixRule('', 'er') ])
+    SUPERLATIVE_RULES = SuffixRules([
+        SuffixRule('y', 'iest', notAfter=VOWELS, singleLine=True, rewriteAll=True),
+        SuffixRule('e', 'st'),
+        SuffixRule('', 'est') ])
+
     # This method performs the morphology for nouns.
     @classmethod
     def doNounMorphology(cls, element, baseWord):
@@ -85,42 +126,16 @@ class MorphologyRules(object):
     # Builds a plural for regular nouns. The rules are performed in this order:
     @classmethod
     def buildRegularPluralNoun(cls, baseForm):
-        plural = None
-        if baseForm is not None:
-            if re.fullmatch(r".*[^aeiou]y\b", baseForm):
-                plural = re.sub(r"y\b", "ies", baseForm)
-            elif re.fullmatch(r".*([szx]|[cs]h)\b", baseForm):
-                plural = baseForm + "es"
-            else:
-                plural = baseForm + "s"
-        return plural
+        if baseForm is None:
+            return None
+        return cls.REGULAR_PLURAL_RULES.inflect(baseForm)
 
     # Builds a plural for Greco-Latin regular nouns.
     @classmethod
     def buildGrecoLatinPluralNoun(cls, baseForm):
         if not baseForm:
             return None
-        if baseForm.endswith("us"):
-            plural = re.sub(r"us\b", "i", baseForm)
-        elif baseForm.endswith("ma"):
-            plural = baseForm + "ta"
-        elif baseForm.endswith("a"):
-            plural = baseForm + "e"
-        elif re.fullmatch(r".*(um|on)\b", baseForm):
-            plural = re.sub(r"(um|on)\b",  "a", baseForm)
-        elif baseForm.endswith("sis"):
-            plural = re.sub(r"sis\b", "ses", baseForm)
-        elif baseForm.endswith("is"):
-            plural = re.sub(r"is\b", "ides", baseForm)
-        elif baseForm.endswith("men"):
-            plural = re.sub(r"men\b", "mina", baseForm)
-        elif baseForm.endswith("ex"):
-            plural = re.sub(r"ex\b", "ices", baseForm)
-        elif baseForm.endswith("x"):
-            plural = re.sub(r"x\b", "ces", baseForm)
-        else:
-            plural = baseForm
-        return plural
+        return cls.GRECO_LATIN_PLURAL_RULES.inflect(baseForm)
 
     # This method performs the morphology for verbs.
     @classmethod
@@ -233,12 +248,8 @@ class MorphologyRules(object):
         if baseForm is not None:
             if baseForm.lower() == "be":
                 morphology = "is"
-            elif re.fullmatch(r".*[szx(ch)(sh)]\b", baseForm):
-                morphology = baseForm + "es"
-            elif re.fullmatch(r".*[^aeiou]y\b", baseForm):
-                morphology = re.sub(r"y\b", "ies", baseForm)
             else:
-                morphology = baseForm + "s"
+                morphology = cls.PRESENT3S_RULES.inflect(baseForm)
         return morphology
 
     # Builds the past-tense form for regular verbs. The rules are performed in
@@ -254,12 +265,8 @@ class MorphologyRules(object):
                     morphology = "were"
                 else:
                     morphology = "was"
-            elif baseForm.endswith("e"):
-                morphology = baseForm + "d"
-            elif re.fullmatch(r".*[^aeiou]y\b",  baseForm):
-                morphology = re.sub(r"y\b", "ied", baseForm)
             else:
-                morphology = baseForm + "ed"
+                morphology = cls.PAST_RULES.inflect(baseForm)
         return morphology
 
     # Builds the past-tense form for verbs that follow the doubling form of the
@@ -280,12 +287,8 @@ class MorphologyRules(object):
         if baseForm is not None:
             if baseForm.lower() == "be":
                 morphology = "being"
-            elif baseForm.endswith("ie"):
-                morphology = re.sub(r"ie\b", "ying", baseForm)
-            elif re.fullmatch(r".*[^iyeo]e\b", baseForm):
-                morphology = re.sub(r"e\b", "ing", baseForm)
             else:
-                morphology = baseForm + "ing"
+                morphology = cls.PRESENT_PARTICIPLE_RULES.inflect(baseForm)
         return morphology
 
     # Builds the present participle form for verbs that follow the doubling
@@ -347,12 +350,7 @@ class MorphologyRules(object):
     def buildRegularComparative(cls, baseForm):
         morphology = None
         if baseForm is not None:
-            if re.fullmatch(r".*[^aeiou]y\b", baseForm):
-                morphology = re.sub(r"y\b", "ier", baseForm)
-            elif baseForm.endswith("e"):
-                morphology = baseForm + "r"
-            else:
-                morphology = baseForm + "er"
+            morphology = cls.COMPARATIVE_RULES.inflect(baseForm)
         return morphology
 
     # Builds the superlative form for adjectives that follow the doubling form
@@ -370,12 +368,7 @@ class MorphologyRules(object):
     def buildRegularSuperlative(cls, baseForm):
         morphology = None
         if baseForm is not None:
-            if re.fullmatch(r".*[^aeiou]y\b", baseForm):
-                morphology = re.sub(r"y\b", "iest", baseForm)
-            elif baseForm.endswith("e"):
-                morphology = baseForm + "st"
-            else:
-                morphology = baseForm + "est"
+            morphology = cls.SUPERLATIVE_RULES.inflect(baseForm)
         return morphology
 
     # This method performs the morphology for adverbs.
@@ -0,0 +1,104 @@
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+
+# A single suffix test and rewrite used for regular inflection.
+# The rule matches a word that ends with one of its endings. If notAfter is
+# given, the ending must also be preceded by a character that is not in it.
+# If singleLine is set, the rest of the word before the tested part must not
+# contain a newline (this mirrors the ".*" of a fullmatch pattern).
+# A matching word is inflected either by appending the replacement or, when
+# rewriteAll is set, by replacing every occurrence of an ending that sits at
+# the end of a word (ie, the behaviour of re.sub(ending + r"\b", ...)), so
+# that "cactus virus" becomes "cacti viri".
+class SuffixRule(object):
+    def __init__(self, endings, replacement, notAfter=None, singleLine=False, rewriteAll=False):
+        if isinstance(endings, str):
+            endings = (endings,)
+        self.endings     = tuple(endings)
+        self.replacement = replacement
+        self.notAfter    = notAfter
+        self.singleLine  = singleLine
+        self.rewriteAll  = rewriteAll
+
+    # Returns the ending that matched the word, or None if the rule does not apply
+    def match(self, word):
+        for ending in self.endings:
+            if not word.endswith(ending):
+                continue
+            start = len(word) - len(ending)
+            if self.notAfter is not None:
+                if start == 0 or word[start-1] in self.notAfter:
+                    continue
+                start -= 1
+            if self.singleLine and word.find('\n', 0, start) >= 0:
+                continue
+            return ending
+        return None
+
+    # Returns the inflected word, given the ending returned by match()
+    def apply(self, word, ending):
+        if not self.rewriteAll:
+            return word + self.replacement
+        # a word with only word characters can only have a boundary at its end
+        if word.isalnum():
+            return word[:len(word)-len(ending)] + self.replacement
+        parts  = []
+        length = len(word)
+        start  = 0
+        i      = 0
+        while i < length:
+            for token in self.endings:
+                end = i + len(token)
+                if word.startswith(token, i) and (end == length or not self.isWordChar(word[end])):
+                    parts.append(word[start:i])
+                    parts.append(self.replacement)
+                    start = i = end
+                    break
+            else:
+                i += 1
+        parts.append(word[start:])
+        return ''.join(parts)
+
+    # Same definition of a word character as \w in a str regex
+    @staticmethod
+    def isWordChar(char):
+        return char.isalnum() or char == '_'
+
+
+# An ordered table of SuffixRules. The first rule that matches a word is used
+# to inflect it. Rules are indexed by the last character of their endings so
+# only the rules that could match are tested.
+class SuffixRules(object):
+    def __init__(self, rules):
+        self.rules        = list(rules)
+        self.defaultRules = [r for r in self.rules if '' in r.endings]
+        lastChars = set(e[-1] for r in self.rules for e in r.endings if e)
+        self.rulesByLastChar = {}
+        for char in lastChars:
+            self.rulesByLastChar[char] = [r for r in self.rules \
+                                          if '' in r.endings or any(e.endswith(char) for e in r.endings if e)]
+
+    # Returns the inflected word, or None if no rule matches
+    def inflect(self, word):
+        rules = self.rulesByLastChar.get(word[-1:], self.defaultRules)
+        for rule in rules:
+            ending = rule.match(word)
+            if ending is not None:
+                return rule.apply(word, ending)
+        return None
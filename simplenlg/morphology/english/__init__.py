@@ -1,3 +1,5 @@
 from .DeterminerAgrHelper       import *
+from .MorphologyFST             import *
 from .MorphologyProcessor       import *
 from .MorphologyRules           import *
+from .SuffixRules               import *
@@ -16,7 +16,6 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
-import re
 from ...features.DiscourseFunction          import *
 from ...features.Feature                    import *
 from ...features.InternalFeature            import *
@@ -27,6 +26,7 @@ from ...framework.ListElement               import *
 from ...framework.NLGElement                import *
 from ...framework.NLGModule                 import *
 from ...framework.StringElement             import *
+from ...framework.TreeWalker                import *
 
 
 # This processing module deals with punctuation when applied to
@@ -69,14 +69,48 @@ class OrthographyProcessor(NLGModule):
         else:
             raise ValueError('Invalid element type: ' + str(type(element)))
 
+    # Realises the element. Punctuation spacing is fixed once, for each
+    # sentence and for the final realisation, rather than at every node.
     def _realiseElement(self, element):
+        realisedElement = TreeWalker.walk(self, element)
+        self.removePunctSpace(realisedElement)
+        return realisedElement
+
+    # TreeWalker visitor method. Returns the children that must be realised
+    # before this element, or None if it is realised on its own.
+    def enterElement(self, element):
+        if element is None:
+            return None
+        category = element.getCategory()
+        if isinstance(category, DocumentCategory) and isinstance(element, DocumentElement):
+            components = element.getComponents()
+            if category == DocumentCategory.SENTENCE:
+                return components
+            # only embedded document elements are realised
+            return [component for component in components if isinstance(component, DocumentElement)]
+        elif isinstance(element, ListElement):
+            return element.getChildren()
+        elif isinstance(element, CoordinatedPhraseElement):
+            # conjunctions that are replaced by commas are not realised
+            components = element.getChildren()
+            length = len(components)
+            return [component for index, component in enumerate(components) if not \
+                    self.isCommaConjunction(component, index, length)]
+        return None
+
+    # TreeWalker visitor method
+    def beforeChild(self, element, child, index):
+        pass
+
+    # TreeWalker visitor method. Realises the element from its realised children.
+    def leaveElement(self, element, children, realisedChildren):
         realisedElement = None
         function = None #the element's discourse function
         #get the element's function first
         if isinstance(element, ListElement):
-            children = element.getChildren()
-            if children:
-                firstChild = children[0]
+            listChildren = element.getChildren()
+            if listChildren:
+                firstChild = listChildren[0]
                 function = firstChild.getFeature(InternalFeature.DISCOURSE_FUNCTION)
         elif element is not None:
             function = element.getFeature(InternalFeature.DISCOURSE_FUNCTION)
@@ -85,58 +119,64 @@ class OrthographyProcessor(NLGModule):
             if isinstance(category, DocumentCategory) and isinstance(element, DocumentElement):
                 components = element.getComponents()
                 if category == DocumentCategory.SENTENCE:
-                    realisedElement = self.realiseSentence(components, element)
+                    realisedElement = self.realiseSentence(realisedChildren, element)
+                    # the embedded document elements have already been realised
+                    realisedChildren = [realisedChild for component, realisedChild in \
+                            zip(components, realisedChildren) if isinstance(component, DocumentElement)]
+                # put the realised document elements back in place
+                realisedChildren = iter(realisedChildren)
+                components = [next(realisedChildren) if isinstance(component, DocumentElement) \
+                              else component for component in components]
                 if category == DocumentCategory.LIST_ITEM:
                     if components:
-                        # recursively realise whatever is in the list item
-                        # NB: this will realise embedded lists within list items
-                        realisedElement = ListElement(self.realise(components))
+                        # NB: this includes embedded lists within list items
+                        realisedElement = ListElement(components)
                         realisedElement.setParent(element.getParent())
                 else:
-                    element.setComponents(self.realise(components))
+                    element.setComponents(components)
                     realisedElement = element
             elif isinstance(element, ListElement):
                 # AG: changes here: if we have a premodifier, then we ask the
-                # realiseList method to separate with a comma.
+                # joinRealisedList method to separate with a comma.
                 # if it's a postmod, we need commas at the start and end only
                 # if it's appositive
-                buffer = ''
+                parts = []
                 if DiscourseFunction.PRE_MODIFIER == function:
                     all_appositives = True
                     for child in element.getChildren():
                         all_appositives = all_appositives and child.getFeatureAsBoolean(Feature.APPOSITIVE)
                     if all_appositives:
-                        buffer += ", "
+                        parts.append(", ")
                     sep = "," if self.commaSepPremodifiers else ''
-                    buffer = self.realiseList(buffer, element.getChildren(), sep)
+                    self.joinRealisedList(parts, realisedChildren, sep)
                     if all_appositives:
-                        buffer += ", "
+                        parts.append(", ")
                 elif DiscourseFunction.POST_MODIFIER == function:
-                    postmods = element.getChildren()
+                    postmods = children
                     # bug fix due to Owen Bennett
                     length = len(postmods)
                     for i in range(length):
                         postmod = postmods[i]
                         # if the postmod is appositive, it's sandwiched in commas
                         if postmod.getFeatureAsBoolean(Feature.APPOSITIVE):
-                            buffer += ", "
-                            buffer += str(self._realiseElement(postmod))
+                            parts.append(", ")
+                            parts.append(str(realisedChildren[i]))
                             if i < length-1:
-                                buffer += ", "
+                                parts.append(", ")
                         else:
-                            buffer += str(self._realiseElement(postmod))
+                            parts.append(str(realisedChildren[i]))
                             if isinstance(postmod, ListElement) or \
                                (postmod.getRealisation() is not None and not postmod.getRealisation()==""):
-                                buffer  += " "
+                                parts.append(" ")
                 elif (DiscourseFunction.CUE_PHRASE==function or DiscourseFunction.FRONT_MODIFIER==function) and \
                     self.commaSepCuephrase:
                     sep = ',' if self.commaSepCuephrase else ''
-                    buffer = self.realiseList(buffer, element.getChildren(), sep)
+                    self.joinRealisedList(parts, realisedChildren, sep)
                 else:
-                    buffer = self.realiseList(buffer, element.getChildren(), "")
-                realisedElement = StringElement(buffer)
+                    self.joinRealisedList(parts, realisedChildren, "")
+                realisedElement = StringElement(''.join(parts))
             elif isinstance(element, CoordinatedPhraseElement):
-                realisedElement = self.realiseCoordinatedPhrase(element.getChildren())
+                realisedElement = self.realiseCoordinatedPhrase(element.getChildren(), realisedChildren)
             else:
                 realisedElement = element
             # make the realised element inherit the original category
@@ -150,8 +190,6 @@ class OrthographyProcessor(NLGModule):
                 if not realisation.endswith(","):
                     realisation = realisation + ","
                 realisedElement.setRealisation(realisation)
-        #remove preceding and trailing whitespace from internal punctuation
-        self.removePunctSpace(realisedElement)
         return realisedElement
 
     # removes extra spaces preceding punctuation from a realised element
@@ -159,17 +197,31 @@ class OrthographyProcessor(NLGModule):
         if realisedElement is not None:
             realisation = realisedElement.getRealisation()
             if realisation is not None:
-                realisation = re.sub(" ,", ",",  realisation)
-                realisation = re.sub(",,+", ",", realisation)
-                realisedElement.setRealisation(realisation)
+                realisedElement.setRealisation(self.normalisePunctuation(realisation))
+
+    # Removes the spaces before commas and merges repeated commas, in one
+    # pass over the realisation.
+    def normalisePunctuation(self, realisation):
+        if ',' not in realisation:
+            return realisation
+        pieces = realisation.split(',')
+        last = len(pieces) - 1
+        normalised = [pieces[0].rstrip(' ')]
+        for i in range(1, last):
+            piece = pieces[i].rstrip(' ')
+            if piece:   # otherwise the commas either side are merged
+                normalised.append(piece)
+        normalised.append(pieces[last])
+        return ','.join(normalised)
 
     # Performs the realisation on a sentence. This includes adding the
     # terminator and capitalising the first letter.
-    def realiseSentence(self, components, element):
+    def realiseSentence(self, realisedComponents, element):
         realisedElement = None
-        if components:
-            realisation = ''
-            realisation = self.realiseList(realisation, components, "")
+        if realisedComponents:
+            parts = []
+            self.joinRealisedList(parts, realisedComponents, "")
+            realisation = self.normalisePunctuation(''.join(parts))
             realisation = self.stripLeadingCommas(realisation)
             realisation = self.capitaliseFirstLetter(realisation)
             realisation = self.terminateSentence(realisation, element.getFeatureAsBoolean(InternalFeature.INTERROGATIVE))
@@ -189,14 +241,12 @@ class OrthographyProcessor(NLGModule):
                 realisation += '.'
         return realisation
 
-    # Remove recursively any leading spaces or commas at the start
-    # of a sentence.
+    # Remove any leading spaces or commas at the start of a sentence.
     def stripLeadingCommas(self, realisation):
-        character = realisation[0]
-        if character == ' ' or character == ',':
-            realisation =  realisation[1:]
-            realisation = self.stripLeadingCommas(realisation)
-        return realisation
+        start = 0
+        while start < len(realisation) and realisation[start] in ' ,':
+            start += 1
+        return realisation[start:]
 
     # Capitalises the first character of a sentence if it is a lower case letter.
     def capitaliseFirstLetter(self, realisation):
@@ -216,36 +266,45 @@ class OrthographyProcessor(NLGModule):
                     realisedList.append(eachElement)
         return realisedList
 
-    # Realises a list of elements appending the result to the on-going
-    # realisation.
-    def realiseList(self, realisation, components, listSeparator):
-        realisedChild = None
-        for i, thisElement in enumerate(components):
-            realisedChild = self.realise(thisElement)
+    # Appends a list of realised elements to the on-going realisation, which
+    # is a list of strings that are joined once it is complete. The elements
+    # are separated by listSeparator and a space.
+    def joinRealisedList(self, parts, realisedComponents, listSeparator):
+        last = len(realisedComponents) - 1
+        for i, realisedChild in enumerate(realisedComponents):
             childRealisation = realisedChild.getRealisation()
             # check that the child realisation is non-empty
-            if childRealisation and not re.fullmatch(r"^[\s\n]+$", childRealisation):
-                realisation += realisedChild.getRealisation()
-                if len(components)>1 and i<len(components)-1:
-                    realisation += listSeparator
-                realisation += ' '
-        if len(realisation) > 0:
-            realisation = realisation[:-1]
-        return realisation
+            if childRealisation and not childRealisation.isspace():
+                parts.append(childRealisation)
+                if i < last:
+                    parts.append(listSeparator)
+                parts.append(' ')
+        # remove the last character of the realisation so far
+        while parts and not parts[-1]:
+            parts.pop()
+        if parts:
+            parts[-1] = parts[-1][:-1]
+        return parts
+
+    # Check if a component of a coordinated phrase is a conjunction that is
+    # replaced by a comma, ie.. all but the last one.
+    def isCommaConjunction(self, component, index, length):
+        return index < length - 2 and \
+                DiscourseFunction.CONJUNCTION==component.getFeature(InternalFeature.DISCOURSE_FUNCTION)
 
-    # Realises coordinated phrases.
-    def realiseCoordinatedPhrase(self, components):
-        realisation = ''
-        realisedChild = None
+    # Realises coordinated phrases from the realisations of the components
+    # that are not replaced by commas.
+    def realiseCoordinatedPhrase(self, components, realisedComponents):
+        parts = []
+        realisedComponents = iter(realisedComponents)
         length = len(components)
         for index in range(length):
-            realisedChild = components[index]
-            if index < length - 2 and \
-                    DiscourseFunction.CONJUNCTION==realisedChild.getFeature(InternalFeature.DISCOURSE_FUNCTION):
-                realisation += ", "
+            if self.isCommaConjunction(components[index], index, length):
+                parts.append(", ")
             else:
-                realisedChild = self.realise(realisedChild)
-                realisation += realisedChild.getRealisation() + ' '
-        realisation = realisation[:-1]
+                realisedChild = next(realisedComponents)
+                parts.append(realisedChild.getRealisation())
+                parts.append(' ')
+        realisation = ''.join(parts)[:-1]
         realisation = realisation.replace(" ,", ",")
         return StringElement(realisation)
@@ -118,9 +118,7 @@ class NPPhraseSpec(PhraseElement):
         if isinstance(modifier, NLGElement):
             modifierElement = modifier
         elif isinstance(modifier, str):
-            modifierString = modifier
-            if len(modifierString) > 0 and not " " in modifierString:
-                modifierElement = self.getFactory().createWord(modifier, LexicalCategory.ANY)
+            modifierElement = self.getFactory().createModifierWord(modifier)
         # if no modifier element, must be a complex string, add as postModifier
         if modifierElement is None:
             self.addPostModifier(modifier)
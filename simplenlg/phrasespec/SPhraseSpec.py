@@ -33,32 +33,112 @@ from .AdvPhraseSpec                         import *
 
 # This class defines a clause (sentence-like phrase).
 class SPhraseSpec(PhraseElement):
-    vpFeatures = [Feature.MODAL, Feature.TENSE, Feature.NEGATED, Feature.NUMBER, Feature.PASSIVE, \
-                  Feature.PERFECT, Feature.PARTICLE, Feature.PERSON, Feature.PROGRESSIVE, \
-                  InternalFeature.REALISE_AUXILIARY, Feature.FORM, Feature.INTERROGATIVE_TYPE]
+    vpFeatures = VPPhraseSpec.clauseFeatures
 
     def __init__(self, phraseFactory):
+        # The default VP and the "that" complementiser are only created the
+        # first time they are asked for.  Many clauses get their own VP through
+        # setVerbPhrase or are never subordinated, so building them here is wasted.
+        self.pendingVerbPhrase    = True
+        self.pendingComplementiser = True
         super().__init__(PhraseCategory.CLAUSE)
         self.setFactory(phraseFactory)
-        # create VP
-        self.setVerbPhrase(phraseFactory.createVerbPhrase())
         # set default values
         self.setFeature(Feature.ELIDED, False)
         self.setFeature(InternalFeature.CLAUSE_STATUS, ClauseStatus.MATRIX)
         self.setFeature(Feature.SUPRESSED_COMPLEMENTISER, False)
         self.setFeature(LexicalFeature.EXPLETIVE_SUBJECT, False)
-        self.setFeature(Feature.COMPLEMENTISER, phraseFactory.createWord( \
+
+    # create the default VP, which reads the VP features already set on the
+    # clause instead of its defaults
+    def createDefaultVerbPhrase(self):
+        self.pendingVerbPhrase = False
+        verbPhrase = self.getFactory().createVerbPhrase()
+        for featureName in self.vpFeatures:
+            if featureName in self.features:
+                verbPhrase.removeFeature(featureName)
+        super().setFeature(InternalFeature.VERB_PHRASE, verbPhrase)
+        verbPhrase.setParent(self)
+
+    # create the default complementiser
+    def createDefaultComplementiser(self):
+        self.pendingComplementiser = False
+        super().setFeature(Feature.COMPLEMENTISER, self.getFactory().createWord( \
                 "that", LexicalCategory.COMPLEMENTISER))
 
+    # create any defaults that haven't been created yet
+    def createDefaults(self):
+        if self.pendingVerbPhrase:
+            self.createDefaultVerbPhrase()
+        if self.pendingComplementiser:
+            self.createDefaultComplementiser()
+
     # intercept and override setFeature, to set VP features as needed
-    # adds a feature, possibly to the underlying VP as well as the SPhraseSpec itself
+    # adds a feature to the SPhraseSpec, which the underlying VP reads from it
+    # (see VPPhraseSpec.getFeature) instead of its own value
     # @Override
     def setFeature(self, featureName, featureValue):
+        if featureName == InternalFeature.VERB_PHRASE:
+            self.pendingVerbPhrase = False
+            self.releaseVerbPhrase()
+        elif featureName == Feature.COMPLEMENTISER:
+            self.pendingComplementiser = False
+        elif featureName in self.vpFeatures and featureValue is None and self.pendingVerbPhrase:
+            # removing a VP feature also removes the VP's default value
+            self.createDefaultVerbPhrase()
         super().setFeature(featureName, featureValue)
-        if featureName in self.vpFeatures:
-            verbPhrase = self.getFeatureAsElement(InternalFeature.VERB_PHRASE)
+        if featureName in self.vpFeatures and not self.pendingVerbPhrase:
+            verbPhrase = self.features.get(InternalFeature.VERB_PHRASE)
+            if isinstance(verbPhrase, VPPhraseSpec):
+                if verbPhrase.getClause() is self:
+                    verbPhrase.removeFeature(featureName)
+                else:   # a VP that is shared with another clause gets a copy
+                    verbPhrase.setFeature(featureName, featureValue)
+
+    # @Override
+    def removeFeature(self, featureName):
+        if featureName == InternalFeature.VERB_PHRASE:
+            self.pendingVerbPhrase = False
+            self.releaseVerbPhrase()
+        elif featureName == Feature.COMPLEMENTISER:
+            self.pendingComplementiser = False
+        elif featureName in self.vpFeatures and not self.pendingVerbPhrase:
+            # the VP keeps the value it read from the clause
+            verbPhrase = self.features.get(InternalFeature.VERB_PHRASE)
             if isinstance(verbPhrase, VPPhraseSpec):
-                verbPhrase.setFeature(featureName, featureValue)
+                verbPhrase.copyClauseFeatures([featureName])
+        super().removeFeature(featureName)
+
+    # @Override
+    def clearAllFeatures(self):
+        self.pendingVerbPhrase     = False
+        self.pendingComplementiser = False
+        self.releaseVerbPhrase()
+        super().clearAllFeatures()
+
+    # the VP keeps the values it read from the clause when it is replaced
+    def releaseVerbPhrase(self):
+        verbPhrase = self.features.get(InternalFeature.VERB_PHRASE)
+        if isinstance(verbPhrase, VPPhraseSpec):
+            verbPhrase.copyClauseFeatures()
+
+    # @Override
+    def hasFeature(self, featureName):
+        if featureName == InternalFeature.VERB_PHRASE and self.pendingVerbPhrase:
+            return True
+        if featureName == Feature.COMPLEMENTISER and self.pendingComplementiser:
+            return True
+        return super().hasFeature(featureName)
+
+    # @Override
+    def getAllFeatures(self):
+        self.createDefaults()
+        return super().getAllFeatures()
+
+    # @Override
+    def getAllFeatureNames(self):
+        self.createDefaults()
+        return super().getAllFeatureNames()
 
     # adds a premodifier, if possible to the underlying VP
     # @Override
@@ -84,14 +164,38 @@ class SPhraseSpec(PhraseElement):
     # @see simplenlg.framework.NLGElement#getFeature(java.lang.String)
     # @Override
     def getFeature(self, featureName):
-        if super().getFeature(featureName) is not None:
-            return super().getFeature(featureName)
+        if featureName == InternalFeature.VERB_PHRASE and self.pendingVerbPhrase:
+            self.createDefaultVerbPhrase()
+        elif featureName == Feature.COMPLEMENTISER and self.pendingComplementiser:
+            self.createDefaultComplementiser()
+        value = super().getFeature(featureName)
+        if value is not None:
+            return value
         if  featureName in self.vpFeatures:
+            if self.pendingVerbPhrase:
+                return VPPhraseSpec.DEFAULT_FEATURES.get(featureName)
             verbPhrase = self.getFeatureAsElement(InternalFeature.VERB_PHRASE)
             if isinstance(verbPhrase, VPPhraseSpec):
                 return verbPhrase.getFeature(featureName)
         return None
 
+    # @Override
+    def __eq__(self, obj):
+        self.createDefaults()
+        if isinstance(obj, SPhraseSpec):
+            obj.createDefaults()
+        return super().__eq__(obj)
+
+    # @Override
+    def __hash__(self):
+        self.createDefaults()
+        return super().__hash__()
+
+    # @Override
+    def __str__(self):
+        self.createDefaults()
+        return super().__str__()
+
     # @return VP for this clause
     def getVerbPhrase(self):
         return self.getFeatureAsElement(InternalFeature.VERB_PHRASE)
@@ -184,9 +288,7 @@ class SPhraseSpec(PhraseElement):
         if isinstance(modifier, NLGElement):
             modifierElement = modifier
         elif isinstance(modifier, str):
-            modifierString = modifier
-            if len(modifierString)>0 and not " " in modifierString:
-                modifierElement = self.getFactory().createWord(modifier, LexicalCategory.ANY)
+            modifierElement = self.getFactory().createModifierWord(modifier)
         # if no modifier element, must be a complex string
         if modifierElement is None:
             self.addPostModifier(str(modifier))
@@ -197,6 +299,7 @@ class SPhraseSpec(PhraseElement):
             self.addPreModifier(modifierElement)
             return
         # extract WordElement if modifier is a single word
+        modifierWord = None
         if isinstance(modifierElement, WordElement):
             modifierWord = modifierElement
         elif isinstance(modifierElement, InflectedWordElement):
@@ -20,6 +20,7 @@ from ..features.DiscourseFunction           import *
 from ..features.Feature                     import *
 from ..features.Form                        import *
 from ..features.InternalFeature             import *
+from ..features.NumberAgreement             import *
 from ..features.Person                      import *
 from ..features.Tense                       import *
 from ..framework.CoordinatedPhraseElement   import *
@@ -33,32 +34,106 @@ from ..framework.WordElement                import *
 
 # This class defines a verb phrase.
 class VPPhraseSpec(PhraseElement):
+    # default feature values for a new verb phrase
+    DEFAULT_FEATURES = {Feature.PERFECT                   : False,
+                        Feature.PROGRESSIVE               : False,
+                        Feature.PASSIVE                   : False,
+                        Feature.NEGATED                   : False,
+                        Feature.TENSE                     : Tense.PRESENT,
+                        Feature.PERSON                    : Person.THIRD,
+                        Feature.NUMBER                    : NumberAgreement.SINGULAR,
+                        Feature.FORM                      : Form.NORMAL,
+                        InternalFeature.REALISE_AUXILIARY : True}
+
+    # The features that a VP which isn't given a value of its own reads from
+    # its clause (see getFeature). Setting one on the clause makes the VP read it.
+    clauseFeatures = frozenset([Feature.MODAL, Feature.TENSE, Feature.NEGATED, Feature.NUMBER, \
+                                Feature.PASSIVE, Feature.PERFECT, Feature.PARTICLE, Feature.PERSON, \
+                                Feature.PROGRESSIVE, InternalFeature.REALISE_AUXILIARY, Feature.FORM, \
+                                Feature.INTERROGATIVE_TYPE])
+
     def __init__(self, phraseFactory):
         super().__init__(PhraseCategory.VERB_PHRASE)
         self.setFactory(phraseFactory)
         # set default feature values
-        self.setFeature(Feature.PERFECT, False)
-        self.setFeature(Feature.PROGRESSIVE, False)
-        self.setFeature(Feature.PASSIVE, False)
-        self.setFeature(Feature.NEGATED, False)
-        self.setFeature(Feature.TENSE, Tense.PRESENT)
-        self.setFeature(Feature.PERSON, Person.THIRD)
-        self.setPlural(False)
-        self.setFeature(Feature.FORM, Form.NORMAL)
-        self.setFeature(InternalFeature.REALISE_AUXILIARY, True)
+        for featureName, featureValue in self.DEFAULT_FEATURES.items():
+            self.setFeature(featureName, featureValue)
+
+    # @return the clause this is the VP of, or None
+    def getClause(self):
+        parent = self.parent
+        if parent is not None and parent.features.get(InternalFeature.VERB_PHRASE) is self:
+            return parent
+        return None
+
+    # @Override
+    def getFeature(self, featureName):
+        value = self.features.get(featureName)
+        if value is None and featureName in self.clauseFeatures:
+            clause = self.getClause()
+            if clause is not None:
+                return clause.features.get(featureName)
+        return value
+
+    # @Override
+    def hasFeature(self, featureName):
+        if featureName in self.features:
+            return True
+        if featureName in self.clauseFeatures:
+            clause = self.getClause()
+            return clause is not None and featureName in clause.features
+        return False
+
+    # @Override
+    def getAllFeatures(self):
+        clause = self.getClause()
+        if clause is None:
+            return self.features
+        features = {featureName: featureValue for featureName, featureValue in clause.features.items() \
+                    if featureName in self.clauseFeatures}
+        features.update(self.features)
+        return features
+
+    # @Override
+    def getAllFeatureNames(self):
+        return self.getAllFeatures().keys()
+
+    # Copies the values the VP reads from its clause into the VP, so it keeps
+    # them when they are removed from the clause or it stops being its VP.
+    def copyClauseFeatures(self, featureNames=None):
+        clause = self.getClause()
+        if clause is not None:
+            for featureName in self.clauseFeatures if featureNames is None else featureNames:
+                if featureName not in self.features and featureName in clause.features:
+                    self.setFeature(featureName, clause.features[featureName])
+
+    # @Override
+    def setParent(self, newParent):
+        if newParent is not self.parent:
+            self.copyClauseFeatures()
+        super().setParent(newParent)
+
+    # The post-modifiers of the clause are realised after those of its VP. A
+    # clause post-modifier equal to one of the VP's is only realised once.
+    # @Override
+    def getPostModifiers(self):
+        postModifiers = super().getPostModifiers()
+        clause = self.getClause()
+        if clause is not None:
+            clauseModifiers = clause.getFeatureAsElementList(InternalFeature.POSTMODIFIERS)
+            if clauseModifiers:
+                vpModifiers = set(map(id, postModifiers))
+                postModifiers = postModifiers + [eachModifier for eachModifier in clauseModifiers \
+                    if id(eachModifier) not in vpModifiers and eachModifier not in postModifiers]
+        return postModifiers
 
     # sets the verb (head) of a verb phrase.
     def setVerb(self, verb):
         if isinstance(verb, str):
-            try:
-                space = verb.index(' ')
-            except ValueError:
-                space = -1
-            if space < 0: # no space, so no particle
-                verbElement = self.getFactory().createWord(verb, LexicalCategory.VERB)
-            else: # space, so break up into verb and particle
-                verbElement = self.getFactory().createWord(verb[:space], LexicalCategory.VERB)
-                self.setFeature(Feature.PARTICLE, verb[space+1:])
+            # break up into verb and particle, if there is a space
+            verbElement, particle = self.getFactory().createVerbAndParticle(verb)
+            if particle is not None:
+                self.setFeature(Feature.PARTICLE, particle)
         else:  # Object is not a String
             verbElement = self.getFactory().createNLGElement(verb,LexicalCategory.VERB)
         self.setHead(verbElement)
@@ -111,17 +186,17 @@ class VPPhraseSpec(PhraseElement):
         if modifier is None:
             return
         # get modifier as NLGElement if possible
+        modifierElement = None
         if isinstance(modifier, NLGElement):
             modifierElement = modifier
         elif isinstance(modifier, str):
-            modifierString = modifier
-            if len(modifierString)>0 and " " not in modifierString:
-                modifierElement = self.getFactory().createWord(modifier, LexicalCategory.ANY)
+            modifierElement = self.getFactory().createModifierWord(modifier)
         # if no modifier element, must be a complex string
         if modifierElement is None:
             self.addPostModifier(modifier)
             return
         # extract WordElement if modifier is a single word
+        modifierWord = None
         if isinstance(modifierElement, WordElement):
             modifierWord = modifierElement
         elif isinstance(modifierElement, InflectedWordElement):
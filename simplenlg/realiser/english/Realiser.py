@@ -16,6 +16,7 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
+from ...format.english.StreamingFormatter           import *
 from ...format.english.TextFormatter                import *
 from ...framework.DocumentCategory                  import *
 from ...framework.DocumentElement                   import *
@@ -56,6 +57,19 @@ class Realiser(NLGModule):
         if self.orthography is not None:
             self.orthography.setCommaSepCuephrase(commaSepCuephrase)
 
+    # Set the number of inflected words the morphology processor caches (0 disables it).
+    def setMorphologyCacheSize(self, size):
+        if self.morphology is not None:
+            self.morphology.setCacheSize(size)
+
+    # Returns statistics about the realiser's caches, as a dictionary of
+    # dictionaries with the hits, misses, hitRate, size and maxSize of each.
+    def getStats(self):
+        stats = {}
+        if self.morphology is not None:
+            stats['morphologyCache'] = self.morphology.getCacheStats()
+        return stats
+
     # @Override
     def initialise(self):
         self.morphology = MorphologyProcessor()
@@ -79,6 +93,32 @@ class Realiser(NLGModule):
             raise ValueError('Invalid element type: ' + str(type(element)))
 
     def _realiseElement(self, element):
+        postOrthography = self.realiseUnformatted(element)
+        if self.formatter is not None:
+            postFormatter = self.formatter.realise(postOrthography)
+            if self.debug:
+                print("POST-FORMATTER TREE")
+                print(postFormatter.printTree(None) + '\n')
+        else:
+            postFormatter = postOrthography
+        return postFormatter
+
+    # Realises an element and writes the formatted output to sink, which can
+    # be any object with a write(str) method, such as an open file. A
+    # formatter based on StreamingFormatter writes straight to the sink
+    # without building the output as a string first. Returns the sink.
+    def writeRealisation(self, element, sink):
+        postOrthography = self.realiseUnformatted(element)
+        if isinstance(self.formatter, StreamingFormatter):
+            self.formatter.write(postOrthography, sink)
+        else:
+            if self.formatter is not None:
+                postOrthography = self.formatter.realise(postOrthography)
+            sink.write(postOrthography.getRealisation())
+        return sink
+
+    # Runs the syntax, morphology and orthography stages
+    def realiseUnformatted(self, element):
         if self.debug:
             print("INITIAL TREE")
             print(element.printTree(None) + '\n')
@@ -94,14 +134,7 @@ class Realiser(NLGModule):
         if self.debug:
             print("POST-ORTHOGRAPHY TREE")
             print(postOrthography.printTree(None) + '\n')
-        if self.formatter is not None:
-            postFormatter = self.formatter.realise(postOrthography)
-            if self.debug:
-                print("POST-FORMATTER TREE")
-                print(postFormatter.printTree(None) + '\n')
-        else:
-            postFormatter = postOrthography
-        return postFormatter
+        return postOrthography
 
     # Convenience class to realise any NLGElement as a sentence
     def realiseSentence(self, element):
@@ -116,6 +149,11 @@ class Realiser(NLGModule):
         else:
             return realised.getRealisation()
 
+    # Inflects many words of one category with the same features and returns
+    # the list of inflected forms. See MorphologyProcessor.inflectMany.
+    def inflectMany(self, words, category, features=None):
+        return self.morphology.inflectMany(words, category, features)
+
     # @Override
     def _realiseElementList(self, elements):
         realisedElements = []
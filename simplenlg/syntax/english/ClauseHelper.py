@@ -16,6 +16,8 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
+from itertools import product
+from types     import MappingProxyType
 from ...features.ClauseStatus               import *
 from ...features.DiscourseFunction          import *
 from ...features.Feature                    import *
@@ -38,6 +40,15 @@ from .VerbPhraseHelper                      import *
 # This is a helper class containing the main methods for realising the syntax
 # of clauses. It is used exclusively by the SyntaxProcessor.
 class ClauseHelper(object):
+    # The auxiliaries of an interrogative plan (see createInterrogativePlan)
+    DO_AUXILIARY = 'do'
+    SPLIT_VERB   = 'split'
+
+    # The question word of each kind of wh object question
+    OBJECT_WH_KEYWORDS = {InterrogativeType.HOW: "how", InterrogativeType.WHY: "why", \
+        InterrogativeType.WHERE: "where", InterrogativeType.WHO_OBJECT: "who", \
+        InterrogativeType.WHO_INDIRECT_OBJECT: "who", InterrogativeType.WHAT_OBJECT: "what", \
+        InterrogativeType.HOW_PREDICATE: "how"}
 
     # The main method for controlling the syntax realisation of clauses.
     @classmethod
@@ -54,27 +65,27 @@ class ClauseHelper(object):
             cls.checkSubjectNumberPerson(phrase, verbElement)
             cls.checkDiscourseFunction(phrase)
             cls.copyFrontModifiers(phrase, verbElement)
-            cls.addComplementiser(phrase, parent, realisedElement)
-            cls.addCuePhrase(phrase, parent, realisedElement)
+            yield from cls.addComplementiser(phrase, parent, realisedElement)
+            yield from cls.addCuePhrase(phrase, parent, realisedElement)
             if phrase.hasFeature(Feature.INTERROGATIVE_TYPE):
                 inter = phrase.getFeature(Feature.INTERROGATIVE_TYPE)
                 interrogObj = inter in [InterrogativeType.WHAT_OBJECT, InterrogativeType.WHO_OBJECT, \
                                         InterrogativeType.HOW_PREDICATE, InterrogativeType.HOW, \
                                         InterrogativeType.WHY, InterrogativeType.WHERE]
-                splitVerb = cls.realiseInterrogative(phrase, parent, realisedElement, phraseFactory, verbElement)
+                splitVerb = yield from cls.realiseInterrogative(phrase, parent, realisedElement, phraseFactory, verbElement)
             else:
-                PhraseHelper.realiseList(parent, realisedElement, \
+                yield from PhraseHelper.realiseList(parent, realisedElement, \
                                          phrase.getFeatureAsElementList(InternalFeature.FRONT_MODIFIERS), \
                                          DiscourseFunction.FRONT_MODIFIER)
-            cls.addSubjectsToFront(phrase, parent, realisedElement, splitVerb)
-            passiveSplitVerb =cls.addPassiveComplementsNumberPerson(phrase, parent, realisedElement, verbElement)
+            yield from cls.addSubjectsToFront(phrase, parent, realisedElement, splitVerb)
+            passiveSplitVerb = yield from cls.addPassiveComplementsNumberPerson(phrase, parent, realisedElement, verbElement)
             if passiveSplitVerb is not None:
                 splitVerb = passiveSplitVerb
             # realise verb needs to know if clause is object interrogative
-            cls.realiseVerb(phrase, parent, realisedElement, splitVerb, verbElement, interrogObj)
-            cls.addPassiveSubjects(phrase, parent, realisedElement, phraseFactory)
-            cls.addInterrogativeFrontModifiers(phrase, parent, realisedElement)
-            cls.addEndingTo(phrase, parent, realisedElement, phraseFactory)
+            yield from cls.realiseVerb(phrase, parent, realisedElement, splitVerb, verbElement, interrogObj)
+            yield from cls.addPassiveSubjects(phrase, parent, realisedElement, phraseFactory)
+            yield from cls.addInterrogativeFrontModifiers(phrase, parent, realisedElement)
+            yield from cls.addEndingTo(phrase, parent, realisedElement, phraseFactory)
         return realisedElement
 
     # Adds to to the end of interrogatives concerning indirect
@@ -83,7 +94,7 @@ class ClauseHelper(object):
     def addEndingTo(cls, phrase, parent, realisedElement, phraseFactory):
         if InterrogativeType.WHO_INDIRECT_OBJECT == phrase.getFeature(Feature.INTERROGATIVE_TYPE):
             word = phraseFactory.createWord("to", LexicalCategory.PREPOSITION)
-            realisedElement.addComponent(parent.realise(word))
+            realisedElement.addComponent((yield word))
 
     # Adds the front modifiers to the end of the clause when dealing with
     # interrogatives.
@@ -92,7 +103,7 @@ class ClauseHelper(object):
         currentElement = None
         if phrase.hasFeature(Feature.INTERROGATIVE_TYPE):
             for subject in phrase.getFeatureAsElementList(InternalFeature.FRONT_MODIFIERS):
-                currentElement = parent.realise(subject)
+                currentElement = (yield subject)
                 if currentElement is not None:
                     currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.FRONT_MODIFIER)
                     realisedElement.addComponent(currentElement)
@@ -104,11 +115,11 @@ class ClauseHelper(object):
         if phrase.getFeatureAsBoolean(Feature.PASSIVE):
             allSubjects = phrase.getFeatureAsElementList(InternalFeature.SUBJECTS)
             if allSubjects or phrase.hasFeature(Feature.INTERROGATIVE_TYPE):
-                realisedElement.addComponent(parent.realise(phraseFactory.createPrepositionPhrase("by")))
+                realisedElement.addComponent((yield phraseFactory.createPrepositionPhrase("by")))
             for subject in allSubjects:
                 subject.setFeature(Feature.PASSIVE, True)
                 if subject.isA(PhraseCategory.NOUN_PHRASE) or isinstance(subject, CoordinatedPhraseElement):
-                    currentElement = parent.realise(subject)
+                    currentElement = (yield subject)
                     if currentElement is not None:
                         currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.SUBJECT)
                         realisedElement.addComponent(currentElement)
@@ -117,7 +128,7 @@ class ClauseHelper(object):
     @classmethod
     def realiseVerb(cls, phrase, parent, realisedElement, splitVerb, verbElement, whObj):
         cls.setVerbFeatures(phrase, verbElement)
-        currentElement = parent.realise(verbElement)
+        currentElement = (yield verbElement)
         if currentElement is not None:
             if splitVerb is None:
                 currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.VERB_PHRASE)
@@ -164,7 +175,7 @@ class ClauseHelper(object):
                 if DiscourseFunction.OBJECT == subject.getFeature(InternalFeature.DISCOURSE_FUNCTION):
                     subject.setFeature(Feature.PASSIVE, True)
                     numComps += 1
-                    currentElement = parent.realise(subject)
+                    currentElement = (yield subject)
                     if currentElement is not None:
                         currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.OBJECT)
                         if phrase.hasFeature(Feature.INTERROGATIVE_TYPE):
@@ -191,11 +202,11 @@ class ClauseHelper(object):
                         subject.setFeature(Feature.POSSESSIVE, True)
         if verbElement is not None:
             if passivePerson is not None:
-                verbElement.setFeature(Feature.PERSON, passivePerson)
+                cls.setVerbAgreement(verbElement, Feature.PERSON, passivePerson)
             if numComps > 1 or coordSubj:
-                verbElement.setFeature(Feature.NUMBER, NumberAgreement.PLURAL)
+                cls.setVerbAgreement(verbElement, Feature.NUMBER, NumberAgreement.PLURAL)
             elif passiveNumber is not None:
-                verbElement.setFeature(Feature.NUMBER, passiveNumber)
+                cls.setVerbAgreement(verbElement, Feature.NUMBER, passiveNumber)
         return splitVerb
 
     # Adds the subjects to the beginning of the clause unless the clause is
@@ -205,7 +216,8 @@ class ClauseHelper(object):
         if not Form.INFINITIVE == phrase.getFeature(Feature.FORM) and not \
                Form.IMPERATIVE == phrase.getFeature(Feature.FORM) and not \
                phrase.getFeatureAsBoolean(Feature.PASSIVE) and splitVerb is None:
-            realisedElement.addComponents(cls.realiseSubjects(phrase, parent).getChildren())
+            subjects = yield from cls.realiseSubjects(phrase, parent)
+            realisedElement.addComponents(subjects.getChildren())
 
     # Realises the subjects for the clause.
     @classmethod
@@ -217,12 +229,14 @@ class ClauseHelper(object):
             if Form.GERUND==phrase.getFeature(Feature.FORM) and not \
                     phrase.getFeatureAsBoolean(Feature.SUPPRESS_GENITIVE_IN_GERUND):
                 subject.setFeature(Feature.POSSESSIVE, True)
-            currentElement = parent.realise(subject)
+            currentElement = (yield subject)
             if currentElement is not None:
                 realisedElement.addComponent(currentElement)
         return realisedElement
 
     # This is the main controlling method for handling interrogative clauses.
+    # What is done for each kind of question is worked out once, by
+    # createInterrogativePlan, so each question only realises its own words.
     @classmethod
     def realiseInterrogative(cls, phrase, parent, realisedElement, phraseFactory, verbElement):
         splitVerb = None
@@ -230,26 +244,78 @@ class ClauseHelper(object):
             phrase.getParent().setFeature(InternalFeature.INTERROGATIVE, True)
         ptype = phrase.getFeature(Feature.INTERROGATIVE_TYPE)
         if isinstance(ptype, InterrogativeType):
-            if ptype == InterrogativeType.YES_NO:
-                splitVerb = cls.realiseYesNo(phrase, parent, verbElement, phraseFactory, realisedElement)
-            elif ptype == InterrogativeType.WHO_SUBJECT or ptype == InterrogativeType.WHAT_SUBJECT:
-                cls.realiseInterrogativeKeyWord(ptype.getString(), LexicalCategory.PRONOUN, parent, \
-                        realisedElement, phraseFactory)
+            key = cls.getInterrogativePlanKey(phrase, verbElement, ptype)
+            keyWords, removeSubjects, auxiliary = cls.INTERROGATIVE_PLANS[key]
+            for keyWord, category in keyWords:
+                yield from cls.realiseInterrogativeKeyWord(keyWord, category, parent, realisedElement, phraseFactory)
+            if removeSubjects:
                 phrase.removeFeature(InternalFeature.SUBJECTS)
-            elif ptype == InterrogativeType.HOW_MANY:
-                cls.realiseInterrogativeKeyWord("how", LexicalCategory.PRONOUN, parent, realisedElement, \
-                                            phraseFactory)
-                cls.realiseInterrogativeKeyWord("many", LexicalCategory.ADVERB, parent, realisedElement, \
-                                            phraseFactory)
-            elif ptype in [InterrogativeType.HOW, InterrogativeType.WHY, InterrogativeType.WHERE, \
-                           InterrogativeType.WHO_OBJECT, InterrogativeType.WHO_INDIRECT_OBJECT, \
-                           InterrogativeType.WHAT_OBJECT]:
-                splitVerb = cls.realiseObjectWHInterrogative(ptype.getString(), phrase, parent, realisedElement, \
-                                                         phraseFactory)
-            elif ptype == InterrogativeType.HOW_PREDICATE:
-                splitVerb = cls.realiseObjectWHInterrogative("how", phrase, parent, realisedElement, phraseFactory)
+            if auxiliary == cls.DO_AUXILIARY:
+                yield from cls.addDoAuxiliary(phrase, parent, phraseFactory, realisedElement)
+            elif auxiliary == cls.SPLIT_VERB:
+                splitVerb = yield from cls.realiseSubjects(phrase, parent)
         return splitVerb
 
+    # Returns the key of the interrogative plan for the phrase: the
+    # interrogative type followed by the features that decide whether the
+    # question has do-support or a split verb.
+    @classmethod
+    def getInterrogativePlanKey(cls, phrase, verbElement, ptype):
+        if ptype == InterrogativeType.YES_NO:
+            return (ptype, isinstance(verbElement, VPPhraseSpec) and VerbPhraseHelper.isCopular(verbElement.getVerb()), \
+                phrase.getFeatureAsBoolean(Feature.PROGRESSIVE), phrase.hasFeature(Feature.MODAL), \
+                Tense.FUTURE==phrase.getFeature(Feature.TENSE), phrase.getFeatureAsBoolean(Feature.NEGATED), \
+                phrase.getFeatureAsBoolean(Feature.PASSIVE))
+        elif ptype in cls.OBJECT_WH_KEYWORDS:
+            return (ptype, cls.hasAuxiliary(phrase), VerbPhraseHelper.isCopular(phrase), \
+                phrase.getFeatureAsBoolean(Feature.PASSIVE))
+        return (ptype,)
+
+    # Works out how a question is realised from the key returned by
+    # getInterrogativePlanKey. The plan is (question words, whether the
+    # subjects are removed, auxiliary), where the question words are
+    # (word, category) pairs and auxiliary is DO_AUXILIARY if a do verb is
+    # added, SPLIT_VERB if the subjects are realised between the auxiliary and
+    # the main verb, or None.
+    @classmethod
+    def createInterrogativePlan(cls, key):
+        ptype = key[0]
+        if ptype == InterrogativeType.YES_NO:
+            copular, progressive, modal, future, negated, passive = key[1:]
+            if not copular and not progressive and not modal and not future and not negated and not passive:
+                return ((), False, cls.DO_AUXILIARY)
+            return ((), False, cls.SPLIT_VERB)
+        elif ptype == InterrogativeType.WHO_SUBJECT or ptype == InterrogativeType.WHAT_SUBJECT:
+            return (((ptype.getString(), LexicalCategory.PRONOUN),), True, None)
+        elif ptype == InterrogativeType.HOW_MANY:
+            return ((("how", LexicalCategory.PRONOUN), ("many", LexicalCategory.ADVERB)), False, None)
+        elif ptype in cls.OBJECT_WH_KEYWORDS:
+            # wh object questions
+            auxiliary, copular, passive = key[1:]
+            keyWords = ((cls.OBJECT_WH_KEYWORDS[ptype], LexicalCategory.PRONOUN),)
+            if not auxiliary and not copular:
+                return (keyWords, False, cls.DO_AUXILIARY)
+            elif not passive:
+                return (keyWords, False, cls.SPLIT_VERB)
+            return (keyWords, False, None)
+        return ((), False, None)
+
+    # Returns a read-only table of the plan for every key that
+    # getInterrogativePlanKey can return.
+    @classmethod
+    def createInterrogativePlans(cls):
+        plans = {}
+        for ptype in InterrogativeType:
+            if ptype == InterrogativeType.YES_NO:
+                keys = [(ptype,) + flags for flags in product([False, True], repeat=6)]
+            elif ptype in cls.OBJECT_WH_KEYWORDS:
+                keys = [(ptype,) + flags for flags in product([False, True], repeat=3)]
+            else:
+                keys = [(ptype,)]
+            for key in keys:
+                plans[key] = cls.createInterrogativePlan(key)
+        return MappingProxyType(plans)
+
     # Check if a sentence has an auxiliary (needed to relise questions correctly)
     @classmethod
     def hasAuxiliary(cls, phrase):
@@ -257,55 +323,38 @@ class ClauseHelper(object):
                phrase.getFeatureAsBoolean(Feature.PROGRESSIVE) or \
                Tense.FUTURE == phrase.getFeature(Feature.TENSE)
 
-    # Controls the realisation of wh object questions.
-    @classmethod
-    def realiseObjectWHInterrogative(cls, keyword, phrase, parent, realisedElement, phraseFactory):
-        splitVerb = None
-        cls.realiseInterrogativeKeyWord(keyword, LexicalCategory.PRONOUN, parent, realisedElement, \
-                                        phraseFactory)
-        if not cls.hasAuxiliary(phrase) and not VerbPhraseHelper.isCopular(phrase):
-            cls.addDoAuxiliary(phrase, parent, phraseFactory, realisedElement)
-        elif not phrase.getFeatureAsBoolean(Feature.PASSIVE):
-            splitVerb = cls.realiseSubjects(phrase, parent)
-        return splitVerb
-
     # Adds a do verb to the realisation of this clause.
     @classmethod
     def addDoAuxiliary(cls, phrase, parent, phraseFactory, realisedElement):
-        doPhrase = phraseFactory.createVerbPhrase("do")
+        doPhrase = phraseFactory.createVerbPhrase(cls.createQuestionWord(phraseFactory, "do", LexicalCategory.VERB))
         doPhrase.setFeature(Feature.TENSE, phrase.getFeature(Feature.TENSE))
         doPhrase.setFeature(Feature.PERSON, phrase.getFeature(Feature.PERSON))
         doPhrase.setFeature(Feature.NUMBER, phrase.getFeature(Feature.NUMBER))
-        realisedElement.addComponent(parent.realise(doPhrase))
+        realisedElement.addComponent((yield doPhrase))
 
     # Realises the key word of the interrogative. For example, who,
     # what
     @classmethod
     def realiseInterrogativeKeyWord(cls, keyWord, cat, parent, realisedElement, phraseFactory):
         if keyWord is not None:
-            question = phraseFactory.createWord(keyWord, cat)
-            currentElement = parent.realise(question)
+            question = cls.createQuestionWord(phraseFactory, keyWord, cat)
+            currentElement = (yield question)
             if currentElement is not None:
                 realisedElement.addComponent(currentElement)
 
-    # Performs the realisation for YES/NO types of questions.
+    # Creates a question word or the do auxiliary. There are only a few of
+    # these, so, like closed-class words, each is looked up in the lexicon once
+    # per factory (see NLGFactory.createClosedClassWord).
     @classmethod
-    def realiseYesNo(cls, phrase, parent, verbElement, phraseFactory, realisedElement):
-        splitVerb = None
-        if not (isinstance(verbElement, VPPhraseSpec) and VerbPhraseHelper.isCopular(verbElement.getVerb())) and not \
-                phrase.getFeatureAsBoolean(Feature.PROGRESSIVE) and not phrase.hasFeature(Feature.MODAL) and not \
-                Tense.FUTURE==phrase.getFeature(Feature.TENSE) and not \
-                phrase.getFeatureAsBoolean(Feature.NEGATED) and not \
-                phrase.getFeatureAsBoolean(Feature.PASSIVE):
-            cls.addDoAuxiliary(phrase, parent, phraseFactory, realisedElement)
-        else:
-            splitVerb = cls.realiseSubjects(phrase, parent)
-        return splitVerb
+    def createQuestionWord(cls, phraseFactory, word, category):
+        if phraseFactory.lexicon is None:
+            return phraseFactory.createWord(word, category)
+        return phraseFactory.createClosedClassWord(word, category)
 
     # Realises the cue phrase for the clause if it exists.
     @classmethod
     def addCuePhrase(cls, phrase, parent, realisedElement):
-        currentElement = parent.realise(phrase.getFeatureAsElement(Feature.CUE_PHRASE))
+        currentElement = (yield phrase.getFeatureAsElement(Feature.CUE_PHRASE))
         if currentElement is not None:
             currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.CUE_PHRASE)
             realisedElement.addComponent(currentElement)
@@ -315,7 +364,7 @@ class ClauseHelper(object):
     def addComplementiser(cls, phrase, parent, realisedElement):
         if ClauseStatus.SUBORDINATE== phrase.getFeature(InternalFeature.CLAUSE_STATUS) and not \
                 phrase.getFeatureAsBoolean(Feature.SUPRESSED_COMPLEMENTISER):
-            currentElement = parent.realise(phrase.getFeatureAsElement(Feature.COMPLEMENTISER))
+            currentElement = (yield phrase.getFeatureAsElement(Feature.COMPLEMENTISER))
             if currentElement is not None:
                 realisedElement.addComponent(currentElement)
 
@@ -325,23 +374,34 @@ class ClauseHelper(object):
     def copyFrontModifiers(cls, phrase, verbElement):
         frontModifiers = phrase.getFeatureAsElementList(InternalFeature.FRONT_MODIFIERS)
         clauseForm = phrase.getFeature(Feature.FORM)
+        # The VP of the clause reads the clause's post-modifiers itself (see
+        # VPPhraseSpec), other verb phrases are given a copy of them.
+        readsClause = isinstance(verbElement, VPPhraseSpec) and verbElement.getClause() is phrase
         # do not overwrite existing post-mods in the VP
-        if verbElement is not None:
+        if verbElement is not None and not readsClause:
             phrasePostModifiers = phrase.getFeatureAsElementList(InternalFeature.POSTMODIFIERS)
-            if isinstance(verbElement, PhraseElement):
+            if isinstance(verbElement, PhraseElement) and phrasePostModifiers:
                 verbPostModifiers = verbElement.getFeatureAsElementList(InternalFeature.POSTMODIFIERS)
-                for eachModifier in phrasePostModifiers:
-                    # need to check that VP doesn't already contain the post-modifier
-                    # this only happens if the phrase has already been realised
-                    # and later modified, with realiser called again. In that
-                    # case, postmods will be copied over twice
-                    if eachModifier not in verbPostModifiers:
-                        verbElement.addPostModifier(eachModifier)
+                # need to check that VP doesn't already contain the post-modifier
+                # this only happens if the phrase has already been realised
+                # and later modified, with realiser called again. In that
+                # case, postmods will be copied over twice. The copied postmods
+                # are the clause's own elements, so they are found by identity,
+                # and only the others are compared with the VP's post-modifiers.
+                copiedModifiers = set(map(id, verbPostModifiers))
+                newModifiers = [eachModifier for eachModifier in phrasePostModifiers \
+                    if id(eachModifier) not in copiedModifiers and eachModifier not in verbPostModifiers]
+                if newModifiers:
+                    for eachModifier in newModifiers:
+                        eachModifier.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.POST_MODIFIER)
+                    verbElement.setFeature(InternalFeature.POSTMODIFIERS, verbPostModifiers + newModifiers)
         if Form.INFINITIVE == clauseForm:
             phrase.setFeature(Feature.SUPRESSED_COMPLEMENTISER, True)
+            # the front modifiers follow the clause's post-modifiers
+            postModified = phrase if readsClause else verbElement
             for eachModifier in frontModifiers:
                 if isinstance(verbElement, PhraseElement):
-                    verbElement.addPostModifier(eachModifier)
+                    postModified.addPostModifier(eachModifier)
             phrase.removeFeature(InternalFeature.FRONT_MODIFIERS)
             if verbElement is not None:
                 verbElement.setFeature(InternalFeature.NON_MORPH, True)
@@ -395,6 +455,18 @@ class ClauseHelper(object):
                 pluralSubjects = True
         if verbElement is not None:
             plural = NumberAgreement.PLURAL if pluralSubjects else  phrase.getFeature(Feature.NUMBER)
-            verbElement.setFeature(Feature.NUMBER,  plural)
+            cls.setVerbAgreement(verbElement, Feature.NUMBER,  plural)
             if person is not None:
-                verbElement.setFeature(Feature.PERSON, person)
+                cls.setVerbAgreement(verbElement, Feature.PERSON, person)
+
+    # Sets the number or person of the verb to agree with the clause. The VP
+    # of the clause already reads these from the clause, so it is only given
+    # its own value when the agreement differs from that.
+    @classmethod
+    def setVerbAgreement(cls, verbElement, featureName, featureValue):
+        if verbElement.getFeature(featureName) != featureValue:
+            verbElement.setFeature(featureName, featureValue)
+
+
+# The interrogative plans are worked out once, when the module is imported
+ClauseHelper.INTERROGATIVE_PLANS = ClauseHelper.createInterrogativePlans()
@@ -32,76 +32,81 @@ from .PhraseHelper                          import *
 # This class contains static methods to help the syntax processor realise
 # coordinated phrases.
 class CoordinatedPhraseHelper(object):
+    # The features of a coordinated phrase that are set on each coordinate
+    CHILD_FEATURES = [Feature.PROGRESSIVE, Feature.PERFECT, InternalFeature.SPECIFIER, LexicalFeature.GENDER, \
+        Feature.NUMBER, Feature.TENSE, Feature.PERSON, Feature.NEGATED, Feature.MODAL, \
+        InternalFeature.DISCOURSE_FUNCTION, Feature.FORM, InternalFeature.CLAUSE_STATUS]
+
     # The main method for realising coordinated phrases.
     @classmethod
     def realise(cls, parent, phrase):
         realisedElement = None
         if phrase is not None:
             realisedElement = ListElement()
-            PhraseHelper.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
+            yield from PhraseHelper.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
                     DiscourseFunction.PRE_MODIFIER)
             coordinated = CoordinatedPhraseElement()
             children = phrase.getChildren()
             conjunction = phrase.getFeatureAsString(Feature.CONJUNCTION)
             coordinated.setFeature(Feature.CONJUNCTION, conjunction)
             coordinated.setFeature(Feature.CONJUNCTION_TYPE, phrase.getFeature(Feature.CONJUNCTION_TYPE))
-            conjunctionElement = None
+            factory = phrase.getFactory()
             if children:
                 if phrase.getFeatureAsBoolean(Feature.RAISE_SPECIFIER):
                     cls.raiseSpecifier(children)
                 child = phrase.getLastCoordinate()
                 child.setFeature(Feature.POSSESSIVE, phrase.getFeature(Feature.POSSESSIVE))
-                child = children[0]
-                cls.setChildFeatures(phrase, child)
-                coordinated.addCoordinate(parent.realise(child))
+                # the features set on every coordinate and the conjunction are
+                # worked out once, however many coordinates there are
+                childFeatures = cls.getChildFeatures(phrase)
+                aggregateAuxiliary = phrase.getFeatureAsBoolean(Feature.AGGREGATE_AUXILIARY)
+                suppressedComplementiser = phrase.getFeature(Feature.SUPRESSED_COMPLEMENTISER)
+                #skip conjunction if it's null or empty string
+                conjunctionElement = cls.createConjunction(factory, conjunction) if conjunction else None
                 for index, child in enumerate(children):
-                    if 0==index: continue
-                    cls.setChildFeatures(phrase, child)
-                    if phrase.getFeatureAsBoolean(Feature.AGGREGATE_AUXILIARY):
-                        child.setFeature(InternalFeature.REALISE_AUXILIARY, False)
-                    if child.isA(PhraseCategory.CLAUSE):
-                        child.setFeature(Feature.SUPRESSED_COMPLEMENTISER, \
-                                phrase.getFeature(Feature.SUPRESSED_COMPLEMENTISER))
-                    #skip conjunction if it's null or empty string
-                    if conjunction:
-                        conjunctionElement = InflectedWordElement(conjunction, LexicalCategory.CONJUNCTION)
-                        conjunctionElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.CONJUNCTION)
-                        coordinated.addCoordinate(conjunctionElement)
-                    coordinated.addCoordinate(parent.realise(child))
+                    for featureName, featureValue in childFeatures:
+                        child.setFeature(featureName, featureValue)
+                    if index > 0:
+                        if aggregateAuxiliary:
+                            child.setFeature(InternalFeature.REALISE_AUXILIARY, False)
+                        if child.isA(PhraseCategory.CLAUSE):
+                            child.setFeature(Feature.SUPRESSED_COMPLEMENTISER, suppressedComplementiser)
+                        if conjunctionElement is not None:
+                            coordinated.addCoordinate(conjunctionElement.copyOnWrite())
+                    coordinated.addCoordinate((yield child))
                 realisedElement.addComponent(coordinated)
-            PhraseHelper.realiseList(parent, realisedElement, phrase.getPostModifiers(), DiscourseFunction.POST_MODIFIER)
-            PhraseHelper.realiseList(parent, realisedElement, phrase.getComplements(), DiscourseFunction.COMPLEMENT)
+            yield from PhraseHelper.realiseList(parent, realisedElement, phrase.getPostModifiers(), DiscourseFunction.POST_MODIFIER)
+            yield from PhraseHelper.realiseList(parent, realisedElement, phrase.getComplements(), DiscourseFunction.COMPLEMENT)
         return realisedElement
 
     # Sets the common features from the phrase to the child element.
     @classmethod
     def setChildFeatures(cls, phrase, child):
-        if phrase.hasFeature(Feature.PROGRESSIVE):
-            child.setFeature(Feature.PROGRESSIVE, phrase.getFeature(Feature.PROGRESSIVE))
-        if phrase.hasFeature(Feature.PERFECT):
-            child.setFeature(Feature.PERFECT, phrase.getFeature(Feature.PERFECT))
-        if phrase.hasFeature(InternalFeature.SPECIFIER):
-            child.setFeature(InternalFeature.SPECIFIER, phrase.getFeature(InternalFeature.SPECIFIER))
-        if phrase.hasFeature(LexicalFeature.GENDER):
-            child.setFeature(LexicalFeature.GENDER, phrase.getFeature(LexicalFeature.GENDER))
-        if phrase.hasFeature(Feature.NUMBER):
-            child.setFeature(Feature.NUMBER, phrase.getFeature(Feature.NUMBER))
-        if phrase.hasFeature(Feature.TENSE):
-            child.setFeature(Feature.TENSE, phrase.getFeature(Feature.TENSE))
-        if phrase.hasFeature(Feature.PERSON):
-            child.setFeature(Feature.PERSON, phrase.getFeature(Feature.PERSON))
-        if phrase.hasFeature(Feature.NEGATED):
-            child.setFeature(Feature.NEGATED, phrase.getFeature(Feature.NEGATED))
-        if phrase.hasFeature(Feature.MODAL):
-            child.setFeature(Feature.MODAL, phrase.getFeature(Feature.MODAL))
-        if phrase.hasFeature(InternalFeature.DISCOURSE_FUNCTION):
-            child.setFeature(InternalFeature.DISCOURSE_FUNCTION, phrase.getFeature(InternalFeature.DISCOURSE_FUNCTION))
-        if phrase.hasFeature(Feature.FORM):
-            child.setFeature(Feature.FORM, phrase.getFeature(Feature.FORM))
-        if phrase.hasFeature(InternalFeature.CLAUSE_STATUS):
-            child.setFeature(InternalFeature.CLAUSE_STATUS, phrase.getFeature(InternalFeature.CLAUSE_STATUS))
+        for featureName, featureValue in cls.getChildFeatures(phrase):
+            child.setFeature(featureName, featureValue)
+
+    # Returns the common features that are set from the phrase on each child
+    # element, as a list of (feature name, value).
+    @classmethod
+    def getChildFeatures(cls, phrase):
+        childFeatures = []
+        for featureName in cls.CHILD_FEATURES:
+            if phrase.hasFeature(featureName):
+                childFeatures.append((featureName, phrase.getFeature(featureName)))
         if phrase.hasFeature(Feature.INTERROGATIVE_TYPE):
-            child.setFeature(InternalFeature.IGNORE_MODAL, True)
+            childFeatures.append((InternalFeature.IGNORE_MODAL, True))
+        return childFeatures
+
+    # Creates the conjunction that is put between the coordinates. Each
+    # coordinate gets a copy-on-write copy of it.
+    @classmethod
+    def createConjunction(cls, factory, conjunction):
+        if factory is not None:
+            conjunctionElement = factory.createInflectedWord(conjunction, LexicalCategory.CONJUNCTION)
+        else:
+            conjunctionElement = InflectedWordElement(conjunction, LexicalCategory.CONJUNCTION)
+        conjunctionElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.CONJUNCTION)
+        return conjunctionElement
 
     # Checks to see if the specifier can be raised and then raises it. In order
     # to be raised the specifier must be the same on all coordinates.
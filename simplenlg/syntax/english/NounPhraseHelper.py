@@ -16,7 +16,6 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
-from copy import deepcopy
 from ...features.DiscourseFunction      import *
 from ...features.Feature                import *
 from ...features.Gender                 import *
@@ -50,13 +49,13 @@ class NounPhraseHelper(object):
             if phrase.getFeatureAsBoolean(Feature.PRONOMINAL):
                 realisedElement.addComponent(cls.createPronoun(parent, phrase))
             else:
-                cls.realiseSpecifier(phrase, parent, realisedElement)
-                cls.realisePreModifiers(phrase, parent, realisedElement)
-                cls.realiseHeadNoun(phrase, parent, realisedElement)
-                PhraseHelper.realiseList(parent, realisedElement, \
+                yield from cls.realiseSpecifier(phrase, parent, realisedElement)
+                yield from cls.realisePreModifiers(phrase, parent, realisedElement)
+                yield from cls.realiseHeadNoun(phrase, parent, realisedElement)
+                yield from PhraseHelper.realiseList(parent, realisedElement, \
                         phrase.getFeatureAsElementList(InternalFeature.COMPLEMENTS), \
                         DiscourseFunction.COMPLEMENT)
-                PhraseHelper.realiseList(parent, realisedElement, phrase.getPostModifiers(), \
+                yield from PhraseHelper.realiseList(parent, realisedElement, phrase.getPostModifiers(), \
                         DiscourseFunction.POST_MODIFIER)
         return realisedElement
 
@@ -72,7 +71,7 @@ class NounPhraseHelper(object):
             headElement.setFeature(Feature.PERSON, phrase.getFeature(Feature.PERSON))
             headElement.setFeature(Feature.POSSESSIVE, phrase.getFeature(Feature.POSSESSIVE))
             headElement.setFeature(Feature.PASSIVE, phrase.getFeature(Feature.PASSIVE))
-            currentElement = parent.realise(headElement)
+            currentElement = (yield headElement)
             currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.SUBJECT)
             realisedElement.addComponent(currentElement)
 
@@ -83,7 +82,7 @@ class NounPhraseHelper(object):
         preModifiers = phrase.getPreModifiers()
         if phrase.getFeatureAsBoolean(Feature.ADJECTIVE_ORDERING):
             preModifiers = cls.sortNPPreModifiers(preModifiers)
-        PhraseHelper.realiseList(parent, realisedElement, preModifiers, DiscourseFunction.PRE_MODIFIER)
+        yield from PhraseHelper.realiseList(parent, realisedElement, preModifiers, DiscourseFunction.PRE_MODIFIER)
 
     # Realises the specifier of the noun phrase.
     @classmethod
@@ -94,62 +93,65 @@ class NounPhraseHelper(object):
             if not specifierElement.isA(LexicalCategory.PRONOUN) and \
                     specifierElement.getCategory() != PhraseCategory.NOUN_PHRASE:
                 specifierElement.setFeature(Feature.NUMBER, phrase.getFeature(Feature.NUMBER))
-            currentElement = parent.realise(specifierElement)
+            currentElement = (yield specifierElement)
             if currentElement is not None:
                 currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.SPECIFIER)
                 realisedElement.addComponent(currentElement)
 
     # Sort the list of premodifiers for this noun phrase using adjective
-    # ordering (ie, "big" comes before "red")
+    # ordering (ie, "big" comes before "red"). A modifier is moved in front of
+    # the modifiers whose minimum position is after its maximum position. The
+    # positions of each modifier are worked out once, and the modifiers
+    # themselves are not copied.
     @classmethod
     def sortNPPreModifiers(cls, originalModifiers):
         if originalModifiers is None or len(originalModifiers)<=1:
-            orderedModifiers = originalModifiers
-        else:
-            orderedModifiers = deepcopy(originalModifiers)
-            changesMade = True
-            while changesMade:
-                changesMade = False
-                for i in range(len(orderedModifiers)-1):
-                    if cls.getMinPos(orderedModifiers[i]) > cls.getMaxPos(orderedModifiers[i+1]):
-                        temp = orderedModifiers[i]
-                        orderedModifiers[i] = orderedModifiers[i+1]
-                        orderedModifiers[i+1] = temp
-                        changesMade = True
-        return orderedModifiers
-
+            return originalModifiers
+        ordered = []    # (minimum position, maximum position, modifier)
+        for modifier in originalModifiers:
+            minPos, maxPos = cls.getPositions(modifier)
+            i = len(ordered)
+            while i > 0 and ordered[i-1][0] > maxPos:
+                i -= 1
+            ordered.insert(i, (minPos, maxPos, modifier))
+        return [modifier for minPos, maxPos, modifier in ordered]
 
-    # Determines the minimim position at which this modifier can occur.
+    # Determines the minimim and maximum positions at which this modifier can
+    # occur.
     @classmethod
-    def getMinPos(cls, modifier):
-        position = cls.QUALITATIVE_POSITION
-        if modifier.isA(LexicalCategory.NOUN) or modifier.isA(PhraseCategory.NOUN_PHRASE):
-            position = cls.NOUN_POSITION
-        elif modifier.isA(LexicalCategory.ADJECTIVE) or modifier.isA(PhraseCategory.ADJECTIVE_PHRASE):
+    def getPositions(cls, modifier):
+        if modifier.isA(LexicalCategory.ADJECTIVE) or modifier.isA(PhraseCategory.ADJECTIVE_PHRASE):
             adjective = cls.getHeadWordElement(modifier)
             if adjective.getFeatureAsBoolean(LexicalFeature.QUALITATIVE):
-                position = cls.QUALITATIVE_POSITION
+                minPos = cls.QUALITATIVE_POSITION
             elif adjective.getFeatureAsBoolean(LexicalFeature.COLOUR):
-                position = cls.COLOUR_POSITION
+                minPos = cls.COLOUR_POSITION
             elif adjective.getFeatureAsBoolean(LexicalFeature.CLASSIFYING):
-                position = cls.CLASSIFYING_POSITION
-        return position
-
-    # Determines the maximim position at which this modifier can occur.
-    @classmethod
-    def getMaxPos(cls, modifier):
-        position = cls.NOUN_POSITION
-        if modifier.isA(LexicalCategory.ADJECTIVE) or modifier.isA(PhraseCategory.ADJECTIVE_PHRASE):
-            adjective = cls.getHeadWordElement(modifier)
+                minPos = cls.CLASSIFYING_POSITION
+            else:
+                minPos = cls.QUALITATIVE_POSITION
             if adjective.getFeatureAsBoolean(LexicalFeature.CLASSIFYING):
-                position = cls.CLASSIFYING_POSITION
+                maxPos = cls.CLASSIFYING_POSITION
             elif adjective.getFeatureAsBoolean(LexicalFeature.COLOUR):
-                position = cls.COLOUR_POSITION
+                maxPos = cls.COLOUR_POSITION
             elif adjective.getFeatureAsBoolean(LexicalFeature.QUALITATIVE):
-                position = cls.QUALITATIVE_POSITION
+                maxPos = cls.QUALITATIVE_POSITION
             else:
-                position = cls.CLASSIFYING_POSITION
-        return position
+                maxPos = cls.CLASSIFYING_POSITION
+            return minPos, maxPos
+        elif modifier.isA(LexicalCategory.NOUN) or modifier.isA(PhraseCategory.NOUN_PHRASE):
+            return cls.NOUN_POSITION, cls.NOUN_POSITION
+        return cls.QUALITATIVE_POSITION, cls.NOUN_POSITION
+
+    # Determines the minimim position at which this modifier can occur.
+    @classmethod
+    def getMinPos(cls, modifier):
+        return cls.getPositions(modifier)[0]
+
+    # Determines the maximim position at which this modifier can occur.
+    @classmethod
+    def getMaxPos(cls, modifier):
+        return cls.getPositions(modifier)[1]
 
     # Retrieves the correct representation of the word from the element.
     @classmethod
@@ -181,14 +183,8 @@ class NounPhraseHelper(object):
             elif Gender.MASCULINE == genderValue:
                 pronoun = "he"
         # AG: createWord now returns WordElement; so we embed it in an
-        # inflected word element here
-        proElement = phraseFactory.createWord(pronoun, LexicalCategory.PRONOUN)
-        if isinstance(proElement, WordElement):
-            element = InflectedWordElement(proElement)
-            element.setFeature(LexicalFeature.GENDER, proElement.getFeature(LexicalFeature.GENDER))
-            element.setFeature(Feature.PERSON, proElement.getFeature(Feature.PERSON))
-        else:
-            element = proElement
+        # inflected word element here. The factory keeps one for each pronoun.
+        element = phraseFactory.createInflectedPronoun(pronoun)
         element.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.SPECIFIER)
         element.setFeature(Feature.POSSESSIVE, phrase.getFeature(Feature.POSSESSIVE))
         element.setFeature(Feature.NUMBER, phrase.getFeature(Feature.NUMBER))
@@ -36,11 +36,11 @@ class PhraseHelper(object):
         realisedElement = ListElement()
         if phrase is not None:
             realisedElement = ListElement()
-            cls.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
+            yield from cls.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
                     DiscourseFunction.PRE_MODIFIER)
-            cls.realiseHead(parent, phrase, realisedElement)
-            cls.realiseComplements(parent, phrase, realisedElement)
-            PhraseHelper.realiseList(parent, realisedElement, \
+            yield from cls.realiseHead(parent, phrase, realisedElement)
+            yield from cls.realiseComplements(parent, phrase, realisedElement)
+            yield from PhraseHelper.realiseList(parent, realisedElement, \
                     phrase.getPostModifiers(), DiscourseFunction.POST_MODIFIER)
         return realisedElement
 
@@ -50,7 +50,7 @@ class PhraseHelper(object):
     def realiseComplements(cls, parent, phrase, realisedElement):
         firstProcessed = False
         for complement in phrase.getFeatureAsElementList(InternalFeature.COMPLEMENTS):
-            currentElement = parent.realise(complement)
+            currentElement = (yield complement)
             if currentElement is not None:
                 currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.COMPLEMENT)
                 if firstProcessed:
@@ -68,7 +68,7 @@ class PhraseHelper(object):
                 head.setFeature(Feature.IS_COMPARATIVE, phrase.getFeature(Feature.IS_COMPARATIVE))
             elif phrase.hasFeature(Feature.IS_SUPERLATIVE):
                 head.setFeature(Feature.IS_SUPERLATIVE, phrase.getFeature(Feature.IS_SUPERLATIVE))
-            head = parent.realise(head)
+            head = (yield head)
             head.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.HEAD)
             realisedElement.addComponent(head)
 
@@ -84,7 +84,7 @@ class PhraseHelper(object):
         # orthography and morphology processing later.
         realisedList = ListElement()
         for eachElement in elementList:
-            currentElement = parent.realise(eachElement)
+            currentElement = (yield eachElement)
             if currentElement is not None:
                 currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, function)
                 if eachElement.getFeatureAsBoolean(Feature.APPOSITIVE):
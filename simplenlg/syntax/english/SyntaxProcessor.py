@@ -16,6 +16,7 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
+from types import GeneratorType
 from ...features.Feature                    import *
 from ...framework.CoordinatedPhraseElement  import *
 from ...framework.DocumentElement           import *
@@ -38,6 +39,53 @@ from .VerbPhraseHelper                      import *
 class SyntaxProcessor(NLGModule):
     def __init__(self):
         super().__init__()
+        self.elementHandlers  = {}  # {class: (bool, handler)} see registerElementHandler
+        self.resolvedHandlers = {}  # {class: (bool, handler)} handler found for each class of element
+        self.phraseHandlers   = {}  # {category: handler} see registerPhraseHandler
+        self.registerElementHandler(DocumentElement, SyntaxProcessor.realiseDocumentElement, True)
+        self.registerElementHandler(PhraseElement, SyntaxProcessor.realisePhraseElement)
+        self.registerElementHandler(ListElement, SyntaxProcessor.realiseListElement, True)
+        self.registerElementHandler(InflectedWordElement, SyntaxProcessor.realiseInflectedWordElement)
+        self.registerElementHandler(WordElement, SyntaxProcessor.realiseWordElement)
+        self.registerElementHandler(CoordinatedPhraseElement, CoordinatedPhraseHelper.realise)
+        self.registerPhraseHandler(PhraseCategory.CLAUSE, ClauseHelper.realise)
+        self.registerPhraseHandler(PhraseCategory.NOUN_PHRASE, NounPhraseHelper.realise)
+        self.registerPhraseHandler(PhraseCategory.VERB_PHRASE, VerbPhraseHelper.realise)
+        self.registerPhraseHandler(PhraseCategory.PREPOSITIONAL_PHRASE, PhraseHelper.realise)
+        self.registerPhraseHandler(PhraseCategory.ADJECTIVE_PHRASE, PhraseHelper.realise)
+        self.registerPhraseHandler(PhraseCategory.ADVERB_PHRASE, PhraseHelper.realise)
+
+    # Sets the function that realises a class of element (and its subclasses,
+    # unless they have their own). It is called as handler(processor, element)
+    # and returns the realised element. If realiseChildren is True, the
+    # element's children are realised first and passed as a third argument.
+    # Elements of a class with no handler are returned unchanged.
+    # A handler that needs other elements realised can call processor.realise,
+    # or, like the phrase helpers, be a generator that yields each element (or
+    # list of elements) and is sent back its realisation. Generators are run
+    # from an explicit stack, so the depth of a phrase is only limited by memory.
+    def registerElementHandler(self, elementClass, handler, realiseChildren=False):
+        self.elementHandlers[elementClass] = (realiseChildren, handler)
+        self.resolvedHandlers = {}
+
+    # Sets the function that realises phrases of a category. It is called as
+    # handler(processor, phrase) and returns the realised phrase, or a
+    # generator, as for registerElementHandler.
+    def registerPhraseHandler(self, category, handler):
+        self.phraseHandlers[category] = handler
+
+    # Returns (realiseChildren, handler) for a class of element, using the
+    # handler of the nearest registered base class.
+    def getElementHandler(self, elementClass):
+        entry = self.resolvedHandlers.get(elementClass)
+        if entry is None:
+            entry = (False, None)
+            for baseClass in elementClass.__mro__:
+                if baseClass in self.elementHandlers:
+                    entry = self.elementHandlers[baseClass]
+                    break
+            self.resolvedHandlers[elementClass] = entry
+        return entry
 
     # @Override
     def initialise(self):
@@ -45,71 +93,113 @@ class SyntaxProcessor(NLGModule):
 
     # @Override
     def realise(self, element):
-        if element is None or element.getFeatureAsBoolean(Feature.ELIDED):
+        stack = []  # generators of the elements being realised, outermost first
+        realised = self.startRealisation(element)
+        while True:
+            if isinstance(realised, GeneratorType):
+                stack.append(realised)
+                realised = None
+            elif not stack:
+                return realised
+            try:
+                request = stack[-1].send(realised)
+            except StopIteration as stop:
+                stack.pop()
+                realised = self.removeSingleElementList(stop.value)
+            else:
+                realised = self.startRealisation(request)
+
+    # Starts realising an element or a list of elements. Returns the
+    # realisation, or a generator that realise runs to get it.
+    def startRealisation(self, element):
+        if element is None:
             return None
         elif isinstance(element, NLGElement):
-            return self._realiseElement(element)
+            if element.getFeatureAsBoolean(Feature.ELIDED):
+                return None
+            realiseChildren, handler = self.getElementHandler(type(element))
+            if handler is None:
+                return element
+            elif realiseChildren:
+                return self.realiseFromChildren(element, handler)
+            realisedElement = handler(self, element)
+            if isinstance(realisedElement, GeneratorType):
+                return realisedElement
+            return self.removeSingleElementList(realisedElement)
         elif isinstance(element, list):
             return self._realiseElementList(element)
         else:
             raise ValueError('Invalid element type: ' + str(type(element)))
 
-    def _realiseElement(self, element):
-        realisedElement = None
-        if element is not None and not element.getFeatureAsBoolean(Feature.ELIDED):
-            if isinstance(element, DocumentElement):
-                children = element.getChildren()
-                element.setComponents(self._realiseElementList(children))
-                realisedElement = element
-            elif isinstance(element, PhraseElement):
-                realisedElement = self.realisePhraseElement(element)
-            elif isinstance(element, ListElement):
-                realisedElement = ListElement()
-                realisedElement.addComponents(self._realiseElementList(element.getChildren()))
-            elif isinstance(element, InflectedWordElement):
-                baseForm = element.getBaseForm()
-                category = element.getCategory()
-                if self.lexicon is not None and baseForm is not None:
-                    word = element.getBaseWord()
-                    if word is None:
-                        if isinstance(category, LexicalCategory):
-                            word = self.lexicon.lookupWord(baseForm, category)
-                        else:
-                            word = self.lexicon.lookupWord(baseForm)
-                    if word is not None:
-                        element.setBaseWord(word)
-                realisedElement = element
-            elif isinstance(element, WordElement):
-                # AG: need to check if it's a word element, in which case it
-                # needs to be marked for inflection
-                infl = InflectedWordElement(element)
-                # # the inflected word inherits all features from the base word
-                for feature in element.getAllFeatureNames():
-                    infl.setFeature(feature, element.getFeature(feature))
-                realisedElement = self._realiseElement(infl)
-            elif isinstance(element, CoordinatedPhraseElement):
-                realisedElement = CoordinatedPhraseHelper.realise(self, element)
-            else:
-                realisedElement = element
-        # Remove the spurious ListElements that have only one element.
+    # Realises an element with a handler that needs its children realised first.
+    def realiseFromChildren(self, element, handler):
+        realisedChildren = []
+        for child in element.getChildren():
+            realisedChildren.append((yield child))
+        return handler(self, element, realisedChildren)
+
+    # Remove the spurious ListElements that have only one element.
+    @staticmethod
+    def removeSingleElementList(realisedElement):
         if isinstance(realisedElement, ListElement):
             if len(realisedElement) == 1:
                 realisedElement = realisedElement.getFirst()
         return realisedElement
 
-    # @Override
+    # Realises a document element from its realised components.
+    def realiseDocumentElement(self, element, realisedChildren):
+        element.setComponents(self.flattenRealisedList(realisedChildren))
+        return element
+
+    # Realises a list element from its realised components.
+    def realiseListElement(self, element, realisedChildren):
+        realisedElement = ListElement()
+        realisedElement.addComponents(self.flattenRealisedList(realisedChildren))
+        return realisedElement
+
+    # Realises an inflected word by adding its lexicon entry.
+    def realiseInflectedWordElement(self, element):
+        baseForm = element.getBaseForm()
+        category = element.getCategory()
+        if self.lexicon is not None and baseForm is not None:
+            word = element.getBaseWord()
+            if word is None:
+                if isinstance(category, LexicalCategory):
+                    word = self.lexicon.lookupWord(baseForm, category)
+                else:
+                    word = self.lexicon.lookupWord(baseForm)
+            if word is not None:
+                element.setBaseWord(word)
+        return element
+
+    # Realises a word element.
+    def realiseWordElement(self, element):
+        # AG: need to check if it's a word element, in which case it
+        # needs to be marked for inflection
+        infl = InflectedWordElement(element)
+        # # the inflected word inherits all features from the base word
+        for feature in element.getAllFeatureNames():
+            infl.setFeature(feature, element.getFeature(feature))
+        return self.startRealisation(infl)
+
+    # Realises a list of elements.
     def _realiseElementList(self, elements):
         realisedList = []
-        childRealisation = None
-        if elements is not None:
-            for eachElement in elements:
-                if eachElement is not None:
-                    childRealisation = self._realiseElement(eachElement)
-                    if childRealisation is not None:
-                        if isinstance(childRealisation, ListElement):
-                            realisedList.extend(childRealisation.getChildren())
-                        else:
-                            realisedList.append(childRealisation)
+        for eachElement in elements:
+            if eachElement is not None:
+                realisedList.append((yield eachElement))
+        return self.flattenRealisedList(realisedList)
+
+    # Removes the empty realisations from a list of realised elements and
+    # replaces each ListElement with its children.
+    def flattenRealisedList(self, realisedChildren):
+        realisedList = []
+        for childRealisation in realisedChildren:
+            if childRealisation is not None:
+                if isinstance(childRealisation, ListElement):
+                    realisedList.extend(childRealisation.getChildren())
+                else:
+                    realisedList.append(childRealisation)
         return realisedList
 
     # Realises a phrase element.
@@ -117,16 +207,9 @@ class SyntaxProcessor(NLGModule):
         realisedElement = None
         if phrase is not None:
             category = phrase.getCategory()
-            if isinstance(category, PhraseCategory):
-                if category == PhraseCategory.CLAUSE:
-                    realisedElement = ClauseHelper.realise(self, phrase)
-                elif category == PhraseCategory.NOUN_PHRASE:
-                    realisedElement = NounPhraseHelper.realise(self, phrase)
-                elif category == PhraseCategory.VERB_PHRASE:
-                    realisedElement = VerbPhraseHelper.realise(self, phrase)
-                elif category in [PhraseCategory.PREPOSITIONAL_PHRASE, PhraseCategory.ADJECTIVE_PHRASE, \
-                        PhraseCategory.ADVERB_PHRASE]:
-                    realisedElement = PhraseHelper.realise(self, phrase)
-                else:
-                    realisedElement = phrase
+            handler = self.phraseHandlers.get(category)
+            if handler is not None:
+                realisedElement = handler(self, phrase)
+            elif isinstance(category, PhraseCategory):
+                realisedElement = phrase
         return realisedElement
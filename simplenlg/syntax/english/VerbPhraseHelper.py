@@ -46,25 +46,25 @@ class VerbPhraseHelper(object):
         mainVerbRealisation = []
         auxiliaryRealisation = []
         if phrase is not None:
-            vgComponents = cls.createVerbGroup(parent, phrase)
+            vgComponents = yield from cls.createVerbGroup(parent, phrase)
             cls.splitVerbGroup(vgComponents, mainVerbRealisation, auxiliaryRealisation)
             realisedElement = ListElement()
             if not phrase.hasFeature(InternalFeature.REALISE_AUXILIARY) or \
                     phrase.getFeatureAsBoolean(InternalFeature.REALISE_AUXILIARY):
-                cls.realiseAuxiliaries(parent, realisedElement, auxiliaryRealisation)
-                PhraseHelper.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
+                yield from cls.realiseAuxiliaries(parent, realisedElement, auxiliaryRealisation)
+                yield from PhraseHelper.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
                     DiscourseFunction.PRE_MODIFIER)
-                cls.realiseMainVerb(parent, phrase, mainVerbRealisation, realisedElement)
+                yield from cls.realiseMainVerb(parent, phrase, mainVerbRealisation, realisedElement)
             elif cls.isCopular(phrase.getHead()):
-                cls.realiseMainVerb(parent, phrase, mainVerbRealisation, realisedElement)
-                PhraseHelper.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
+                yield from cls.realiseMainVerb(parent, phrase, mainVerbRealisation, realisedElement)
+                yield from PhraseHelper.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
                         DiscourseFunction.PRE_MODIFIER)
             else:
-                PhraseHelper.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
+                yield from PhraseHelper.realiseList(parent, realisedElement, phrase.getPreModifiers(), \
                         DiscourseFunction.PRE_MODIFIER)
-                cls.realiseMainVerb(parent, phrase, mainVerbRealisation, realisedElement)
-            cls.realiseComplements(parent, phrase, realisedElement)
-            PhraseHelper.realiseList(parent, realisedElement, phrase.getPostModifiers(), \
+                yield from cls.realiseMainVerb(parent, phrase, mainVerbRealisation, realisedElement)
+            yield from cls.realiseComplements(parent, phrase, realisedElement)
+            yield from PhraseHelper.realiseList(parent, realisedElement, phrase.getPostModifiers(), \
                     DiscourseFunction.POST_MODIFIER)
         return realisedElement
 
@@ -75,7 +75,7 @@ class VerbPhraseHelper(object):
         currentElement = None
         while auxiliaryRealisation:
             aux = auxiliaryRealisation.pop()
-            currentElement = parent.realise(aux)
+            currentElement = (yield aux)
             if currentElement is not None:
                 realisedElement.addComponent(currentElement)
                 currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.AUXILIARY)
@@ -88,7 +88,7 @@ class VerbPhraseHelper(object):
         while mainVerbRealisation:
             main = mainVerbRealisation.pop()
             main.setFeature(Feature.INTERROGATIVE_TYPE, phrase.getFeature(Feature.INTERROGATIVE_TYPE))
-            currentElement = parent.realise(main)
+            currentElement = (yield main)
             if currentElement is not None:
                 realisedElement.addComponent(currentElement)
 
@@ -102,7 +102,7 @@ class VerbPhraseHelper(object):
         currentElement = None
         for complement in phrase.getFeatureAsElementList(InternalFeature.COMPLEMENTS):
             discourseValue = complement.getFeature(InternalFeature.DISCOURSE_FUNCTION)
-            currentElement = parent.realise(complement)
+            currentElement = (yield complement)
             if currentElement is not None:
                 currentElement.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.COMPLEMENT)
                 if DiscourseFunction.INDIRECT_OBJECT==discourseValue:
@@ -156,7 +156,7 @@ class VerbPhraseHelper(object):
                 actualModal = modal
                 if Tense.PAST==tenseValue:
                     modalPast = True
-        cls.pushParticles(phrase, parent, vgComponents)
+        yield from cls.pushParticles(phrase, parent, vgComponents)
         frontVG = cls.grabHeadVerb(phrase, tenseValue, modal is not None)
         cls.checkImperativeInfinitive(formValue, frontVG)
         if phrase.getFeatureAsBoolean(Feature.PASSIVE):
@@ -176,7 +176,11 @@ class VerbPhraseHelper(object):
     @classmethod
     def pushModal(cls, actualModal, phrase, vgComponents):
         if actualModal is not None and not phrase.getFeatureAsBoolean(InternalFeature.IGNORE_MODAL):
-            vgComponents.append(InflectedWordElement(actualModal, LexicalCategory.MODAL))
+            factory = phrase.getFactory()
+            if factory is not None:
+                vgComponents.append(factory.createInflectedWord(actualModal, LexicalCategory.MODAL))
+            else:
+                vgComponents.append(InflectedWordElement(actualModal, LexicalCategory.MODAL))
 
     # Pushes the front verb onto the stack of verb components.
     @classmethod
@@ -295,7 +299,7 @@ class VerbPhraseHelper(object):
         if isinstance(particle, str):
             vgComponents.append(StringElement(particle))
         elif isinstance(particle, NLGElement):
-            vgComponents.append(parent.realise(particle))
+            vgComponents.append((yield particle))
 
     # Determines the number agreement for the phrase ensuring that any number
     # agreement on the parent element is inherited by the phrase.
@@ -21,16 +21,16 @@
 import sys
 import unittest
 sys.path.append('../../..')
-from simplenlg.framework.DocumentElement   import *
-from simplenlg.framework.NLGFactory        import *
-from simplenlg.lexicon.Lexicon             import *
-from simplenlg.realiser.english.Realiser   import *
+from simplenlg.format.english.HTMLFormatter    import *
+from simplenlg.framework.DocumentElement       import *
+from simplenlg.framework.NLGFactory            import *
+from simplenlg.lexicon.Lexicon                 import *
+from simplenlg.realiser.english.Realiser       import *
 
 
 # This tests that two sentences are realised as a list.
 class EnumeratedListTest(unittest.TestCase):
 
-    @unittest.skip("HTMLFormatter not implemented - revise to use TextFormatter")
     def testBulletList(self):
         lexicon = Lexicon.getDefaultLexicon()
         nlgFactory = NLGFactory(lexicon)
@@ -51,12 +51,11 @@ class EnumeratedListTest(unittest.TestCase):
         list_1.addComponent(item2)
         paragraph.addComponent(list_1)
         document.addComponent(paragraph)
-        expectedOutput = "<h1>Document</h1>" + "<p>" + "<ul>" + "This is the first sentence." \
-                       + "This is the second sentence." + "</ul>" + "</p>";
+        expectedOutput = "<h1>Document</h1>" + "<p>" + "<ul>" + "<li>This is the first sentence.</li>" \
+                       + "<li>This is the second sentence.</li>" + "</ul>" + "</p>";
         realisedOutput = realiser.realise(document).getRealisation()
         self.assertEqual(expectedOutput, realisedOutput);
 
-    @unittest.skip("HTMLFormatter not implemented - revise to use TextFormatter")
     def testEnumeratedList(self):
         lexicon = Lexicon.getDefaultLexicon()
         nlgFactory = NLGFactory(lexicon)
@@ -77,8 +76,8 @@ class EnumeratedListTest(unittest.TestCase):
         list_1.addComponent(item2)
         paragraph.addComponent(list_1)
         document.addComponent(paragraph)
-        expectedOutput = "<h1>Document</h1>" + "<p>" + "<ol>" + "This is the first sentence." \
-                       + "This is the second sentence." + "</ol>" + "</p>"
+        expectedOutput = "<h1>Document</h1>" + "<p>" + "<ol>" + "<li>This is the first sentence.</li>" \
+                       + "<li>This is the second sentence.</li>" + "</ol>" + "</p>"
         realisedOutput = realiser.realise(document).getRealisation()
         self.assertEqual(expectedOutput, realisedOutput)
 
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+#
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+import io
+import sys
+import unittest
+sys.path.append('../../..')
+from simplenlg.format.english.HTMLFormatter    import *
+from simplenlg.framework.NLGFactory            import *
+from simplenlg.lexicon.Lexicon                 import *
+from simplenlg.realiser.english.Realiser       import *
+
+
+# HTMLFormatterTest -- Tests the HTMLFormatter.
+class HTMLFormatterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.lexicon = Lexicon.getDefaultLexicon()
+        self.nlgFactory = NLGFactory(self.lexicon)
+        self.realiser = Realiser(self.lexicon)
+        self.realiser.setFormatter(HTMLFormatter())
+
+    def createDocument(self):
+        document = self.nlgFactory.createDocument("Cats & dogs")
+        section = self.nlgFactory.createSection("Section <1>")
+        section.addComponent(self.nlgFactory.createParagraph( \
+                [self.nlgFactory.createSentence("the cat", "chase", "the dog"), \
+                 self.nlgFactory.createSentence("the dog", "run")]))
+        subList = self.nlgFactory.createEnumeratedList()
+        subList.addComponent(self.nlgFactory.createListItem(self.nlgFactory.createSentence("sub-list item")))
+        list_1 = self.nlgFactory.createEnumeratedList()
+        list_1.addComponent(self.nlgFactory.createListItem(self.nlgFactory.createSentence("item 1")))
+        list_1.addComponent(subList)
+        section.addComponent(list_1)
+        document.addComponent(section)
+        return document
+
+    def testDocument(self):
+        expectedOutput = "<h1>Cats &amp; dogs</h1><h2>Section &lt;1&gt;</h2>" + \
+                         "<p>The cat chases the dog. The dog runs.</p>" + \
+                         "<ol><li>Item 1.</li><ol><li>Sub-list item.</li></ol></ol>"
+        self.assertEqual(expectedOutput, self.realiser.realise(self.createDocument()).getRealisation())
+
+    # The output can be written straight to a file
+    def testWriteRealisation(self):
+        expectedOutput = self.realiser.realise(self.createDocument()).getRealisation()
+        sink = self.realiser.writeRealisation(self.createDocument(), io.StringIO())
+        self.assertEqual(expectedOutput, sink.getvalue())
+        # formatters that aren't streamed write their realisation
+        self.realiser.setFormatter(None)
+        sink = self.realiser.writeRealisation(self.nlgFactory.createSentence("the dog", "run"), io.StringIO())
+        self.assertEqual("The dog runs.", sink.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()     # runs all methods that start with 'test'
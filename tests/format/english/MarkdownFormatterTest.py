@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+#
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+import sys
+import unittest
+sys.path.append('../../..')
+from simplenlg.format.english.MarkdownFormatter    import *
+from simplenlg.framework.NLGFactory                import *
+from simplenlg.lexicon.Lexicon                     import *
+from simplenlg.realiser.english.Realiser           import *
+
+
+# MarkdownFormatterTest -- Tests the MarkdownFormatter.
+class MarkdownFormatterTest(unittest.TestCase):
+
+    def testDocument(self):
+        lexicon = Lexicon.getDefaultLexicon()
+        nlgFactory = NLGFactory(lexicon)
+        realiser = Realiser(lexicon)
+        realiser.setFormatter(MarkdownFormatter())
+        document = nlgFactory.createDocument("Document")
+        section = nlgFactory.createSection("Section")
+        section.addComponent(nlgFactory.createParagraph( \
+                [nlgFactory.createSentence("the cat", "chase", "the dog"), \
+                 nlgFactory.createSentence("the dog", "run")]))
+        bullets = nlgFactory.createList()
+        bullets.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("item 1")))
+        bullets.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("item 2")))
+        section.addComponent(nlgFactory.createParagraph(bullets))
+        subList = nlgFactory.createEnumeratedList()
+        subList.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("sub-list item 1")))
+        subList.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("sub-list item 2")))
+        numbers = nlgFactory.createEnumeratedList()
+        numbers.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("first")))
+        numbers.addComponent(subList)
+        section.addComponent(numbers)
+        section.addComponent(nlgFactory.createParagraph(nlgFactory.createSentence("the end")))
+        document.addComponent(section)
+        expectedOutput = "# Document\n" + \
+                         "\n" + \
+                         "## Section\n" + \
+                         "\n" + \
+                         "The cat chases the dog. The dog runs.\n" + \
+                         "\n" + \
+                         "* Item 1.\n" + \
+                         "* Item 2.\n" + \
+                         "\n" + \
+                         "1. First.\n" + \
+                         "    1. Sub-list item 1.\n" + \
+                         "    2. Sub-list item 2.\n" + \
+                         "\n" + \
+                         "The end.\n" + \
+                         "\n"
+        self.assertEqual(expectedOutput, realiser.realise(document).getRealisation())
+
+    # Tests that text which looks like Markdown is escaped, and that an item
+    # that starts with a nested list has no space after its number
+    def testEscapingAndNestedItems(self):
+        lexicon = Lexicon.getDefaultLexicon()
+        nlgFactory = NLGFactory(lexicon)
+        realiser = Realiser(lexicon)
+        realiser.setFormatter(MarkdownFormatter())
+        numbers = nlgFactory.createEnumeratedList()
+        numbers.addComponent(nlgFactory.createListItem(nlgFactory.createStringElement("1. *not* a _list_")))
+        bullets = nlgFactory.createList()
+        bullets.addComponent(nlgFactory.createListItem(nlgFactory.createStringElement("# [link] `code`")))
+        item = nlgFactory.createListItem()
+        item.addComponent(bullets)
+        numbers.addComponent(item)
+        item = nlgFactory.createListItem(nlgFactory.createStringElement("three"))
+        item.addComponent(nlgFactory.createList(nlgFactory.createListItem(nlgFactory.createStringElement("- x"))))
+        numbers.addComponent(item)
+        expectedOutput = "1. 1\\. \\*not\\* a \\_list\\_\n" + \
+                         "2.\n" + \
+                         "    * \\# \\[link\\] \\`code\\`\n" + \
+                         "3. three\n" + \
+                         "    * \\- x\n" + \
+                         "\n"
+        self.assertEqual(expectedOutput, realiser.realise(numbers).getRealisation())
+
+
+if __name__ == '__main__':
+    unittest.main()     # runs all methods that start with 'test'
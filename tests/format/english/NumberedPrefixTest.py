@@ -76,6 +76,30 @@ class NumberedPrefixTest(unittest.TestCase):
         prefix.downALevel()
         self.assertEqual("3.4", prefix.getPrefix())
 
+    def testNumberingSchemes(self):
+        self.assertEqual("aa",      NumberedPrefix.alpha(27))
+        self.assertEqual("zz",      NumberedPrefix.alpha(702))
+        self.assertEqual("mcmxciv", NumberedPrefix.roman(1994))
+        prefix = NumberedPrefix([NumberedPrefix.arabic, NumberedPrefix.alpha, NumberedPrefix.roman])
+        prefix.upALevel()
+        prefix.upALevel()
+        prefix.increment()
+        prefix.upALevel()
+        prefix.upALevel()
+        prefix.increment()
+        self.assertEqual("1.b.i.ii", prefix.getPrefix())
+        prefix.downALevel()
+        self.assertEqual("1.b.i", prefix.getPrefix())
+
+    def testManyIncrements(self):
+        prefix = NumberedPrefix()
+        prefix.upALevel()
+        for _ in range(2, 100001):
+            prefix.increment()
+        prefix.upALevel()
+        self.assertEqual("100000.1", prefix.getPrefix())
+        self.assertEqual([100000, 1], prefix.getCounters())
+
 
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
@@ -149,5 +149,57 @@ class TextFormatterTest(unittest.TestCase):
         self.assertEquals(expectedOutput, realisedOutput)
 
 
+    # Nesting deeper than Python's recursion limit only costs memory
+    def testDeeplyNestedEnumeratedList(self):
+        lexicon = Lexicon.getDefaultLexicon()
+        nlgFactory = NLGFactory(lexicon)
+        realiser = Realiser(lexicon)
+        depth = sys.getrecursionlimit() + 100
+        document = nlgFactory.createDocument("Document")
+        currentList = nlgFactory.createEnumeratedList()
+        document.addComponent(currentList)
+        for _ in range(depth):
+            item = nlgFactory.createListItem()
+            item.addComponent(nlgFactory.createSentence("this", "be", "an item"))
+            subList = nlgFactory.createEnumeratedList()
+            currentList.addComponent(item)
+            currentList.addComponent(subList)
+            currentList = subList
+        lines = realiser.realise(document).getRealisation().split("\n")
+        self.assertEqual("1 - This is an item.", lines[2])
+        self.assertEqual("2.1 - This is an item.", lines[3])
+        self.assertEqual("2" + ".2"*(depth-2) + ".1 - This is an item.", lines[depth+1])
+
+
+    def testNumberingSchemes(self):
+        lexicon = Lexicon.getDefaultLexicon()
+        nlgFactory = NLGFactory(lexicon)
+        realiser = Realiser(lexicon)
+        formatter = TextFormatter()
+        formatter.setNumberingSchemes([NumberedPrefix.roman, NumberedPrefix.alpha])
+        realiser.setFormatter(formatter)
+
+        def createDocument():
+            subList = nlgFactory.createEnumeratedList()
+            subList.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("sub-list item 1")))
+            subList.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("sub-list item 2")))
+            list_1 = nlgFactory.createEnumeratedList()
+            list_1.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("item 1")))
+            list_1.addComponent(subList)
+            list_1.addComponent(nlgFactory.createListItem(nlgFactory.createSentence("item 3")))
+            document = nlgFactory.createDocument()
+            document.addComponent(list_1)
+            return document
+
+        expectedOutput = "i - Item 1.\n" + \
+                         "ii.a - Sub-list item 1.\n" + \
+                         "ii.b - Sub-list item 2.\n" + \
+                         "iii - Item 3.\n"
+        self.assertEqual(expectedOutput, realiser.realise(createDocument()).getRealisation())
+        # each realisation starts its own numbering
+        self.assertEqual(expectedOutput, realiser.realise(createDocument()).getRealisation())
+        self.assertEqual("0", formatter.numberedPrefix.getPrefix())
+
+
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
@@ -29,11 +29,37 @@ class DeterminerAgrHelperTest(unittest.TestCase):
     def testRequiresAn(self):
         self.assertTrue(DeterminerAgrHelper.requiresAn("elephant"))
         self.assertFalse(DeterminerAgrHelper.requiresAn("cow"))
-        # Does not hand phonetics
-        self.assertFalse(DeterminerAgrHelper.requiresAn("hour"))
-        # But does have exceptions for some numerals
+        # Exceptions where the spelling and the sound differ
+        self.assertTrue(DeterminerAgrHelper.requiresAn("hour"))
+        self.assertTrue(DeterminerAgrHelper.requiresAn("Honest"))
+        self.assertFalse(DeterminerAgrHelper.requiresAn("university"))
+        self.assertFalse(DeterminerAgrHelper.requiresAn("European"))
+        self.assertTrue(DeterminerAgrHelper.requiresAn("unimportant"))
         self.assertFalse(DeterminerAgrHelper.requiresAn("one"))
+        self.assertFalse(DeterminerAgrHelper.requiresAn(""))
+        # And numerals
         self.assertFalse(DeterminerAgrHelper.requiresAn("100"))
+        self.assertTrue(DeterminerAgrHelper.requiresAn("8"))
+        self.assertTrue(DeterminerAgrHelper.requiresAn("18,000"))
+        self.assertFalse(DeterminerAgrHelper.requiresAn("180,000"))
+        self.assertTrue(DeterminerAgrHelper.requiresAn("11%"))
+
+    # Words and numbers whose article the exceptions must not change
+    def testRequiresAnRegressions(self):
+        for word in ["unanswered", "unannounced", "unanticipated", "unidentified", "unissued"]:
+            self.assertTrue(DeterminerAgrHelper.requiresAn(word), word)
+        for word in ["unanimous", "unison", "unisex", "unidirectional", "10800", "17900", "10,800"]:
+            self.assertFalse(DeterminerAgrHelper.requiresAn(word), word)
+
+    def testAddException(self):
+        self.assertFalse(DeterminerAgrHelper.requiresAn("fbi agent"))
+        DeterminerAgrHelper.addException("fbi", True)
+        try:
+            self.assertTrue(DeterminerAgrHelper.requiresAn("FBI agent"))
+            self.assertFalse(DeterminerAgrHelper.requiresAn("fb"))
+        finally:
+            DeterminerAgrHelper.addException("fbi", None)
+        self.assertFalse(DeterminerAgrHelper.requiresAn("fbi agent"))
 
     def testCheckEndsWithIndefiniteArticle1(self):
         cannedText = "I see a"
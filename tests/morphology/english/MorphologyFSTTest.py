@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+#
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+import os
+import sys
+import tempfile
+import unittest
+sys.path.append('../../..')
+from simplenlg.features.Feature                     import *
+from simplenlg.features.LexicalFeature              import *
+from simplenlg.features.Tense                       import *
+from simplenlg.framework.LexicalCategory            import *
+from simplenlg.framework.NLGFactory                 import *
+from simplenlg.lexicon.Lexicon                      import *
+from simplenlg.morphology.english.MorphologyFST     import *
+from simplenlg.realiser.english.Realiser            import *
+
+
+class MorphologyFSTTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.lexicon = Lexicon.getDefaultLexicon()
+        cls.fst     = MorphologyFST.fromLexicon(cls.lexicon)
+
+    def setUp(self):
+        self.factory  = NLGFactory(self.lexicon)
+        self.realiser = Realiser(self.lexicon)
+
+    # Words that only have one entry for their base form and category
+    def getUnambiguousWords(self, category):
+        counts = {}
+        for word in self.lexicon.words:
+            key = (word.getBaseForm(), word.getCategory())
+            counts[key] = counts.get(key, 0) + 1
+        return sorted(word.getBaseForm() for word in self.lexicon.words \
+                      if word.getCategory() == category and counts[(word.getBaseForm(), category)] == 1)
+
+    def testGenerate(self):
+        self.assertEqual("children", self.fst.generate("child", LexicalCategory.NOUN, LexicalFeature.PLURAL))
+        self.assertEqual("went",     self.fst.generate("go", LexicalCategory.VERB, LexicalFeature.PAST))
+        self.assertEqual("tying",    self.fst.generate("tie", LexicalCategory.VERB, LexicalFeature.PRESENT_PARTICIPLE))
+        self.assertEqual("better",   self.fst.generate("good", LexicalCategory.ADJECTIVE, LexicalFeature.COMPARATIVE))
+        self.assertIsNone(self.fst.generate("glorp", LexicalCategory.NOUN, LexicalFeature.PLURAL))
+
+    # The compiled forms are the ones the realiser makes
+    def testGenerateMatchesRealiser(self):
+        for noun in self.getUnambiguousWords(LexicalCategory.NOUN)[::10]:
+            np = self.factory.createNounPhrase(noun)
+            np.setPlural(True)
+            self.assertEqual(self.realiser.realise(np).getRealisation(), \
+                             self.fst.generate(noun, LexicalCategory.NOUN, LexicalFeature.PLURAL), noun)
+        for verb in self.getUnambiguousWords(LexicalCategory.VERB)[::10]:
+            vp = self.factory.createVerbPhrase(verb)
+            vp.setFeature(Feature.TENSE, Tense.PAST)
+            self.assertEqual(self.realiser.realise(vp).getRealisation(), \
+                             self.fst.generate(verb, LexicalCategory.VERB, LexicalFeature.PAST), verb)
+
+    def testAnalyse(self):
+        self.assertEqual([("go", LexicalCategory.VERB, LexicalFeature.PAST)], self.fst.analyse("went"))
+        self.assertEqual([("child", LexicalCategory.NOUN, LexicalFeature.PLURAL)], self.fst.analyse("children"))
+        self.assertIn(("dog", LexicalCategory.NOUN, LexicalFeature.BASE_FORM), self.fst.analyse("dog"))
+        self.assertEqual([], self.fst.analyse("glorps"))
+        # every generated form analyses back to its lemma
+        for word in sorted(self.lexicon.words, key=lambda w: (w.getBaseForm(), w.getId() or ""))[::20]:
+            for tag, form in MorphologyFST.getWordForms(word):
+                self.assertIn((word.getBaseForm(), word.getCategory(), tag), self.fst.analyse(form))
+
+    def testMinimised(self):
+        forms = set()
+        for word in self.lexicon.words:
+            forms.update(form for tag, form in MorphologyFST.getWordForms(word))
+        # far fewer states than the characters in the forms (ie, the size of a trie)
+        self.assertLess(self.fst.analyser.getNumStates(), sum(len(form) for form in forms) / 5)
+
+    def testSaveAndLoad(self):
+        fd, filename = tempfile.mkstemp(suffix='.gz')
+        os.close(fd)
+        try:
+            self.fst.save(filename)
+            loaded = MorphologyFST.load(filename)
+        finally:
+            os.remove(filename)
+        self.assertEqual(self.fst.analyser.getNumStates(), loaded.analyser.getNumStates())
+        for form in ["went", "children", "dog", "tying", "glorps", "better"]:
+            self.assertEqual(self.fst.analyse(form), loaded.analyse(form))
+        self.assertEqual(self.fst.getForms("go"), loaded.getForms("go"))
+
+    # The lexicon can use the compiled forms for its variant index
+    def testLexiconVariants(self):
+        lexicon = Lexicon.getDefaultLexicon()
+        self.assertTrue(lexicon.hasWordFromVariant("tiing", LexicalCategory.VERB))
+        self.assertFalse(lexicon.hasWordFromVariant("tying", LexicalCategory.VERB))
+        lexicon.setMorphologyFST(self.fst)
+        self.assertFalse(lexicon.hasWordFromVariant("tiing", LexicalCategory.VERB))
+        self.assertTrue(lexicon.hasWordFromVariant("tying", LexicalCategory.VERB))
+        self.assertEqual("tie", lexicon.lookupWord("tying").getBaseForm())
+        self.assertEqual("be", lexicon.lookupWord("were").getBaseForm())
+
+    # Homographs are only indexed under the forms of their own entry
+    def testLexiconHomographVariants(self):
+        lexicon = Lexicon.getDefaultLexicon()
+        dog = WordElement("dog", LexicalCategory.NOUN, "E_dog2")
+        dog.setFeature(LexicalFeature.PLURAL, "doggies")
+        lexicon.IndexWord(dog)
+        lexicon.setMorphologyFST(MorphologyFST.fromLexicon(lexicon))
+        doggies = lexicon.getWordsFromVariant("doggies", LexicalCategory.NOUN)
+        self.assertEqual(["E_dog2"], [word.getId() for word in doggies])
+        dogs = lexicon.getWordsFromVariant("dogs", LexicalCategory.NOUN)
+        self.assertNotIn("E_dog2", [word.getId() for word in dogs])
+        self.assertEqual(1, len(dogs))
+
+
+if __name__ == '__main__':
+    unittest.main()
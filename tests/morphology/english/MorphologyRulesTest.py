@@ -0,0 +1,160 @@
+#!/usr/bin/python3
+#
+# The contents of this file are subject to the Mozilla Public License
+# Version 1.1 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS"
+# basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+# License for the specific language governing rights and limitations
+# under the License.
+#
+# The Original Code is "Simplenlg".
+#
+# The Initial Developer of the Original Code is Ehud Reiter, Albert Gatt and Dave Westwater.
+# Portions created by Ehud Reiter, Albert Gatt and Dave Westwater are
+# Copyright (C) 2010-11 The University of Aberdeen. All Rights Reserved.
+#
+# Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
+
+import random
+import re
+import sys
+import unittest
+sys.path.append('../../..')
+from simplenlg.lexicon.Lexicon                      import *
+from simplenlg.morphology.english.MorphologyRules   import *
+
+
+# The regular expression versions of the regular inflection rules, used as
+# the reference for the suffix rule tables.
+class RegexRules(object):
+    @staticmethod
+    def regularPluralNoun(baseForm):
+        if re.fullmatch(r".*[^aeiou]y\b", baseForm):
+            return re.sub(r"y\b", "ies", baseForm)
+        elif re.fullmatch(r".*([szx]|[cs]h)\b", baseForm):
+            return baseForm + "es"
+        return baseForm + "s"
+
+    @staticmethod
+    def grecoLatinPluralNoun(baseForm):
+        if baseForm.endswith("us"):
+            return re.sub(r"us\b", "i", baseForm)
+        elif baseForm.endswith("ma"):
+            return baseForm + "ta"
+        elif baseForm.endswith("a"):
+            return baseForm + "e"
+        elif re.fullmatch(r".*(um|on)\b", baseForm):
+            return re.sub(r"(um|on)\b",  "a", baseForm)
+        elif baseForm.endswith("sis"):
+            return re.sub(r"sis\b", "ses", baseForm)
+        elif baseForm.endswith("is"):
+            return re.sub(r"is\b", "ides", baseForm)
+        elif baseForm.endswith("men"):
+            return re.sub(r"men\b", "mina", baseForm)
+        elif baseForm.endswith("ex"):
+            return re.sub(r"ex\b", "ices", baseForm)
+        elif baseForm.endswith("x"):
+            return re.sub(r"x\b", "ces", baseForm)
+        return baseForm
+
+    @staticmethod
+    def present3SVerb(baseForm):
+        if re.fullmatch(r".*[szx(ch)(sh)]\b", baseForm):
+            return baseForm + "es"
+        elif re.fullmatch(r".*[^aeiou]y\b", baseForm):
+            return re.sub(r"y\b", "ies", baseForm)
+        return baseForm + "s"
+
+    @staticmethod
+    def regularPastVerb(baseForm):
+        if baseForm.endswith("e"):
+            return baseForm + "d"
+        elif re.fullmatch(r".*[^aeiou]y\b",  baseForm):
+            return re.sub(r"y\b", "ied", baseForm)
+        return baseForm + "ed"
+
+    @staticmethod
+    def regularPresPartVerb(baseForm):
+        if baseForm.endswith("ie"):
+            return re.sub(r"ie\b", "ying", baseForm)
+        elif re.fullmatch(r".*[^iyeo]e\b", baseForm):
+            return re.sub(r"e\b", "ing", baseForm)
+        return baseForm + "ing"
+
+    @staticmethod
+    def regularComparative(baseForm):
+        if re.fullmatch(r".*[^aeiou]y\b", baseForm):
+            return re.sub(r"y\b", "ier", baseForm)
+        elif baseForm.endswith("e"):
+            return baseForm + "r"
+        return baseForm + "er"
+
+    @staticmethod
+    def regularSuperlative(baseForm):
+        if re.fullmatch(r".*[^aeiou]y\b", baseForm):
+            return re.sub(r"y\b", "iest", baseForm)
+        elif baseForm.endswith("e"):
+            return baseForm + "st"
+        return baseForm + "est"
+
+
+class MorphologyRulesTest(unittest.TestCase):
+    # Strings that exercise the corners of the regular expressions
+    EDGE_CASES = [ "", "y", "e", "ie", "ay", "by", "Ay", "BY", "toy boy", "fly by", "lady-fly",
+                   "fly_by", "fly\nby", "\ny", "a\nby", "x\ny", "dog\n", "box\n", "cactus virus",
+                   "bus stop us", "datum-on", "um", "onion", "axis crisis", "basis_is", "stamen men",
+                   "index-ex", "matrix x", "tie tie", "make love", "free e", "see", "eye", "church",
+                   "fish", "tic", "watch(", "ch)", "café", "naïve", "flyé fly", "2y", "y2 y",
+                   "dry\ttry", "try.", "éy", "stuff's y" ]
+
+    @classmethod
+    def setUpClass(cls):
+        lexicon = Lexicon.getDefaultLexicon()
+        words = set(cls.EDGE_CASES)
+        words.update(word.getBaseForm() for word in lexicon.words)
+        words.update(lexicon.indexByVariant.keys())
+        # plus random strings made from the characters the rules look at
+        rng = random.Random(0)
+        for i in range(5000):
+            words.add(''.join(rng.choice("aeiouyszxchmnt -_\n") for j in range(rng.randint(1, 8))))
+        words.discard(None)
+        cls.words = sorted(words)
+
+    def assertSameAsRegex(self, builder, reference):
+        for word in self.words:
+            self.assertEqual(builder(word), reference(word), repr(word))
+
+    def testRegularPluralNoun(self):
+        self.assertSameAsRegex(MorphologyRules.buildRegularPluralNoun, RegexRules.regularPluralNoun)
+
+    def testGrecoLatinPluralNoun(self):
+        self.assertSameAsRegex(lambda w: MorphologyRules.buildGrecoLatinPluralNoun(w) if w else None, \
+                               lambda w: RegexRules.grecoLatinPluralNoun(w) if w else None)
+
+    def testPresent3SVerb(self):
+        self.assertSameAsRegex(MorphologyRules.buildPresent3SVerb, \
+                               lambda w: "is" if w.lower() == "be" else RegexRules.present3SVerb(w))
+
+    def testRegularPastVerb(self):
+        self.assertSameAsRegex(lambda w: MorphologyRules.buildRegularPastVerb(w, None, None), \
+                               lambda w: "was" if w.lower() == "be" else RegexRules.regularPastVerb(w))
+
+    def testRegularPresPartVerb(self):
+        self.assertSameAsRegex(MorphologyRules.buildRegularPresPartVerb, \
+                               lambda w: "being" if w.lower() == "be" else RegexRules.regularPresPartVerb(w))
+
+    def testRegularComparativeAndSuperlative(self):
+        self.assertSameAsRegex(MorphologyRules.buildRegularComparative, RegexRules.regularComparative)
+        self.assertSameAsRegex(MorphologyRules.buildRegularSuperlative, RegexRules.regularSuperlative)
+
+    def testRewriteAll(self):
+        self.assertEqual("cacti viri",   MorphologyRules.buildGrecoLatinPluralNoun("cactus virus"))
+        self.assertEqual("flies bies",   MorphologyRules.buildRegularPluralNoun("fly by"))
+        self.assertEqual("making loving", MorphologyRules.buildRegularPresPartVerb("make love"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,7 @@ from simplenlg.features.Gender              import *
 from simplenlg.framework.DocumentElement    import *
 from simplenlg.framework.NLGElement         import *
 from simplenlg.framework.NLGFactory         import *
+from simplenlg.framework.StringElement      import *
 from simplenlg.framework.LexicalCategory    import *
 from simplenlg.lexicon.Lexicon              import *
 from simplenlg.phrasespec.NPPhraseSpec      import *
@@ -122,6 +123,89 @@ class RealiserTest(unittest.TestCase):
         sisterNP.setPlural(True);
         self.assertEqual("his sisters", self.realiser.realise(sisterNP).getRealisation())
 
+    # Tests realising a custom element type through a registered handler
+    def testRegisteredElementHandler(self):
+        class NumberElement(NLGElement):
+            def __init__(self, number):
+                super().__init__()
+                self.number = number
+            def getChildren(self):
+                return []
+        words = {1:"one", 2:"two", 3:"three"}
+        self.realiser.syntax.registerElementHandler(NumberElement, \
+                lambda processor, element: StringElement(words[element.number]))
+        np = self.nlgFactory.createNounPhrase(NumberElement(3))
+        clause = self.nlgFactory.createClause("I", "see", np)
+        self.assertEqual("I see three", self.realiser.realise(clause).getRealisation())
+        # morphology handlers can be replaced by category
+        self.realiser.morphology.registerCategoryHandler(LexicalCategory.ADVERB, \
+                lambda element, baseWord: StringElement(element.getBaseForm().upper()))
+        clause.addModifier("quickly")
+        self.assertEqual("I QUICKLY see three", self.realiser.realise(clause).getRealisation())
+
+    # Tests that inflected words are cached, and that the cache follows
+    # changes to the features and to the lexicon
+    def testMorphologyCache(self):
+        np = self.nlgFactory.createNounPhrase("the", "dog")
+        np.setPlural(True)
+        self.assertEqual("the dogs", self.realiser.realise(np).getRealisation())
+        misses = self.realiser.getStats()['morphologyCache']['misses']
+        self.assertEqual("the dogs", self.realiser.realise(np).getRealisation())
+        stats = self.realiser.getStats()['morphologyCache']
+        self.assertEqual(misses, stats['misses'])
+        self.assertTrue(stats['hits'] > 0)
+        # the base word's features are part of the key
+        np.getHead().setFeature(LexicalFeature.PLURAL, "doggies")
+        self.assertEqual("the doggies", self.realiser.realise(np).getRealisation())
+        # words without a base word are cached until the lexicon changes
+        def pluralGlorp():
+            word = InflectedWordElement("glorp", LexicalCategory.NOUN)
+            word.setPlural(True)
+            return self.realiser.morphology.realise(word).getRealisation()
+        self.assertEqual("glorps", pluralGlorp())
+        glorp = WordElement("glorp", LexicalCategory.NOUN)
+        glorp.setFeature(LexicalFeature.PLURAL, "glorpen")
+        self.lexicon.IndexWord(glorp)
+        self.assertEqual("glorpen", pluralGlorp())
+        self.realiser.setLexicon(Lexicon.getDefaultLexicon())
+        self.assertEqual(0, self.realiser.getStats()['morphologyCache']['size'])
+        self.assertEqual("glorps", pluralGlorp())
+
+    # Tests that a lexicon subclass that doesn't call Lexicon.__init__ works
+    # with the caches, which check its version
+    def testLexiconWithoutInit(self):
+        class WordListLexicon(Lexicon):
+            def __init__(self, words):
+                self.words = words
+            def getWords(self, baseForm, category):
+                return [word for word in self.words if word.getBaseForm() == baseForm and \
+                        category in (None, LexicalCategory.ANY, word.getCategory())]
+            def getWordsByID(self, wid):
+                return []
+            def getWordsFromVariant(self, variant, category):
+                return self.getWords(variant, category)
+        lexicon = WordListLexicon([WordElement("dog", LexicalCategory.NOUN)])
+        self.assertEqual(0, lexicon.getVersion())
+        np = NLGFactory(lexicon).createNounPhrase("the", "dog")
+        np.setPlural(True)
+        self.assertEqual("the dogs", Realiser(lexicon).realise(np).getRealisation())
+
+    # Tests inflecting many words at once
+    def testInflectMany(self):
+        nouns = ["dog", "child", "box", "man", "dog", "sheep", "party", "glorp", "child"]
+        plurals = self.realiser.inflectMany(nouns, LexicalCategory.NOUN, {Feature.NUMBER: NumberAgreement.PLURAL})
+        self.assertEqual(["dogs", "children", "boxes", "men", "dogs", "sheep", "parties", "glorps", "children"], \
+                         plurals)
+        # same as realising each word on its own
+        for noun, plural in zip(nouns, plurals):
+            word = InflectedWordElement(noun, LexicalCategory.NOUN)
+            word.setPlural(True)
+            self.assertEqual(plural, self.realiser.realise(word).getRealisation())
+        # any iterable can be used
+        verbs = ("go", "kick", "try", "be")
+        past = self.realiser.inflectMany((verb for verb in verbs), LexicalCategory.VERB, {Feature.TENSE: Tense.PAST})
+        self.assertEqual(["went", "kicked", "tried", "was"], past)
+        self.assertEqual([], self.realiser.inflectMany([], LexicalCategory.VERB))
 
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
@@ -18,6 +18,7 @@
 #
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
+import sys
 from SimpleNLG4Test                                  import *
 from simplenlg.features.ClauseStatus                 import *
 from simplenlg.features.DiscourseFunction            import *
@@ -590,5 +591,42 @@ class ClauseTest(SimpleNLG4Test):
                 self.realiser.realise(s).getRealisation())
 
 
+    # Test that realising a clause again doesn't copy its postmodifiers into
+    # the verb phrase twice, including after a postmodifier is added
+    def testRepeatedRealisationPostModifiers(self):
+        s = self.phraseFactory.createClause("the man", "walk")
+        for place in ["the park", "the garden", "the street"]:
+            s.addPostModifier(self.phraseFactory.createPrepositionPhrase("in", \
+                    self.phraseFactory.createNounPhrase(place)))
+        expected = "the man walks in the park in the garden in the street"
+        self.assertEqual(expected, self.realiser.realise(s).getRealisation())
+        self.assertEqual(expected, self.realiser.realise(s).getRealisation())
+        s.addPostModifier("today")
+        self.assertEqual(expected + " today", self.realiser.realise(s).getRealisation())
+        self.assertEqual(4, len(s.getVerbPhrase().getPostModifiers()))
+        # a postmodifier equal to one the VP already has isn't copied
+        s = self.phraseFactory.createClause("the man", "walk")
+        s.getVerbPhrase().addPostModifier(self.phraseFactory.createPrepositionPhrase("in", \
+                self.phraseFactory.createNounPhrase("the", "park")))
+        s.addPostModifier(self.phraseFactory.createPrepositionPhrase("in", \
+                self.phraseFactory.createNounPhrase("the", "park")))
+        self.assertEqual("the man walks in the park", self.realiser.realise(s).getRealisation())
+
+    # Test that embedded clauses and coordinated phrases nested deeper than
+    # Python's recursion limit only cost memory
+    def testDeeplyEmbeddedClauses(self):
+        depth = sys.getrecursionlimit() + 100
+        s = self.phraseFactory.createClause("Mary", "leave")
+        for i in range(depth):
+            s = self.phraseFactory.createClause("John", "say", s)
+        expected = "John says that " * depth + "Mary leaves."
+        self.assertEqual(expected, self.realiser.realiseSentence(s))
+        coord = self.phraseFactory.createNounPhrase("the", "dog")
+        for i in range(depth):
+            coord = self.phraseFactory.createCoordinatedPhrase(coord, self.phraseFactory.createNounPhrase("a", "cat"))
+        s = self.phraseFactory.createClause(coord, "run")
+        expected = "The dog" + " and a cat" * depth + " run."
+        self.assertEqual(expected, self.realiser.realiseSentence(s))
+
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
@@ -119,5 +119,26 @@ class CoordinationTest(SimpleNLG4Test):
         self.assertEqual("he does not have asthma and he has diabetes", realisation)
 
 
+    # Test a coordination with many coordinates, where the conjunction is
+    # shared between them until one of them is changed
+    def testWideCoordination(self):
+        self.assertEqual(500, len(self.createWideCoordination(500).getChildren()))
+        realisation = self.realiser.realise(self.createWideCoordination(500)).getRealisation()
+        self.assertTrue(realisation.startswith("the product 0, the product 1, the product 2, "))
+        self.assertTrue(realisation.endswith(", the product 498 and the product 499"))
+        self.assertEqual(498, realisation.count(","))
+        coordinated = self.realiser.syntax.realise(self.createWideCoordination(500))
+        conjunctions = coordinated.getChildren()[1::2]
+        self.assertEqual(499, len(conjunctions))
+        conjunctions[0].setFeature(Feature.CONJUNCTION, "or")
+        self.assertEqual(None, conjunctions[1].getFeature(Feature.CONJUNCTION))
+
+    def createWideCoordination(self, count):
+        coord = self.phraseFactory.createCoordinatedPhrase()
+        for i in range(count):
+            coord.addCoordinate(self.phraseFactory.createNounPhrase("the", "product %d" % i))
+        return coord
+
+
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
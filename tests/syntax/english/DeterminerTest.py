@@ -82,6 +82,31 @@ class DeterminerTest(SimpleNLG4Test):
         output = self.realiser.realiseSentence(sentence)
         self.assertEqual("A one.", output)
 
+    # testSharedDeterminerWords - closed-class words are shared copy-on-write
+    def testSharedDeterminerWords(self):
+        the1 = self.phraseFactory.createWord("the", LexicalCategory.DETERMINER)
+        the2 = self.phraseFactory.createWord("the", LexicalCategory.DETERMINER)
+        self.assertIsNot(the1, the2)
+        self.assertIs(the1.getAllFeatures(), the2.getAllFeatures())
+        # setting a feature on one copy doesn't change the other
+        the1.setFeature(Feature.NUMBER, NumberAgreement.PLURAL)
+        self.assertEqual(NumberAgreement.PLURAL, the1.getFeature(Feature.NUMBER))
+        self.assertIsNone(the2.getFeature(Feature.NUMBER))
+        self.assertIsNone(self.phraseFactory.createWord("the", \
+                LexicalCategory.DETERMINER).getFeature(Feature.NUMBER))
+        # a determiner used in two noun phrases
+        np1 = self.phraseFactory.createNounPhrase("a", "dog")
+        np2 = self.phraseFactory.createNounPhrase("a", "dog")
+        np2.setPlural(True)
+        self.assertEqual("a dog", self.realiser.realise(np1).getRealisation())
+        self.assertEqual("some dogs", self.realiser.realise(np2).getRealisation())
+        self.assertEqual("a dog", self.realiser.realise(np1).getRealisation())
+        # the shared words follow words added to the lexicon
+        self.assertIsNone(self.phraseFactory.createWord("yon", LexicalCategory.DETERMINER).getId())
+        self.lexicon.IndexWord(WordElement("yon", LexicalCategory.DETERMINER, "E_yon"))
+        self.assertEqual("E_yon", self.phraseFactory.createWord("yon", LexicalCategory.DETERMINER).getId())
+        self.assertEqual("E_yon", self.phraseFactory.createWordIfWord("yon", LexicalCategory.DETERMINER).getId())
+
 
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
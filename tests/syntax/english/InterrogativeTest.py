@@ -25,6 +25,7 @@ from simplenlg.framework  import NLGElement, NLGFactory, PhraseElement
 from simplenlg.lexicon    import Lexicon
 from simplenlg.phrasespec import PhraseElement, NPPhraseSpec, PPPhraseSpec, SPhraseSpec
 from simplenlg.realiser.english  import Realiser
+from simplenlg.syntax.english    import ClauseHelper
 
 
 class InterrogativeTest(SimpleNLG4Test):
@@ -505,5 +506,25 @@ class InterrogativeTest(SimpleNLG4Test):
         realisation = self.realiser.realiseSentence(clause)
         self.assertEqual("What do you think about John?", realisation)
 
+    # Test that questions of the same kind share an interrogative plan, and
+    # only realise their own words
+    def testInterrogativePlans(self):
+        results = []
+        for subject, verb, obj in [("the man", "kick", "the dog"), ("the woman", "see", "the cat")]:
+            for itype in [InterrogativeType.YES_NO, InterrogativeType.WHO_OBJECT, InterrogativeType.WHY]:
+                clause = self.phraseFactory.createClause(subject, verb, obj)
+                clause.setFeature(Feature.TENSE, Tense.PAST)
+                clause.setFeature(Feature.INTERROGATIVE_TYPE, itype)
+                results.append(self.realiser.realiseSentence(clause))
+        self.assertEqual(["Did the man kick the dog?", "Who did the man kick?", "Why did the man kick the dog?", \
+            "Did the woman see the cat?", "Who did the woman see?", "Why did the woman see the cat?"], results)
+        # the plans are a read-only table with one plan per key
+        self.assertEqual(((), False, ClauseHelper.DO_AUXILIARY), \
+                ClauseHelper.INTERROGATIVE_PLANS[ClauseHelper.getInterrogativePlanKey(clause, \
+                clause.getVerbPhrase(), InterrogativeType.YES_NO)])
+        with self.assertRaises(TypeError):
+            ClauseHelper.INTERROGATIVE_PLANS[(InterrogativeType.YES_NO,)] = ((), False, None)
+
+
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
@@ -56,6 +56,19 @@ class NounPhraseTest(SimpleNLG4Test):
         self.proTest2.setFeature(InternalFeature.DISCOURSE_FUNCTION, DiscourseFunction.OBJECT)
         self.assertEqual("them", self.realiser.realise(self.proTest2).getRealisation())
 
+    # Test that the pronouns the factory keeps for pronominal NPs are not
+    # changed by the features of any one NP
+    def testPronominalisationShared(self):
+        results = []
+        for possessive in [False, True, False]:
+            pro = self.phraseFactory.createNounPhrase("Mary")
+            pro.setFeature(Feature.PRONOMINAL, True)
+            pro.setFeature(LexicalFeature.GENDER, Gender.FEMININE)
+            pro.setFeature(Feature.POSSESSIVE, possessive)
+            results.append(self.realiser.realise(pro).getRealisation())
+        self.assertEqual(["she", "her", "she"], results)
+        self.assertEqual(None, self.phraseFactory.inflectedPronouns["she"].getFeature(Feature.POSSESSIVE))
+
     # Test the pronominalisation method for full NPs (more thorough than above)
     def testPronominalisation2(self):
         # Ehud - added extra pronominalisation tests
@@ -125,5 +125,12 @@ class OrthographyFormatTest(SimpleNLG4Test):
         self.assertEqual("on most Tuesdays, since 1991, except yesterday, I carry a bag", \
             self.realiser.realise(_s1).getRealisation())
 
+    # Spaces before commas and repeated commas are removed once per sentence
+    def testPunctuationNormalisation(self):
+        sentence = self.phraseFactory.createSentence("hello , , world ,,, again")
+        self.assertEqual("Hello, world, again.", self.realiser.realise(sentence).getRealisation())
+        self.assertEqual(",x,y,", self.realiser.orthography.normalisePunctuation("  ,x ,,y , ,"))
+        self.assertEqual("no commas", self.realiser.orthography.normalisePunctuation("no commas"))
+
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
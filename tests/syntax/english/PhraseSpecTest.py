@@ -19,7 +19,7 @@
 # Contributor(s): Ehud Reiter, Albert Gatt, Dave Wewstwater, Roman Kutlak, Margaret Mitchell.
 
 from SimpleNLG4Test          import *
-from simplenlg.features      import Feature, Tense
+from simplenlg.features      import Feature, InternalFeature, NumberAgreement, Tense
 from simplenlg.framework     import InflectedWordElement, NLGElement
 from simplenlg.framework     import PhraseElement, StringElement, WordElement
 from simplenlg.phrasespec    import SPhraseSpec
@@ -61,6 +61,120 @@ class PhraseSpecTest(SimpleNLG4Test):
         self.assertEqual("fortunately the man quickly saw me in the park", \
                 self.realiser.realise(c2).getRealisation())
 
+    # Test that the default VP and complementiser are only created when needed
+    def testLazyClauseDefaults(self):
+        c1 = self.phraseFactory.createClause()
+        self.assertTrue(c1.pendingVerbPhrase)
+        self.assertTrue(c1.pendingComplementiser)
+        # VP features can be read and written without creating the VP
+        self.assertEqual(Tense.PRESENT, c1.getFeature(Feature.TENSE))
+        c1.setFeature(Feature.TENSE, Tense.PAST)
+        self.assertTrue(c1.pendingVerbPhrase)
+        # the VP picks up features that were set on the clause before it existed
+        vp = c1.getVerbPhrase()
+        self.assertFalse(c1.pendingVerbPhrase)
+        self.assertIs(c1, vp.getParent())
+        self.assertEqual(Tense.PAST, vp.getFeature(Feature.TENSE))
+        self.assertEqual(False, vp.getFeature(Feature.PERFECT))
+        # the complementiser is created on first access
+        self.assertEqual("that", c1.getFeatureAsElement(Feature.COMPLEMENTISER).getBaseForm())
+        self.assertFalse(c1.pendingComplementiser)
+        # an explicit VP replaces the default without creating it
+        c2 = self.phraseFactory.createClause("Mary", self.phraseFactory.createVerbPhrase("leave"))
+        self.assertFalse(c2.pendingVerbPhrase)
+        self.assertEqual("Mary leaves", self.realiser.realise(c2).getRealisation())
+        # subordinate clauses still get "that"
+        c3 = self.phraseFactory.createClause("I", "know", c2)
+        self.assertEqual("I know that Mary leaves", self.realiser.realise(c3).getRealisation())
+
+    # Test that the VP features set on a clause reach its VP, and that the
+    # feature set last wins whether it was set on the clause or on the VP
+    def testClauseFeaturesOnVerbPhrase(self):
+        clause = self.phraseFactory.createClause("the dog", "chase", "the cat")
+        vp = clause.getVerbPhrase()
+        for tense in [Tense.FUTURE, Tense.PRESENT, Tense.PAST]:
+            clause.setFeature(Feature.TENSE, tense)
+        self.assertEqual(Tense.PAST, vp.getFeature(Feature.TENSE))
+        vp.setFeature(Feature.TENSE, Tense.FUTURE)
+        clause.setFeature(Feature.NEGATED, True)
+        self.assertEqual(Tense.FUTURE, vp.getFeature(Feature.TENSE))
+        self.assertEqual("the dog will not chase the cat", self.realiser.realise(clause).getRealisation())
+        # the VP reads the clause's values instead of holding copies of them,
+        # and realising the clause doesn't copy them onto it either
+        clause.setFeature(Feature.NUMBER, NumberAgreement.PLURAL)
+        clause.addPostModifier("today")
+        self.assertEqual("the dog will not chase the cat today", self.realiser.realise(clause).getRealisation())
+        self.assertEqual(NumberAgreement.PLURAL, vp.getFeature(Feature.NUMBER))
+        self.assertNotIn(Feature.NEGATED, vp.features)
+        self.assertNotIn(Feature.NUMBER, vp.features)
+        self.assertNotIn(InternalFeature.POSTMODIFIERS, vp.features)
+        clause.removeFeature(InternalFeature.POSTMODIFIERS)
+        # removing a feature from the clause leaves the VP's value
+        clause.setFeature(Feature.PERFECT, True)
+        clause.removeFeature(Feature.PERFECT)
+        self.assertEqual(True, vp.getFeature(Feature.PERFECT))
+        # a new VP keeps its own values for features set on the clause before it
+        newVP = self.phraseFactory.createVerbPhrase("see")
+        clause.setVerbPhrase(newVP)
+        self.assertEqual(Tense.PRESENT, newVP.getFeature(Feature.TENSE))
+        self.assertEqual(Tense.FUTURE, vp.getFeature(Feature.TENSE))
+        clause.setFeature(Feature.TENSE, Tense.PAST)
+        self.assertEqual(Tense.PAST, newVP.getFeature(Feature.TENSE))
+        self.assertEqual(Tense.FUTURE, vp.getFeature(Feature.TENSE))
+        # a VP shared with another clause follows both clauses
+        other = self.phraseFactory.createClause("Mary", newVP)
+        clause.setFeature(Feature.TENSE, Tense.FUTURE)
+        other.setFeature(Feature.PROGRESSIVE, True)
+        self.assertEqual("Mary will be seeing", self.realiser.realise(other).getRealisation())
+
+    # Test that the cached children of a phrase follow changes to the phrase
+    def testChildren(self):
+        np = self.phraseFactory.createNounPhrase("the", "dog")
+        children = np.getChildren()
+        self.assertEqual(["the", "dog"], [self.getBaseForm(child) for child in children])
+        self.assertIs(children, np.getChildren())
+        self.assertEqual(children, list(np.iterChildren()))
+        np.addPreModifier("big")
+        np.addPostModifier("in the garden")
+        self.assertEqual(["the", "big", "dog", "in the garden"], \
+                [self.getBaseForm(child) for child in np.getChildren()])
+        np.setHead("cat")
+        self.assertEqual("cat", self.getBaseForm(np.getChildren()[2]))
+        np.removeFeature(InternalFeature.SPECIFIER)
+        self.assertEqual(["big", "cat", "in the garden"], [self.getBaseForm(child) for child in np.iterChildren()])
+        # the default VP of a clause is created when the children are first asked for
+        clause = self.phraseFactory.createClause("John", "leave")
+        clause.addFrontModifier("yesterday")
+        self.assertEqual(["yesterday", "John", "leave"], [self.getBaseForm(child) for child in clause.iterChildren()])
+        self.assertIs(clause.getVerbPhrase(), clause.getChildren()[2])
+
+    # Test that a clone can be changed and realised without changing the
+    # original, which shares its words copy-on-write
+    def testClone(self):
+        clause = self.phraseFactory.createClause("the dog", "chase", "the cat")
+        clause.addModifier("quickly")
+        clause.setFeature(Feature.TENSE, Tense.PAST)
+        cloned = clause.clone()
+        self.assertIsNot(clause.getVerbPhrase(), cloned.getVerbPhrase())
+        self.assertIs(cloned, cloned.getVerbPhrase().getParent())
+        self.assertIs(clause.getFactory(), cloned.getFactory())
+        verb = cloned.getVerb()
+        self.assertIs(clause.getVerb().features, verb.features)
+        verb.setFeature(Feature.TENSE, Tense.FUTURE)
+        self.assertIsNot(clause.getVerb().features, verb.features)
+        # VP features set on the clone only reach the clone's VP
+        cloned.setFeature(Feature.NEGATED, True)
+        cloned.setObject("the mouse")
+        self.assertEqual("the dog did not quickly chase the mouse", self.realiser.realise(cloned).getRealisation())
+        self.assertEqual("the dog quickly chased the cat", self.realiser.realise(clause).getRealisation())
+        self.assertEqual("the dog quickly chased the cat", self.realiser.realise(clause.clone()).getRealisation())
+        # an element that is in the tree twice is cloned once
+        np = self.phraseFactory.createNounPhrase("the", "dog")
+        coord = self.phraseFactory.createCoordinatedPhrase(np, np)
+        coordClone = coord.clone()
+        self.assertIs(coordClone.getChildren()[0], coordClone.getChildren()[1])
+        self.assertIsNot(np, coordClone.getChildren()[0])
+
     # get string for head of constituent
     @classmethod
     def getBaseForm(cls, constituent):
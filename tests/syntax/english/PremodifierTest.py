@@ -22,7 +22,7 @@ import sys
 import unittest
 sys.path.append('../../..')
 from simplenlg.features         import Feature, Tense
-from simplenlg.framework        import NLGFactory
+from simplenlg.framework        import LexicalCategory, NLGFactory
 from simplenlg.lexicon          import Lexicon
 from simplenlg.phrasespec       import *
 from simplenlg.realiser.english import Realiser
@@ -67,5 +67,20 @@ class PremodifierTest(unittest.TestCase):
         vp2.addPreModifier(self.phraseFactory.createCoordinatedPhrase(adv1, adv2))
         self.assertEqual("slowly and discretely eats", self.realiser.realise(vp2).getRealisation())
 
+    # Test adjective ordering of premodifiers, which must not reorder the
+    # premodifiers of the phrase itself
+    def testAdjectiveOrdering(self):
+        np = self.phraseFactory.createNounPhrase("the", "table")
+        np.addPreModifier(self.phraseFactory.createWord("red", LexicalCategory.ADJECTIVE))
+        np.addPreModifier(self.phraseFactory.createNounPhrase("garden"))
+        np.addPreModifier(self.phraseFactory.createWord("big", LexicalCategory.ADJECTIVE))
+        self.assertEqual("the big, red, garden table", self.realiser.realise(np).getRealisation())
+        self.assertEqual("the big, red, garden table", self.realiser.realise(np).getRealisation())
+        self.assertEqual("red", np.getPreModifiers()[0].getBaseForm())
+        # a modifier that isn't an adjective or a noun stays where it is
+        np.addPreModifier("very old")
+        np.addPreModifier(self.phraseFactory.createWord("small", LexicalCategory.ADJECTIVE))
+        self.assertEqual("the big, red, garden, very old, small table", self.realiser.realise(np).getRealisation())
+
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
@@ -289,5 +289,18 @@ class StringElementTest(unittest.TestCase):
         self.assertEqual("A unicorn is regarded as a beautiful horse-like creature.", \
                             self.realiser.realiseSentence(test4))
 
+    # Test that createNLGElement classifies strings the same way as stringIsWord
+    def testStringClassification(self):
+        for string in ["dog", "she", "the dog", "xyzzy", "is", "E0006419", "big-bad", ""]:
+            element = self.phraseFactory.createNLGElement(string, LexicalCategory.ANY)
+            isWord  = self.phraseFactory.stringIsWord(string, LexicalCategory.ANY)
+            self.assertEqual(isWord, not isinstance(element, StringElement), string)
+        # single word strings give the same lexicon entry as createWord
+        for string in ["dog", "she", "is", "xyzzy"]:
+            self.assertEqual(self.phraseFactory.createWord(string, LexicalCategory.ANY), \
+                             self.phraseFactory.createNLGElement(string))
+        self.assertEqual(LexicalCategory.PRONOUN, \
+                         self.phraseFactory.createNLGElement("she").getCategory())
+
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'
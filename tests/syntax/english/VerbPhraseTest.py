@@ -21,7 +21,8 @@
 from SimpleNLG4Test          import *
 from simplenlg.features      import DiscourseFunction, Feature, Form
 from simplenlg.features      import InternalFeature, NumberAgreement, Person, Tense
-from simplenlg.framework     import CoordinatedPhraseElement, NLGElement, PhraseElement, WordElement
+from simplenlg.framework     import CoordinatedPhraseElement, LexicalCategory, NLGElement
+from simplenlg.framework     import PhraseElement, WordElement
 from simplenlg.phrasespec    import SPhraseSpec, VPPhraseSpec
 
 
@@ -300,5 +301,40 @@ class VerbPhraseTest(SimpleNLG4Test):
                 self.realiser.realise(coord1).getRealisation())
 
 
+    # Test that verb and modifier strings are parsed once per factory, and
+    # that each phrase still gets a word of its own
+    def testParsedStrings(self):
+        vp1 = self.phraseFactory.createVerbPhrase("pick up")
+        vp2 = self.phraseFactory.createVerbPhrase("pick up")
+        self.assertIn(("pick up", LexicalCategory.VERB), self.phraseFactory.parsedStrings)
+        self.assertIsNot(vp1.getVerb(), vp2.getVerb())
+        self.assertEqual("up", vp2.getFeature(Feature.PARTICLE))
+        vp1.getVerb().setFeature(Feature.TENSE, Tense.PAST)
+        self.assertEqual(None, vp2.getVerb().getFeature(Feature.TENSE))
+        vp2.setFeature(Feature.TENSE, Tense.PAST)
+        self.assertEqual("picked up", self.realiser.realise(vp2).getRealisation())
+        # single words go where their category puts them, canned text after the verb
+        for modifier in ["quickly", "quickly", "in the park"]:
+            vp = self.phraseFactory.createVerbPhrase("run")
+            vp.addModifier(modifier)
+            self.assertEqual(1, len(vp.getPreModifiers()) + len(vp.getPostModifiers()))
+            self.assertEqual("runs " + modifier if " " in modifier else modifier + " runs", \
+                    self.realiser.realise(vp).getRealisation())
+        first = self.phraseFactory.createNounPhrase("the", "dog")
+        first.addModifier("big")
+        second = self.phraseFactory.createNounPhrase("the", "cat")
+        second.addModifier("big")
+        first.getPreModifiers()[0].setFeature(Feature.IS_COMPARATIVE, True)
+        self.assertEqual("the bigger dog", self.realiser.realise(first).getRealisation())
+        self.assertEqual("the big cat", self.realiser.realise(second).getRealisation())
+        # a modifier that is a phrase, but not an adverb phrase, goes after the verb
+        clause = self.phraseFactory.createClause("the dog", "run")
+        clause.addModifier(self.phraseFactory.createPrepositionPhrase("in", "the park"))
+        vp = self.phraseFactory.createVerbPhrase("run")
+        vp.addModifier(self.phraseFactory.createPrepositionPhrase("in", "the park"))
+        self.assertEqual("the dog runs in the park", self.realiser.realise(clause).getRealisation())
+        self.assertEqual("runs in the park", self.realiser.realise(vp).getRealisation())
+
+
 if __name__ == '__main__':
     unittest.main()     # runs all methods that start with 'test'